@@ -5,12 +5,129 @@ Provides helper functions for saving settings and logging events.
 """
 
 import sqlite3
+import threading
 from datetime import datetime
 from pathlib import Path
-from typing import Dict
+from typing import Dict, Optional
 
 DB_PATH = "swiftledger.db"
 
+# One long-lived connection per (thread, database file); see get_connection().
+# Pool workers close theirs when a job ends (close_thread_connection()), so
+# only the GUI thread's connection lives for the whole session. Every path
+# seen is remembered so close_all_connections() can checkpoint it at exit.
+_local = threading.local()
+_known_paths = set()
+_known_paths_lock = threading.Lock()
+
+
+def get_connection(db_path: str = DB_PATH) -> sqlite3.Connection:
+    """
+    Return a reusable connection to *db_path* for the calling thread.
+
+    The connection is opened on first use with WAL journaling and a larger
+    page cache, then kept open so query helpers skip the open/close cost on
+    every call. Rows come back as sqlite3.Row. Callers must not close it;
+    worker threads release it with close_thread_connection().
+
+    Args:
+        db_path: Path to the SQLite database file.
+
+    Returns:
+        A sqlite3 Connection owned by the current thread.
+    """
+    connections = getattr(_local, "connections", None)
+    if connections is None:
+        connections = _local.connections = {}
+
+    conn = connections.get(db_path)
+    if conn is None:
+        conn = sqlite3.connect(db_path, cached_statements=256)
+        conn.row_factory = sqlite3.Row
+        conn.execute("PRAGMA journal_mode = WAL;")
+        conn.execute("PRAGMA synchronous = NORMAL;")
+        conn.execute("PRAGMA cache_size = -20000;")
+        connections[db_path] = conn
+        with _known_paths_lock:
+            _known_paths.add(db_path)
+    return conn
+
+
+def close_thread_connection() -> None:
+    """Close every connection get_connection() opened for the calling thread."""
+    connections = getattr(_local, "connections", None)
+    if not connections:
+        return
+    for conn in connections.values():
+        try:
+            conn.close()
+        except sqlite3.Error:
+            pass
+    connections.clear()
+
+
+def close_all_connections(checkpoint: bool = True) -> None:
+    """
+    Close the calling thread's connections and flush the WAL at exit.
+
+    Call once from the GUI thread after the worker pool has drained. The
+    TRUNCATE checkpoint runs on a fresh connection per database and copies
+    committed pages from the -wal file into the database file, so
+    swiftledger.db on its own holds all the data again. Pass
+    checkpoint=False if workers may still be running.
+    """
+    close_thread_connection()
+    _close_version_probes()
+    if not checkpoint:
+        return
+
+    with _known_paths_lock:
+        paths = list(_known_paths)
+    for db_path in paths:
+        try:
+            conn = sqlite3.connect(db_path)
+        except sqlite3.Error:
+            continue
+        try:
+            conn.execute("PRAGMA wal_checkpoint(TRUNCATE);")
+        except sqlite3.Error:
+            pass
+        finally:
+            conn.close()
+
+
+# One read-only connection per database used only to read PRAGMA data_version;
+# since it never writes, its counter moves on every commit made anywhere else.
+_version_probes: Dict[str, sqlite3.Connection] = {}
+_version_probes_lock = threading.Lock()
+
+
+def data_version(db_path: str = DB_PATH) -> int:
+    """
+    Return a counter that changes whenever anything is committed to *db_path*.
+
+    The value comes from a dedicated connection shared by all threads, so it is
+    comparable across threads (unlike the per-connection counters of
+    get_connection()).
+    """
+    with _version_probes_lock:
+        conn = _version_probes.get(db_path)
+        if conn is None:
+            conn = sqlite3.connect(db_path, check_same_thread=False)
+            _version_probes[db_path] = conn
+        return conn.execute("PRAGMA data_version;").fetchone()[0]
+
+
+def _close_version_probes() -> None:
+    with _version_probes_lock:
+        probes = list(_version_probes.values())
+        _version_probes.clear()
+    for conn in probes:
+        try:
+            conn.close()
+        except sqlite3.Error:
+            pass
+
 
 def init_db(db_path: str = DB_PATH) -> sqlite3.Connection:
     """
@@ -97,6 +214,15 @@ def init_db(db_path: str = DB_PATH) -> sqlite3.Connection:
         cursor.execute(
             "CREATE UNIQUE INDEX IF NOT EXISTS idx_members_staff_number ON members(staff_number);"
         )
+        cursor.execute(
+            "CREATE INDEX IF NOT EXISTS idx_members_full_name "
+            "ON members(full_name COLLATE NOCASE);"
+        )
+        # Case-insensitive LIKE 'prefix%' can only use a NOCASE index
+        cursor.execute(
+            "CREATE INDEX IF NOT EXISTS idx_members_staff_nocase "
+            "ON members(staff_number COLLATE NOCASE);"
+        )
         cursor.execute("RELEASE members_migration;")
     except sqlite3.DatabaseError:
         cursor.execute("ROLLBACK TO members_migration;")
@@ -203,6 +329,12 @@ def init_db(db_path: str = DB_PATH) -> sqlite3.Connection:
 
     cursor.execute("UPDATE loans SET due_date = date_issued WHERE due_date IS NULL;")
 
+    # Per-member loan lookups seek on member_id (loan_id rides along as rowid)
+    cursor.execute("CREATE INDEX IF NOT EXISTS idx_loans_member_id ON loans(member_id);")
+    cursor.execute(
+        "CREATE INDEX IF NOT EXISTS idx_loans_member_status ON loans(member_id, status);"
+    )
+
     conn.commit()
     return conn
 
@@ -210,7 +342,11 @@ def init_db(db_path: str = DB_PATH) -> sqlite3.Connection:
 # ── Helper functions ─────────────────────────────────────────────────
 
 
-def save_settings(data_dict: Dict[str, object], db_path: str = DB_PATH) -> None:
+def save_settings(
+    data_dict: Dict[str, object],
+    db_path: str = DB_PATH,
+    conn: Optional[sqlite3.Connection] = None,
+) -> None:
     """
     Insert or update a row in the system_settings table.
 
@@ -221,6 +357,8 @@ def save_settings(data_dict: Dict[str, object], db_path: str = DB_PATH) -> None:
     Args:
         data_dict: A dictionary whose keys correspond to system_settings columns.
         db_path:   Path to the SQLite database file.
+        conn:      Optional open connection to write through instead; the
+                   caller then owns the commit and close.
     """
     valid_columns = {
         "society_name", "street", "city_state", "phone", "email",
@@ -234,7 +372,9 @@ def save_settings(data_dict: Dict[str, object], db_path: str = DB_PATH) -> None:
     if not filtered:
         return
 
-    conn = sqlite3.connect(db_path)
+    owns_conn = conn is None
+    if owns_conn:
+        conn = sqlite3.connect(db_path)
     cursor = conn.cursor()
 
     # Check whether a settings row already exists
@@ -255,8 +395,9 @@ def save_settings(data_dict: Dict[str, object], db_path: str = DB_PATH) -> None:
             list(filtered.values()),
         )
 
-    conn.commit()
-    conn.close()
+    if owns_conn:
+        conn.commit()
+        conn.close()
 
 
 def log_event(
@@ -265,6 +406,7 @@ def log_event(
     description: str,
     status: str,
     db_path: str = DB_PATH,
+    conn: Optional[sqlite3.Connection] = None,
 ) -> None:
     """
     Insert a new audit-log entry into the audit_logs table.
@@ -275,8 +417,12 @@ def log_event(
         description: Human-readable description of the event.
         status:      Outcome status (e.g. 'SUCCESS', 'FAILURE').
         db_path:     Path to the SQLite database file.
+        conn:        Optional open connection to write through instead; the
+                     caller then owns the commit and close.
     """
-    conn = sqlite3.connect(db_path)
+    owns_conn = conn is None
+    if owns_conn:
+        conn = sqlite3.connect(db_path)
     cursor = conn.cursor()
 
     cursor.execute(
@@ -287,8 +433,9 @@ def log_event(
         (datetime.now().isoformat(), user, category, description, status),
     )
 
-    conn.commit()
-    conn.close()
+    if owns_conn:
+        conn.commit()
+        conn.close()
 
 
 if __name__ == "__main__":
@@ -3,11 +3,133 @@ Database query operations for SwiftLedger.
 Handles CRUD operations for members, savings, loans, and repayment schedules.
 """
 
+import re
 import sqlite3
+import threading
+import time
+from collections import OrderedDict
 from datetime import date, timedelta
-from typing import Dict, List, Tuple, Optional
+from typing import Any, Callable, Dict, List, Tuple, Optional
 
-from database.db_init import log_event
+from database.db_init import data_version, get_connection, log_event
+
+
+# Hot read statements, kept as constants so every call passes the identical
+# SQL text and the persistent connection's statement cache stays warm.
+_MEMBER_COLUMNS = (
+    "member_id, staff_number, full_name, phone, bank_name, account_no, "
+    "department, date_joined, avatar_path, current_savings, total_loans"
+)
+
+_SQL_MEMBER_BY_ID = f"SELECT {_MEMBER_COLUMNS} FROM members WHERE member_id = ?"
+
+_SQL_MEMBER_BY_STAFF = f"SELECT {_MEMBER_COLUMNS} FROM members WHERE staff_number = ?"
+
+_SQL_TOTAL_SAVINGS = """
+    SELECT COALESCE(SUM(
+        CASE
+            WHEN trans_type IN ('Lodgment', 'Opening Balance') THEN amount
+            WHEN trans_type = 'Deduction' THEN -amount
+            ELSE 0
+        END
+    ), 0.0)
+    FROM savings_transactions
+    WHERE member_id = ?
+"""
+
+_SQL_MEMBER_LOANS = """
+    SELECT loan_id, principal, interest_rate, status, date_issued
+    FROM loans
+    WHERE member_id = ?
+    ORDER BY loan_id DESC
+    LIMIT ? OFFSET ?
+"""
+
+_SQL_MEMBER_SAVINGS = """
+    SELECT id, trans_date, trans_type, amount, running_balance, payment_mode
+    FROM savings_transactions
+    WHERE member_id = ?
+    ORDER BY id DESC
+    LIMIT 10
+"""
+
+# Only the fields the members table shows, plus the loan counts it tints by
+_SQL_MEMBERS_SUMMARY = """
+    SELECT
+        m.member_id, m.staff_number, m.full_name, m.phone,
+        (
+            SELECT COALESCE(SUM(
+                CASE
+                    WHEN st.trans_type IN ('Lodgment', 'Opening Balance') THEN st.amount
+                    WHEN st.trans_type = 'Deduction' THEN -st.amount
+                    ELSE 0
+                END
+            ), 0)
+            FROM savings_transactions st
+            WHERE st.member_id = m.member_id
+        ) AS current_savings,
+        m.total_loans,
+        (SELECT COUNT(1) FROM loans l WHERE l.member_id = m.member_id AND l.status = 'Default')
+            AS default_loan_count,
+        (SELECT COUNT(1) FROM loans l WHERE l.member_id = m.member_id AND l.status = 'Active')
+            AS active_loan_count
+    FROM members m
+"""
+
+
+# Terms mixing letters and digits (e.g. "EMP00") are treated as staff-number prefixes
+_STAFF_PREFIX_RE = re.compile(r"^(?=.*[A-Za-z])(?=.*\d)[A-Za-z0-9/-]+$")
+
+
+# Results of recent read helpers: key -> (stored_at, db_token, result), least
+# recently used first. Per-member and per-page keys would otherwise pile up,
+# so the oldest entries are evicted past _RESULT_CACHE_SIZE. Worker threads
+# share it, hence the lock.
+_RESULT_CACHE: "OrderedDict[Tuple, Tuple[float, int, Any]]" = OrderedDict()
+_RESULT_CACHE_SIZE = 64
+_RESULT_CACHE_LOCK = threading.Lock()
+
+
+def _db_token(db_path: str) -> int:
+    """Return a token that changes whenever anything is committed to *db_path*."""
+    # Read from one shared probe connection, so a result cached by one worker
+    # thread is still valid for the next thread that asks for it
+    return data_version(db_path)
+
+
+def cached_call(
+    fn: Callable[..., Any],
+    db_path: str,
+    *args: Any,
+    ttl: float = 15.0,
+    force: bool = False,
+) -> Any:
+    """
+    Call ``fn(db_path, *args)``, reusing a result younger than *ttl* seconds.
+
+    A cached result is discarded as soon as the database changes, so callers
+    never see figures that predate a write. Failed (False, ...) results are
+    not cached. Pass force=True to bypass the cache.
+    """
+    key = (fn.__module__, fn.__qualname__, db_path, args)
+    token = _db_token(db_path)
+    now = time.monotonic()
+
+    if not force:
+        with _RESULT_CACHE_LOCK:
+            entry = _RESULT_CACHE.get(key)
+            if entry is not None and now - entry[0] < ttl and entry[1] == token:
+                _RESULT_CACHE.move_to_end(key)
+                return entry[2]
+
+    result = fn(db_path, *args)
+    if not (isinstance(result, tuple) and result and result[0] is False):
+        with _RESULT_CACHE_LOCK:
+            _RESULT_CACHE[key] = (now, token, result)
+            _RESULT_CACHE.move_to_end(key)
+            while len(_RESULT_CACHE) > _RESULT_CACHE_SIZE:
+                _RESULT_CACHE.popitem(last=False)
+    return result
 
 
 def _safe_log_event(user: str, category: str, description: str, status: str, db_path: str) -> None:
@@ -17,6 +139,63 @@ def _safe_log_event(user: str, category: str, description: str, status: str, db_
         pass
 
 
+# Member registration statements, shared by add_member and add_members_bulk
+_SQL_INSERT_MEMBER = """
+    INSERT INTO members (
+        staff_number, full_name, phone, bank_name, account_no, department, date_joined,
+        current_savings, total_loans
+    )
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
+
+_SQL_INSERT_OPENING_SAVINGS = """
+    INSERT INTO savings_transactions (
+        member_id, trans_date, trans_type, amount, running_balance, payment_mode
+    )
+    VALUES (?, ?, 'Opening Balance', ?, ?, 'Salary Deduction')
+"""
+
+_SQL_INSERT_OPENING_LOAN = """
+    INSERT INTO loans (member_id, principal, interest_rate, duration_months, status, due_date, date_issued)
+    VALUES (?, ?, ?, ?, 'Active', ?, ?)
+"""
+
+
+def _member_values(member_data: Dict) -> Tuple:
+    """
+    Resolve defaults for one registration.
+
+    Returns the nine _SQL_INSERT_MEMBER parameters followed by the opening
+    balance transaction date.
+    """
+    date_joined = member_data.get('date_joined') or date.today().isoformat()
+    return (
+        member_data['staff_number'],
+        member_data['full_name'],
+        member_data.get('phone') or '+234',
+        member_data.get('bank_name') or 'UBA',
+        member_data.get('account_no') or '',
+        member_data.get('department') or 'SLT',
+        date_joined,
+        float(member_data.get('current_savings', 0.0) or 0.0),
+        float(member_data.get('total_loans', 0.0) or 0.0),
+        member_data.get('trans_date') or date_joined,
+    )
+
+
+def _opening_loan_terms(db_path: str) -> Tuple[float, int, str]:
+    """Return (interest_rate, duration_months, due_date) for an opening loan balance."""
+    settings_ok, settings = get_system_settings(db_path)
+    interest_rate = 12.0
+    duration_months = 24
+    if settings_ok and settings:
+        interest_rate = float(settings.get('default_interest_rate', interest_rate))
+        duration_months = int(settings.get('default_duration', duration_months))
+
+    due_date = (date.today() + timedelta(days=30 * duration_months)).isoformat()
+    return interest_rate, duration_months, due_date
+
+
 def add_member(db_path: str, member_data: Dict[str, str]) -> Tuple[bool, str]:
     """
     Add a new member to the members table.
@@ -51,77 +230,28 @@ def add_member(db_path: str, member_data: Dict[str, str]) -> Tuple[bool, str]:
 
     conn = None
     try:
-        conn = sqlite3.connect(db_path)
+        conn = get_connection(db_path)
         cursor = conn.cursor()
 
         cursor.execute("PRAGMA foreign_keys = ON;")
         conn.execute("BEGIN;")
 
-        opening_savings = float(member_data.get('current_savings', 0.0) or 0.0)
-        opening_loans = float(member_data.get('total_loans', 0.0) or 0.0)
-        date_joined = member_data.get('date_joined') or date.today().isoformat()
-        trans_date = member_data.get('trans_date') or date_joined
-        phone = member_data.get('phone') or '+234'
-        bank_name = member_data.get('bank_name') or 'UBA'
-        account_no = member_data.get('account_no') or ''
-        department = member_data.get('department') or 'SLT'
-
-        cursor.execute(
-            """
-            INSERT INTO members (
-                staff_number, full_name, phone, bank_name, account_no, department, date_joined,
-                current_savings, total_loans
-            )
-            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
-            """,
-            (
-                member_data['staff_number'],
-                member_data['full_name'],
-                phone,
-                bank_name,
-                account_no,
-                department,
-                date_joined,
-                opening_savings,
-                opening_loans,
-            ),
-        )
-
+        values = _member_values(member_data)
+        cursor.execute(_SQL_INSERT_MEMBER, values[:9])
         member_id = cursor.lastrowid
 
+        opening_savings, opening_loans, trans_date = values[7], values[8], values[9]
         if opening_savings > 0:
             cursor.execute(
-                """
-                INSERT INTO savings_transactions (
-                    member_id, trans_date, trans_type, amount, running_balance, payment_mode
-                )
-                VALUES (?, ?, ?, ?, ?, ?)
-                """,
-                (
-                    member_id,
-                    trans_date,
-                    'Opening Balance',
-                    opening_savings,
-                    opening_savings,
-                    'Salary Deduction',
-                ),
+                _SQL_INSERT_OPENING_SAVINGS,
+                (member_id, trans_date, opening_savings, opening_savings),
             )
 
         if opening_loans > 0:
-            settings_ok, settings = get_system_settings(db_path)
-            interest_rate = 12.0
-            duration_months = 24
-            if settings_ok and settings:
-                interest_rate = float(settings.get('default_interest_rate', interest_rate))
-                duration_months = int(settings.get('default_duration', duration_months))
-
-            due_date = (date.today() + timedelta(days=30 * duration_months)).isoformat()
+            interest_rate, duration_months, due_date = _opening_loan_terms(db_path)
             cursor.execute(
-                """
-                INSERT INTO loans (member_id, principal, interest_rate, duration_months, status, due_date, date_issued)
-                VALUES (?, ?, ?, ?, ?, ?, ?)
-                """,
-                (member_id, opening_loans, interest_rate, duration_months, 'Active', due_date, trans_date),
+                _SQL_INSERT_OPENING_LOAN,
+                (member_id, opening_loans, interest_rate, duration_months, due_date, trans_date),
             )
 
         conn.commit()
@@ -163,9 +293,95 @@ def add_member(db_path: str, member_data: Dict[str, str]) -> Tuple[bool, str]:
         )
         return False, f"Unexpected error: {str(e)}"
 
-    finally:
+
+def add_members_bulk(db_path: str, members: List[Dict]) -> Tuple[bool, str]:
+    """
+    Add many members in one transaction.
+
+    Each dict takes the same keys as add_member. Members, opening savings
+    and opening loans are each written with a single executemany, so either
+    every member is added or none is.
+
+    Returns:
+        A tuple (success: bool, message: str)
+    """
+    if not members:
+        return True, "No members to add."
+
+    conn = None
+    try:
+        conn = get_connection(db_path)
+        cursor = conn.cursor()
+
+        cursor.execute("PRAGMA foreign_keys = ON;")
+        conn.execute("BEGIN;")
+
+        # AUTOINCREMENT ids only grow, so every new member_id is above this
+        last_id = cursor.execute("SELECT COALESCE(MAX(member_id), 0) FROM members").fetchone()[0]
+
+        values = [_member_values(member_data) for member_data in members]
+        cursor.executemany(_SQL_INSERT_MEMBER, [row[:9] for row in values])
+
+        new_ids = dict(
+            cursor.execute(
+                "SELECT staff_number, member_id FROM members WHERE member_id > ?", (last_id,)
+            ).fetchall()
+        )
+
+        cursor.executemany(
+            _SQL_INSERT_OPENING_SAVINGS,
+            [
+                (new_ids[row[0]], row[9], row[7], row[7])
+                for row in values if row[7] > 0
+            ],
+        )
+
+        loan_rows = [row for row in values if row[8] > 0]
+        if loan_rows:
+            interest_rate, duration_months, due_date = _opening_loan_terms(db_path)
+            cursor.executemany(
+                _SQL_INSERT_OPENING_LOAN,
+                [
+                    (new_ids[row[0]], row[8], interest_rate, duration_months, due_date, row[9])
+                    for row in loan_rows
+                ],
+            )
+
+        conn.commit()
+
+        _safe_log_event(
+            user="Admin",
+            category="Members",
+            description=f"Bulk registration: {len(values)} members added",
+            status="Success",
+            db_path=db_path,
+        )
+
+        return True, f"{len(values)} members added successfully."
+
+    except sqlite3.DatabaseError as e:
+        if conn:
+            conn.rollback()
+        _safe_log_event(
+            user="Admin",
+            category="Members",
+            description=f"Bulk registration failed (database error: {str(e)})",
+            status="Failed",
+            db_path=db_path,
+        )
+        return False, f"Database error: {str(e)}"
+
+    except Exception as e:
         if conn:
-            conn.close()
+            conn.rollback()
+        _safe_log_event(
+            user="Admin",
+            category="Members",
+            description=f"Bulk registration failed (unexpected error: {str(e)})",
+            status="Failed",
+            db_path=db_path,
+        )
+        return False, f"Unexpected error: {str(e)}"
 
 
 def get_all_members(db_path: str) -> Tuple[bool, List[Dict]]:
@@ -183,8 +399,7 @@ def get_all_members(db_path: str) -> Tuple[bool, List[Dict]]:
     """
     conn = None
     try:
-        conn = sqlite3.connect(db_path)
-        conn.row_factory = sqlite3.Row
+        conn = get_connection(db_path)
         cursor = conn.cursor()
 
         cursor.execute(
@@ -224,9 +439,116 @@ def get_all_members(db_path: str) -> Tuple[bool, List[Dict]]:
     except Exception:
         return False, []
 
-    finally:
-        if conn:
-            conn.close()
+
+def get_members_summary(
+    db_path: str, limit: Optional[int] = None, offset: int = 0
+) -> Tuple[bool, List[Dict]]:
+    """
+    Retrieve the members table listing without the profile-only columns.
+
+    Args:
+        db_path: Path to the SQLite database file.
+        limit: Maximum number of members to return (None for all).
+        offset: Number of members to skip, newest first.
+
+    Returns:
+        A tuple (success: bool, members: List[Dict])
+        Each member dict contains: member_id, staff_number, full_name, phone,
+        current_savings, total_loans, default_loan_count, active_loan_count
+    """
+    try:
+        conn = get_connection(db_path)
+        rows = conn.execute(
+            _SQL_MEMBERS_SUMMARY + " ORDER BY m.member_id DESC LIMIT ? OFFSET ?",
+            (-1 if limit is None else limit, offset),
+        ).fetchall()
+        return True, [dict(row) for row in rows]
+
+    except sqlite3.DatabaseError:
+        return False, []
+
+    except Exception:
+        return False, []
+
+
+def get_member_summary_by_staff_number(
+    db_path: str, staff_number: str
+) -> Tuple[bool, Optional[Dict]]:
+    """
+    Retrieve one member's listing row, with the same columns as get_members_summary.
+
+    Returns:
+        A tuple (success: bool, member: Dict or None)
+    """
+    try:
+        conn = get_connection(db_path)
+        row = conn.execute(
+            _SQL_MEMBERS_SUMMARY + " WHERE m.staff_number = ?",
+            (staff_number,),
+        ).fetchone()
+        return True, dict(row) if row else None
+
+    except sqlite3.DatabaseError:
+        return False, None
+
+    except Exception:
+        return False, None
+
+
+def search_members(db_path: str, term: str, limit: int = 200) -> Tuple[bool, List[Dict]]:
+    """
+    Search members by staff number, full name or phone (case-insensitive substring).
+
+    Staff-number-like terms are also tried as a prefix, which SQLite answers
+    from the NOCASE staff_number index; those hits are listed first and the
+    substring matches fill the rest, so the result set is the same either way.
+
+    Args:
+        db_path: Path to the SQLite database file.
+        term: Text to look for; LIKE wildcards in it are matched literally.
+        limit: Maximum number of rows to return.
+
+    Returns:
+        A tuple (success: bool, members: List[Dict]) shaped like get_members_summary.
+    """
+    escaped = term.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+    pattern = f"%{escaped}%"
+    try:
+        conn = get_connection(db_path)
+        members: List[Dict] = []
+        seen = set()
+        if _STAFF_PREFIX_RE.match(term):
+            # No wildcards or escapes in the term, so LIKE can use the index
+            for row in conn.execute(
+                _SQL_MEMBERS_SUMMARY
+                + " WHERE m.staff_number LIKE ? ORDER BY m.member_id DESC LIMIT ?",
+                (term + "%", limit),
+            ):
+                members.append(dict(row))
+                seen.add(row["member_id"])
+            if len(members) >= limit:
+                return True, members
+
+        # Prefix hits are substring hits too; add the rest after them
+        for row in conn.execute(
+            _SQL_MEMBERS_SUMMARY
+            + " WHERE m.full_name LIKE ? ESCAPE '\\'"
+            " OR m.staff_number LIKE ? ESCAPE '\\'"
+            " OR m.phone LIKE ? ESCAPE '\\'"
+            " ORDER BY m.member_id DESC LIMIT ?",
+            (pattern, pattern, pattern, limit),
+        ):
+            if row["member_id"] not in seen:
+                members.append(dict(row))
+                if len(members) >= limit:
+                    break
+        return True, members
+
+    except sqlite3.DatabaseError:
+        return False, []
+
+    except Exception:
+        return False, []
 
 
 def delete_member(db_path: str, member_id: int) -> Tuple[bool, str]:
@@ -238,7 +560,7 @@ def delete_member(db_path: str, member_id: int) -> Tuple[bool, str]:
     """
     conn = None
     try:
-        conn = sqlite3.connect(db_path)
+        conn = get_connection(db_path)
         cursor = conn.cursor()
         cursor.execute("PRAGMA foreign_keys = ON;")
 
@@ -280,9 +602,6 @@ def delete_member(db_path: str, member_id: int) -> Tuple[bool, str]:
                         f"Member deletion failed for ID {member_id} (error: {e})",
                         "Failed", db_path)
         return False, f"Unexpected error: {e}"
-    finally:
-        if conn:
-            conn.close()
 
 
 def get_total_savings(db_path: str, member_id: int) -> Tuple[bool, float]:
@@ -293,20 +612,10 @@ def get_total_savings(db_path: str, member_id: int) -> Tuple[bool, float]:
     """
     conn = None
     try:
-        conn = sqlite3.connect(db_path)
+        conn = get_connection(db_path)
         cursor = conn.cursor()
         cursor.execute(
-            """
-            SELECT COALESCE(SUM(
-                CASE
-                    WHEN trans_type IN ('Lodgment', 'Opening Balance') THEN amount
-                    WHEN trans_type = 'Deduction' THEN -amount
-                    ELSE 0
-                END
-            ), 0.0)
-            FROM savings_transactions
-            WHERE member_id = ?
-            """,
+            _SQL_TOTAL_SAVINGS,
             (member_id,),
         )
         row = cursor.fetchone()
@@ -318,10 +627,6 @@ def get_total_savings(db_path: str, member_id: int) -> Tuple[bool, float]:
     except Exception:
         return False, 0.0
 
-    finally:
-        if conn:
-            conn.close()
-
 
 def get_system_settings(db_path: str) -> Tuple[bool, Optional[Dict]]:
     """
@@ -341,8 +646,7 @@ def get_system_settings(db_path: str) -> Tuple[bool, Optional[Dict]]:
 
     conn = None
     try:
-        conn = sqlite3.connect(db_path)
-        conn.row_factory = sqlite3.Row
+        conn = get_connection(db_path)
         cursor = conn.cursor()
         cursor.execute("SELECT * FROM system_settings ORDER BY id DESC LIMIT 1")
         row = cursor.fetchone()
@@ -358,9 +662,6 @@ def get_system_settings(db_path: str) -> Tuple[bool, Optional[Dict]]:
         return True, defaults
     except Exception:
         return True, defaults
-    finally:
-        if conn:
-            conn.close()
 
 
 def calculate_repayment_schedule(principal: float, annual_rate: float, duration_months: int = 24) -> List[Dict]:
@@ -515,7 +816,7 @@ def apply_for_loan(
 
     conn = None
     try:
-        conn = sqlite3.connect(db_path)
+        conn = get_connection(db_path)
         cursor = conn.cursor()
         cursor.execute("PRAGMA foreign_keys = ON;")
 
@@ -587,29 +888,27 @@ def apply_for_loan(
         )
         return False, f"Unexpected error: {e}"
 
-    finally:
-        if conn:
-            conn.close()
-
 
-def get_member_loans(db_path: str, member_id: int) -> Tuple[bool, List[Dict]]:
+def get_member_loans(
+    db_path: str,
+    member_id: int,
+    limit: Optional[int] = None,
+    offset: int = 0,
+) -> Tuple[bool, List[Dict]]:
     """
-    Retrieve active loans for a member.
+    Retrieve active loans for a member, newest first.
+
+    Pass *limit* / *offset* to fetch one page at a time; a page shorter than
+    *limit* means there are no more rows. With no limit every loan is returned.
     """
     conn = None
     try:
-        conn = sqlite3.connect(db_path)
-        conn.row_factory = sqlite3.Row
+        conn = get_connection(db_path)
         cursor = conn.cursor()
 
         cursor.execute(
-            """
-            SELECT loan_id, principal, interest_rate, status, date_issued
-            FROM loans
-            WHERE member_id = ?
-            ORDER BY loan_id DESC
-            """,
-            (member_id,),
+            _SQL_MEMBER_LOANS,
+            (member_id, -1 if limit is None else limit, offset),
         )
 
         rows = cursor.fetchall()
@@ -619,9 +918,6 @@ def get_member_loans(db_path: str, member_id: int) -> Tuple[bool, List[Dict]]:
         return False, []
     except Exception:
         return False, []
-    finally:
-        if conn:
-            conn.close()
 
 
 def check_overdue_loans(db_path: str) -> Tuple[bool, List[Dict]]:
@@ -630,8 +926,7 @@ def check_overdue_loans(db_path: str) -> Tuple[bool, List[Dict]]:
     """
     conn = None
     try:
-        conn = sqlite3.connect(db_path)
-        conn.row_factory = sqlite3.Row
+        conn = get_connection(db_path)
         cursor = conn.cursor()
 
         cursor.execute(
@@ -654,9 +949,6 @@ def check_overdue_loans(db_path: str) -> Tuple[bool, List[Dict]]:
         return False, []
     except Exception:
         return False, []
-    finally:
-        if conn:
-            conn.close()
 
 
 
@@ -673,17 +965,11 @@ def get_member_by_id(db_path: str, member_id: int) -> Tuple[bool, Optional[Dict]
     """
     conn = None
     try:
-        conn = sqlite3.connect(db_path)
-        conn.row_factory = sqlite3.Row
+        conn = get_connection(db_path)
         cursor = conn.cursor()
         
         cursor.execute(
-            """
-                     SELECT member_id, staff_number, full_name, phone, bank_name, account_no,
-                         department, date_joined, avatar_path, current_savings, total_loans
-            FROM members
-            WHERE member_id = ?
-            """,
+            _SQL_MEMBER_BY_ID,
             (member_id,),
         )
         
@@ -696,10 +982,6 @@ def get_member_by_id(db_path: str, member_id: int) -> Tuple[bool, Optional[Dict]
     
     except Exception as e:
         return False, None
-    
-    finally:
-        if conn:
-            conn.close()
 
 
 def get_member_by_staff_number(db_path: str, staff_number: str) -> Tuple[bool, Optional[Dict]]:
@@ -715,17 +997,11 @@ def get_member_by_staff_number(db_path: str, staff_number: str) -> Tuple[bool, O
     """
     conn = None
     try:
-        conn = sqlite3.connect(db_path)
-        conn.row_factory = sqlite3.Row
+        conn = get_connection(db_path)
         cursor = conn.cursor()
 
         cursor.execute(
-            """
-                     SELECT member_id, staff_number, full_name, phone, bank_name, account_no,
-                         department, date_joined, avatar_path, current_savings, total_loans
-            FROM members
-            WHERE staff_number = ?
-            """,
+            _SQL_MEMBER_BY_STAFF,
             (staff_number,),
         )
 
@@ -738,9 +1014,58 @@ def get_member_by_staff_number(db_path: str, staff_number: str) -> Tuple[bool, O
     except Exception:
         return False, None
 
-    finally:
-        if conn:
-            conn.close()
+
+def get_member_dashboard(
+    db_path: str,
+    staff_number: str,
+    loan_limit: Optional[int] = None,
+) -> Tuple[bool, Optional[Dict]]:
+    """
+    Retrieve a member, their savings balance and their loans in one round-trip.
+
+    Combines get_member_by_staff_number, get_total_savings and
+    get_member_loans on a single connection for the loans page lookup.
+
+    Args:
+        db_path: Path to the SQLite database file.
+        staff_number: The member's staff number.
+        loan_limit: Maximum number of loans to return (None for all).
+
+    Returns:
+        A tuple (success: bool, result: Optional[Dict]) where result has the
+        keys 'member', 'total_savings' and 'loans'.
+    """
+    conn = None
+    try:
+        conn = get_connection(db_path)
+        cursor = conn.cursor()
+
+        cursor.execute(
+            _SQL_MEMBER_BY_STAFF,
+            (staff_number,),
+        )
+        row = cursor.fetchone()
+        if not row:
+            return False, None
+        member = dict(row)
+
+        cursor.execute(
+            _SQL_TOTAL_SAVINGS,
+            (member['member_id'],),
+        )
+        total_row = cursor.fetchone()
+        total = float(total_row[0]) if total_row and total_row[0] is not None else 0.0
+
+        cursor.execute(
+            _SQL_MEMBER_LOANS,
+            (member['member_id'], -1 if loan_limit is None else loan_limit, 0),
+        )
+        loans = [dict(r) for r in cursor.fetchall()]
+
+        return True, {'member': member, 'total_savings': total, 'loans': loans}
+
+    except Exception:
+        return False, None
 
 
 def update_member_profile(db_path: str, member_id: int, updates: Dict[str, str]) -> Tuple[bool, str]:
@@ -762,7 +1087,7 @@ def update_member_profile(db_path: str, member_id: int, updates: Dict[str, str])
 
     conn = None
     try:
-        conn = sqlite3.connect(db_path)
+        conn = get_connection(db_path)
         cursor = conn.cursor()
         cursor.execute("PRAGMA foreign_keys = ON;")
 
@@ -795,9 +1120,6 @@ def update_member_profile(db_path: str, member_id: int, updates: Dict[str, str])
         if conn:
             conn.rollback()
         return False, f"Unexpected error: {str(e)}"
-    finally:
-        if conn:
-            conn.close()
 
 
 def add_saving(
@@ -873,7 +1195,7 @@ def add_saving(
 
     conn = None
     try:
-        conn = sqlite3.connect(db_path)
+        conn = get_connection(db_path)
         cursor = conn.cursor()
 
         cursor.execute(
@@ -976,10 +1298,6 @@ def add_saving(
         )
         return False, f"Unexpected error: {str(e)}"
 
-    finally:
-        if conn:
-            conn.close()
-
 
 def get_member_savings(db_path: str, member_id: int) -> Tuple[bool, List[Dict]]:
     """
@@ -987,18 +1305,11 @@ def get_member_savings(db_path: str, member_id: int) -> Tuple[bool, List[Dict]]:
     """
     conn = None
     try:
-        conn = sqlite3.connect(db_path)
-        conn.row_factory = sqlite3.Row
+        conn = get_connection(db_path)
         cursor = conn.cursor()
 
         cursor.execute(
-            """
-            SELECT id, trans_date, trans_type, amount, running_balance, payment_mode
-            FROM savings_transactions
-            WHERE member_id = ?
-            ORDER BY id DESC
-            LIMIT 10
-            """,
+            _SQL_MEMBER_SAVINGS,
             (member_id,),
         )
 
@@ -1009,9 +1320,6 @@ def get_member_savings(db_path: str, member_id: int) -> Tuple[bool, List[Dict]]:
         return False, []
     except Exception:
         return False, []
-    finally:
-        if conn:
-            conn.close()
 
 
 def get_society_stats(db_path: str) -> Tuple[bool, Dict]:
@@ -1034,7 +1342,7 @@ def get_society_stats(db_path: str) -> Tuple[bool, Dict]:
     """
     conn = None
     try:
-        conn = sqlite3.connect(db_path)
+        conn = get_connection(db_path)
         cursor = conn.cursor()
         cursor.execute("PRAGMA foreign_keys = ON;")
         
@@ -1081,10 +1389,6 @@ def get_society_stats(db_path: str) -> Tuple[bool, Dict]:
     
     except Exception as e:
         return False, {}
-    
-    finally:
-        if conn:
-            conn.close()
 
 
 def get_all_logs(db_path: str) -> Tuple[bool, List[Dict]]:
@@ -1093,8 +1397,7 @@ def get_all_logs(db_path: str) -> Tuple[bool, List[Dict]]:
     """
     conn = None
     try:
-        conn = sqlite3.connect(db_path)
-        conn.row_factory = sqlite3.Row
+        conn = get_connection(db_path)
         cursor = conn.cursor()
 
         cursor.execute(
@@ -1112,9 +1415,6 @@ def get_all_logs(db_path: str) -> Tuple[bool, List[Dict]]:
         return False, []
     except Exception:
         return False, []
-    finally:
-        if conn:
-            conn.close()
 
 
 if __name__ == "__main__":
@@ -9,6 +9,8 @@ from datetime import date, timedelta
 from typing import Dict, List, Tuple
 from collections import defaultdict
 
+from database.db_init import get_connection
+
 
 def get_monthly_snapshot(db_path: str, year: int, month: int) -> Tuple[bool, Dict]:
     """
@@ -27,7 +29,7 @@ def get_monthly_snapshot(db_path: str, year: int, month: int) -> Tuple[bool, Dic
     """
     conn = None
     try:
-        conn = sqlite3.connect(db_path)
+        conn = get_connection(db_path)
         cursor = conn.cursor()
 
         # Beginning and end of month
@@ -87,9 +89,6 @@ def get_monthly_snapshot(db_path: str, year: int, month: int) -> Tuple[bool, Dic
         return False, {}
     except Exception:
         return False, {}
-    finally:
-        if conn:
-            conn.close()
 
 
 def get_monthly_trend(db_path: str, months: int = 12) -> Tuple[bool, Dict]:
@@ -108,7 +107,7 @@ def get_monthly_trend(db_path: str, months: int = 12) -> Tuple[bool, Dict]:
     """
     conn = None
     try:
-        conn = sqlite3.connect(db_path)
+        conn = get_connection(db_path)
         cursor = conn.cursor()
 
         # Retrieve historical snapshots
@@ -162,9 +161,6 @@ def get_monthly_trend(db_path: str, months: int = 12) -> Tuple[bool, Dict]:
         return False, {}
     except Exception:
         return False, {}
-    finally:
-        if conn:
-            conn.close()
 
 
 def calculate_lts_ratio(db_path: str) -> Tuple[bool, float]:
@@ -178,7 +174,7 @@ def calculate_lts_ratio(db_path: str) -> Tuple[bool, float]:
     """
     conn = None
     try:
-        conn = sqlite3.connect(db_path)
+        conn = get_connection(db_path)
         cursor = conn.cursor()
 
         cursor.execute("SELECT COALESCE(SUM(total_loans), 0.0) FROM members;")
@@ -197,9 +193,6 @@ def calculate_lts_ratio(db_path: str) -> Tuple[bool, float]:
         return False, 0.0
     except Exception:
         return False, 0.0
-    finally:
-        if conn:
-            conn.close()
 
 
 def get_liquidity_status(db_path: str) -> Tuple[bool, Dict]:
@@ -214,7 +207,7 @@ def get_liquidity_status(db_path: str) -> Tuple[bool, Dict]:
     """
     conn = None
     try:
-        conn = sqlite3.connect(db_path)
+        conn = get_connection(db_path)
         cursor = conn.cursor()
 
         cursor.execute("SELECT COALESCE(SUM(current_savings), 0.0) FROM members;")
@@ -236,6 +229,3 @@ def get_liquidity_status(db_path: str) -> Tuple[bool, Dict]:
         return False, {}
     except Exception:
         return False, {}
-    finally:
-        if conn:
-            conn.close()
@@ -5,10 +5,11 @@ Provides Excel template generation and member import.
 
 from __future__ import annotations
 
+import re
 from datetime import date, datetime
 from typing import Any, Callable, Dict, List, Optional, Tuple, cast
 
-from database.queries import add_member, get_member_by_staff_number
+from database.queries import add_member, add_members_bulk, get_member_by_staff_number
 
 
 class BulkDataManager:
@@ -24,6 +25,8 @@ class BulkDataManager:
         "Initial Loan",
     ]
     DEPARTMENT_OPTIONS = ["SLT", "Admin", "Teaching", "Non-Teaching"]
+    # One token of letters/digits, optionally split by "/" or "-" (EMP001, SLT/014)
+    STAFF_ID_RE = re.compile(r"^[A-Za-z0-9]+(?:[/-][A-Za-z0-9]+)*$")
 
     def __init__(self, db_path: str = "swiftledger.db"):
         self.db_path = db_path
@@ -122,6 +125,9 @@ class BulkDataManager:
         total = len(df.index)
         success_count = 0
         error_log: List[Dict] = []
+        # Validated rows, written together in one transaction after the scan
+        pending: List[Tuple[int, str, Dict]] = []
+        seen_staff_ids = set()
 
         for row_idx in range(len(df.index)):
             row = df.iloc[row_idx]
@@ -150,8 +156,12 @@ class BulkDataManager:
                     error_log.append({"row": row_num, "name": full_name, "error": "Full Name and Staff ID are required."})
                     continue
 
+                if not self.STAFF_ID_RE.match(staff_id):
+                    error_log.append({"row": row_num, "name": full_name, "error": "Invalid Staff ID format."})
+                    continue
+
                 exists_ok, existing = get_member_by_staff_number(self.db_path, staff_id)
-                if exists_ok and existing:
+                if (exists_ok and existing) or staff_id in seen_staff_ids:
                     error_log.append({"row": row_num, "name": full_name, "error": "Duplicate Staff ID."})
                     continue
 
@@ -177,16 +187,26 @@ class BulkDataManager:
                     "total_loans": initial_loan,
                 }
 
-                ok_add, msg = add_member(self.db_path, member_data)
-                if not ok_add:
-                    error_log.append({"row": row_num, "name": full_name, "error": msg})
-                    continue
-
-                success_count += 1
+                pending.append((row_num, full_name, member_data))
+                seen_staff_ids.add(staff_id)
 
             except Exception as exc:
                 error_log.append({"row": row_num, "name": "", "error": f"Unexpected error: {exc}"})
 
+        if pending:
+            ok_bulk, _msg = add_members_bulk(self.db_path, [data for _, _, data in pending])
+            if ok_bulk:
+                success_count = len(pending)
+            else:
+                # The batch was rolled back; add row by row to pin down the failures
+                for row_num, full_name, member_data in pending:
+                    ok_add, msg = add_member(self.db_path, member_data)
+                    if not ok_add:
+                        error_log.append({"row": row_num, "name": full_name, "error": msg})
+                        continue
+                    success_count += 1
+            error_log.sort(key=lambda entry: entry["row"])
+
         return success_count, error_log
 
     @staticmethod
@@ -1,7 +1,8 @@
 import sys
 import os
 import sqlite3
-from PySide6.QtWidgets import QApplication, QDialog
+from PySide6.QtCore import QThreadPool
+from PySide6.QtWidgets import QApplication
 from PySide6.QtGui import QIcon
 
 # 1. Add the project directory to the path so Python finds your folders
@@ -9,7 +10,7 @@ base_path = os.path.dirname(os.path.abspath(__file__))
 sys.path.append(base_path)
 
 # 2. Import core UI flows
-from database.db_init import init_db
+from database.db_init import init_db, close_all_connections
 from ui.login_screen import LoginScreen
 from ui.main_window import MainWindow
 from ui.wizard import FirstRunWizard
@@ -45,16 +46,19 @@ class AppController:
 
     def _show_wizard(self) -> None:
         self.wizard = FirstRunWizard(db_path=self.db_path)
-        self.wizard.finished.connect(self._on_wizard_finished)
+        self.wizard.setup_completed.connect(self._on_setup_completed)
+        self.wizard.accepted.connect(self._on_wizard_closed)
         self.wizard.show()
 
-    def _on_wizard_finished(self, result: int) -> None:
-        if result != QDialog.DialogCode.Accepted:
-            return
+    def _on_setup_completed(self) -> None:
+        # Only fires once the wizard's settings are saved, so the login
+        # screen always sees the new credential; the wizard closes itself
+        self._show_login()
+
+    def _on_wizard_closed(self) -> None:
         if self.wizard is not None:
-            self.wizard.close()
+            self.wizard.deleteLater()
             self.wizard = None
-        self._show_login()
 
     def _show_login(self) -> None:
         self.login = LoginScreen(db_path=self.db_path)
@@ -82,6 +86,17 @@ if __name__ == "__main__":
     if os.path.isfile(icon_path):
         app.setWindowIcon(QIcon(icon_path))
 
+    # ── Flush the SQLite WAL on exit ─────────────────────────────────
+    # Let pending workers finish, then checkpoint so swiftledger.db is
+    # self-contained (safe to copy for backups) once the app has closed.
+    # A worker stuck on a locked database must not hang the exit, so the
+    # wait is bounded and the checkpoint is skipped if workers are still busy.
+    def _shutdown_database() -> None:
+        workers_done = QThreadPool.globalInstance().waitForDone(3000)
+        close_all_connections(checkpoint=workers_done)
+
+    app.aboutToQuit.connect(_shutdown_database)
+
     # 3. Launch with first-run + auth gate
     controller = AppController(app)
     controller.start()
@@ -11,7 +11,7 @@ from PySide6.QtWidgets import (
     QScrollArea, QFrame,
 )
 from PySide6.QtCore import Qt
-from PySide6.QtGui import QFont
+from ui.fonts import cached_font
 
 
 # ── Collapsible FAQ widget ───────────────────────────────────────────
@@ -81,7 +81,7 @@ class AboutPage(QWidget):
 
         # ── Software info ────────────────────────────────────────────
         info_group = QGroupBox("Software Information")
-        info_group.setFont(QFont("Arial", 12))
+        info_group.setFont(cached_font(12))
         info_layout = QVBoxLayout(info_group)
 
         logo_label = QLabel("[ SwiftLedger Logo ]")
@@ -106,7 +106,7 @@ class AboutPage(QWidget):
 
         # ── Developer section ────────────────────────────────────────
         dev_group = QGroupBox("About the Developer")
-        dev_group.setFont(QFont("Arial", 12))
+        dev_group.setFont(cached_font(12))
         dev_layout = QVBoxLayout(dev_group)
 
         dev_text = QLabel(
@@ -131,15 +131,19 @@ class AboutPage(QWidget):
 
         # ── FAQ accordion ────────────────────────────────────────────
         faq_group = QGroupBox("Frequently Asked Questions")
-        faq_group.setFont(QFont("Arial", 12))
+        faq_group.setFont(cached_font(12))
         faq_layout = QVBoxLayout(faq_group)
 
         faqs = [
             (
                 "How do I backup data?",
                 "The app uses swiftledger.db — a single SQLite file. "
-                "Simply copy this file to a USB drive, cloud folder, or external backup. "
-                "Restoring is as easy as replacing the file."
+                "Close SwiftLedger first, then copy this file to a USB drive, "
+                "cloud folder, or external backup. While the app is running, recent "
+                "changes may still sit in swiftledger.db-wal next to it; closing the "
+                "app merges them into swiftledger.db. "
+                "To restore, close the app and replace the file (delete any leftover "
+                "swiftledger.db-wal and swiftledger.db-shm files)."
             ),
             (
                 "What happens if I forget my PIN?",
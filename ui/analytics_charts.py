@@ -12,7 +12,7 @@ from PySide6.QtWidgets import (
     QDialog, QMessageBox
 )
 from PySide6.QtCore import Qt
-from PySide6.QtGui import QFont
+from ui.fonts import cached_font
 
 try:
     import matplotlib
@@ -53,7 +53,7 @@ class InteractiveMonthlyChart(QWidget):
         # Range selector
         range_layout = QHBoxLayout()
         range_label = QLabel("Range:")
-        range_label.setFont(QFont("Arial", 10))
+        range_label.setFont(cached_font(10))
 
         btn_6m = QPushButton("6 Months")
         btn_6m.setMaximumWidth(100)
@@ -293,9 +293,7 @@ class MonthlyInsightDialog(QDialog):
         layout = QVBoxLayout(self)
 
         title = QLabel(f"Financial Snapshot: {self.snapshot.get('year')}-{self.snapshot.get('month', 1):02d}")
-        title_font = QFont("Arial", 16)
-        title_font.setBold(True)
-        title.setFont(title_font)
+        title.setFont(cached_font(16, bold=True))
         layout.addWidget(title)
 
         # Metrics grid
@@ -311,11 +309,9 @@ class MonthlyInsightDialog(QDialog):
         for label, value in metrics:
             row = QHBoxLayout()
             lbl = QLabel(label)
-            lbl.setFont(QFont("Arial", 11))
+            lbl.setFont(cached_font(11))
             val = QLabel(value)
-            val_font = QFont("Arial", 11)
-            val_font.setBold(True)
-            val.setFont(val_font)
+            val.setFont(cached_font(11, bold=True))
             val.setStyleSheet("color: #27ae60;")
             row.addWidget(lbl)
             row.addStretch()
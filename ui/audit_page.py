@@ -13,10 +13,13 @@ from PySide6.QtWidgets import (
     QLineEdit, QComboBox, QMessageBox, QFileDialog,
 )
 from PySide6.QtCore import Qt
-from PySide6.QtGui import QFont, QColor
+from PySide6.QtGui import QColor
 
-sys.path.insert(0, str(Path(__file__).parent.parent))
+_PROJECT_ROOT = str(Path(__file__).parent.parent)
+if _PROJECT_ROOT not in sys.path:
+    sys.path.insert(0, _PROJECT_ROOT)
 from database.queries import get_all_logs
+from ui.fonts import cached_font
 
 
 class AuditLogPage(QWidget):
@@ -48,9 +51,7 @@ class AuditLogPage(QWidget):
 
         # Title
         title = QLabel("Audit Logs")
-        tf = QFont("Arial", 18)
-        tf.setBold(True)
-        title.setFont(tf)
+        title.setFont(cached_font(18, bold=True))
         main.addWidget(title)
 
         # ── Search / Filter row ─────────────────────────────────────
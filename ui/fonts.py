@@ -0,0 +1,28 @@
+"""
+Shared fonts for SwiftLedger widgets.
+Every page uses the same handful of Arial sizes, so each one is built once
+and reused instead of constructing a fresh QFont per widget.
+"""
+
+from functools import lru_cache
+
+from PySide6.QtGui import QFont
+
+
+@lru_cache(maxsize=None)
+def cached_font(size: int, bold: bool = False) -> QFont:
+    """Return a shared Arial font. setFont copies it, so callers must not modify it."""
+    font = QFont("Arial", size)
+    font.setBold(bold)
+    return font
+
+
+@lru_cache(maxsize=None)
+def cached_system_font(size: int = 0, bold: bool = False, italic: bool = False) -> QFont:
+    """Like cached_font, but in the application's default family; size 0 keeps its size."""
+    font = QFont()
+    if size > 0:
+        font.setPointSize(size)
+    font.setBold(bold)
+    font.setItalic(italic)
+    return font
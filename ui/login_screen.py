@@ -13,12 +13,14 @@ from PySide6.QtWidgets import (
     QLineEdit, QMessageBox, QFrame,
 )
 from PySide6.QtCore import Qt, Signal
-from PySide6.QtGui import QFont
 
-sys.path.insert(0, str(Path(__file__).parent.parent))
+_PROJECT_ROOT = str(Path(__file__).parent.parent)
+if _PROJECT_ROOT not in sys.path:
+    sys.path.insert(0, _PROJECT_ROOT)
 from database.queries import get_system_settings
 from database.db_init import log_event
 from security import verify_credential, check_system_auth
+from ui.fonts import cached_font
 
 
 class LoginScreen(QWidget):
@@ -94,26 +96,12 @@ class LoginScreen(QWidget):
             "border-radius: 6px; padding: 6px 12px; font-size: 14px; }"
         )
 
-        if self.security_mode == "pin":
-            self.input_credential.setPlaceholderText("Enter your PIN")
-        elif self.security_mode == "password":
-            self.input_credential.setPlaceholderText("Enter your password")
-        else:
-            # system_auth — hide the text field, show a different prompt
-            self.input_credential.setVisible(False)
-
         card_layout.addWidget(self.input_credential)
 
         # Login button
-        self.btn_login = QPushButton(
-            "Authenticate with Windows"
-            if self.security_mode == "system_auth"
-            else "Unlock"
-        )
+        self.btn_login = QPushButton()
         self.btn_login.setMinimumHeight(40)
-        bf = QFont("Arial", 11)
-        bf.setBold(True)
-        self.btn_login.setFont(bf)
+        self.btn_login.setFont(cached_font(11, bold=True))
         self.btn_login.setCursor(Qt.CursorShape.PointingHandCursor)
         self.btn_login.setStyleSheet(
             "QPushButton { background-color: #2980b9; color: white; "
@@ -129,6 +117,29 @@ class LoginScreen(QWidget):
         card_layout.addStretch()
         outer.addWidget(card)
 
+        self._apply_security_mode()
+
+    def _apply_security_mode(self) -> None:
+        """Adjust the credential field and button for the current security mode."""
+        if self.security_mode == "pin":
+            self.input_credential.setPlaceholderText("Enter your PIN")
+        elif self.security_mode == "password":
+            self.input_credential.setPlaceholderText("Enter your password")
+        # system_auth — hide the text field, show a different prompt
+        self.input_credential.setVisible(self.security_mode != "system_auth")
+
+        self.btn_login.setText(
+            "Authenticate with Windows"
+            if self.security_mode == "system_auth"
+            else "Unlock"
+        )
+
+    def clear_fields(self) -> None:
+        """Reset the screen for reuse, picking up any security setting changes."""
+        self.input_credential.clear()
+        self._load_security_settings()
+        self._apply_security_mode()
+
     # ── Authentication logic ─────────────────────────────────────────
 
     def _attempt_login(self) -> None:
@@ -6,28 +6,37 @@ Contains the sidebar navigation and stacked widget for multiple pages.
 from PySide6.QtWidgets import (
     QApplication, QMainWindow, QWidget, QHBoxLayout, QVBoxLayout, QFrame,
     QPushButton, QStackedWidget, QLabel, QGroupBox, QFormLayout, QGridLayout,
-    QLineEdit, QComboBox, QTableWidget, QTableWidgetItem, QMessageBox,
-    QAbstractItemView, QDoubleSpinBox, QSpinBox, QDialog, QListWidget, QScrollArea,
-    QFileDialog, QProgressDialog, QTextEdit
+    QLineEdit, QComboBox, QMessageBox,
+    QAbstractItemView, QDoubleSpinBox, QSpinBox, QDialog, QListView, QScrollArea,
+    QFileDialog, QProgressDialog, QTextEdit, QButtonGroup, QTableView
 )
-from PySide6.QtCore import Qt, QSize, QEvent, QTimer
-from PySide6.QtGui import QFont, QColor, QBrush, QPixmap
+from PySide6.QtCore import (
+    Qt, QSize, QEvent, QTimer, QAbstractTableModel, QModelIndex,
+    QStringListModel,
+)
+from PySide6.QtGui import QFont, QColor, QPixmap, QPixmapCache
 from PySide6.QtWidgets import QHeaderView
 import shutil
+import time
+from functools import lru_cache
 from pathlib import Path
 from datetime import date
 from typing import Dict, List, Optional
 import sys
 from pathlib import Path
-import time
 
 # Add parent directory to path for imports
-sys.path.insert(0, str(Path(__file__).parent.parent))
+_PROJECT_ROOT = str(Path(__file__).parent.parent)
+if _PROJECT_ROOT not in sys.path:
+    sys.path.insert(0, _PROJECT_ROOT)
 from database.queries import (
-    add_member, get_all_members, get_member_by_staff_number, get_member_by_id,
+    add_member, get_members_summary, get_member_summary_by_staff_number,
+    search_members, get_member_by_staff_number,
+    get_member_by_id,
     add_saving, get_total_savings, get_member_savings, get_system_settings,
-    apply_for_loan, get_member_loans, calculate_repayment_schedule,
+    apply_for_loan, get_member_loans, get_member_dashboard, calculate_repayment_schedule,
     get_society_stats, check_overdue_loans, delete_member, update_member_profile,
+    cached_call,
 )
 from logic.analytics import (
     get_monthly_snapshot, get_monthly_trend, calculate_lts_ratio, get_liquidity_status
@@ -38,8 +47,127 @@ from ui.about_page import AboutPage
 from ui.settings_page import SettingsPage
 from ui.reports_page import ReportsPage
 from ui.login_screen import LoginScreen
+from ui.workers import run_in_background
+from ui.fonts import cached_font
 from logic.data_manager import BulkDataManager
 
+# Bound format methods for table cells; avoids re-parsing the spec per cell
+_MONEY = "₦{:,.2f}".format
+_RATE = "{:.2f}%".format
+
+# Seconds a settings row may be reused; any database write invalidates it sooner
+_SETTINGS_TTL = 30.0
+# Seconds a member's savings figures may be reused when nothing has changed
+_SAVINGS_TTL = 30.0
+
+
+_DEFAULT_AVATAR = Path(__file__).parent.parent.joinpath('assets', 'default_avatar.svg').as_posix()
+
+
+def _avatar_pixmap(path: str, size: int) -> QPixmap:
+    """Load and scale an avatar image once; later calls hit QPixmapCache."""
+    key = f"avatar:{size}:{path}"
+    pixmap = QPixmap()
+    if QPixmapCache.find(key, pixmap):
+        return pixmap
+    pixmap = QPixmap(path)
+    if not pixmap.isNull():
+        pixmap = pixmap.scaled(
+            size, size,
+            Qt.AspectRatioMode.KeepAspectRatioByExpanding,
+            Qt.TransformationMode.SmoothTransformation,
+        )
+        QPixmapCache.insert(key, pixmap)
+    return pixmap
+
+
+@lru_cache(maxsize=256)
+def _cached_schedule(principal_cents: int, rate_bp: int, duration: int) -> tuple:
+    """
+    Memoised repayment schedule as display rows, keyed on whole kobo and basis points.
+
+    The spin boxes round to 2 decimals, so integer keys make repeated previews
+    of the same loan hit the cache despite float noise. Amounts are formatted
+    here, once, rather than per cell.
+    """
+    schedule = calculate_repayment_schedule(principal_cents / 100, rate_bp / 100, duration)
+    return tuple(
+        (
+            str(month['month_number']), _MONEY(month['principal_payment']),
+            _MONEY(month['interest_payment']), _MONEY(month['total_payment']),
+            _MONEY(month['remaining_balance']),
+        )
+        for month in schedule
+    )
+
+
+@lru_cache(maxsize=4096)
+def _join_date_ordinal(date_joined: str) -> Optional[int]:
+    """Return the ordinal of an ISO join date, or None if it cannot be parsed."""
+    try:
+        return date.fromisoformat(date_joined).toordinal()
+    except Exception:
+        return None
+
+
+_MPL_CLASSES: Optional[tuple] = None
+
+
+def _load_mpl() -> Optional[tuple]:
+    """Import matplotlib's Figure and Qt canvas once; None if unavailable."""
+    global _MPL_CLASSES
+    if _MPL_CLASSES is None:
+        try:
+            from matplotlib.figure import Figure
+            from matplotlib.backends.backend_qtagg import FigureCanvasQTAgg as FigureCanvas
+            _MPL_CLASSES = (Figure, FigureCanvas)
+        except Exception:
+            _MPL_CLASSES = ()
+    return _MPL_CLASSES or None
+
+
+def _load_savings_data(db_path: str, member_id: int) -> Dict:
+    """Fetch a member's savings balance and recent history; executed on a worker thread."""
+    return {
+        'member_id': member_id,
+        'total': cached_call(get_total_savings, db_path, member_id, ttl=_SAVINGS_TTL),
+        'history': cached_call(get_member_savings, db_path, member_id, ttl=_SAVINGS_TTL),
+    }
+
+
+def _register_member_data(db_path: str, member_data: Dict) -> Dict:
+    """Insert a member and fetch their listing row; executed on a worker thread."""
+    success, message = add_member(db_path, member_data)
+    member = None
+    if success:
+        found, member = get_member_summary_by_staff_number(db_path, member_data['staff_number'])
+        member = member if found else None
+    return {'ok': success, 'message': message, 'member': member}
+
+
+def _load_dashboard_data(db_path: str, ttl: float, force: bool) -> Dict:
+    """Run every dashboard query; executed on a worker thread."""
+    stats_ok, stats = cached_call(get_society_stats, db_path, ttl=ttl, force=force)
+    if not stats_ok:
+        return {'ok': False}
+
+    settings_ok, settings = cached_call(get_system_settings, db_path, ttl=ttl, force=force)
+    show_charts = bool(settings.get('show_charts', 0)) if settings_ok and settings else False
+    show_alerts = bool(settings.get('show_alerts', 1)) if settings_ok and settings else True
+
+    return {
+        'ok': True,
+        'stats': stats,
+        'show_charts': show_charts,
+        'show_alerts': show_alerts,
+        'lts': cached_call(calculate_lts_ratio, db_path, ttl=ttl, force=force),
+        'liquidity': cached_call(get_liquidity_status, db_path, ttl=ttl, force=force),
+        'overdue': (
+            cached_call(check_overdue_loans, db_path, ttl=ttl, force=force)
+            if show_alerts else (True, [])
+        ),
+    }
+
 
 class DashboardPage(QWidget):
     """Dashboard page with society-wide financial statistics and dividend breakdown."""
@@ -52,9 +180,50 @@ class DashboardPage(QWidget):
         'interest': '#9b59b6',  # Purple
     }
 
+    # Accent colours for the dividend cards (border & value text)
+    DIVIDEND_COLOURS = {
+        'members_share': '#27ae60',
+        'society_share': '#e74c3c',
+    }
+
+    # Every card is styled from this one sheet, applied once on the page,
+    # instead of each card and label parsing its own f-string stylesheet.
+    # Child labels inherit from QFrame, so the card rules are repeated for
+    # them to keep the original look.
+    CARD_QSS = (
+        "QLabel#statTitle { color: #bdc3c7; font-size: 12px; } "
+        "QLabel#dividendTitle { color: #bdc3c7; font-size: 13px; } "
+        + "".join(
+            f"QFrame#statCard_{key} {{ background-color: #2b2b2b; "
+            f"border-left: 4px solid {accent}; border-radius: 8px; padding: 14px; }} "
+            f"QFrame#statCard_{key} QLabel {{ background-color: #2b2b2b; "
+            f"border: none; border-radius: 8px; padding: 14px; }} "
+            f"QLabel#statValue_{key} {{ color: {accent}; font-size: 22px; "
+            f"font-weight: bold; }} "
+            for key, accent in CARD_COLOURS.items()
+        )
+        + "".join(
+            f"QFrame#dividendCard_{key} {{ background-color: #2b2b2b; "
+            f"border: 1px solid {accent}; border-radius: 10px; padding: 16px; }} "
+            f"QFrame#dividendCard_{key} QLabel {{ background-color: #2b2b2b; "
+            f"border: none; border-radius: 10px; padding: 16px; }} "
+            f"QLabel#dividendValue_{key} {{ color: {accent}; font-size: 26px; "
+            f"font-weight: bold; }} "
+            for key, accent in DIVIDEND_COLOURS.items()
+        )
+    )
+
     def __init__(self, db_path: str = "swiftledger.db"):
         super().__init__()
         self.db_path = db_path
+        self._refresh_worker = None
+        # Set when a refresh was requested while the page was hidden
+        self._dirty = False
+        # Financial health pie, created on first use and redrawn in place
+        self._health_ax = None
+        self._health_canvas = None
+        # (available cash, outstanding loans) last drawn on the health pie
+        self._health_key = None
         self._build_ui()
 
     # ── UI construction ─────────────────────────────────────────────
@@ -62,6 +231,7 @@ class DashboardPage(QWidget):
     def _build_ui(self) -> None:
         outer = QVBoxLayout(self)
         outer.setContentsMargins(0, 0, 0, 0)
+        self.setStyleSheet(self.CARD_QSS)
 
         scroll = QScrollArea()
         scroll.setWidgetResizable(True)
@@ -75,8 +245,7 @@ class DashboardPage(QWidget):
         # Title row
         header_row = QHBoxLayout()
         title = QLabel("Dashboard")
-        title_font = QFont("Arial", 20)
-        title_font.setBold(True)
+        title_font = cached_font(20, bold=True)
         title.setFont(title_font)
         header_row.addWidget(title)
         header_row.addStretch()
@@ -90,7 +259,7 @@ class DashboardPage(QWidget):
             "font-weight: bold; padding: 6px 14px; } "
             "QPushButton:hover { background-color: #3498db; }"
         )
-        self.btn_refresh.clicked.connect(self.refresh_dashboard)
+        self.btn_refresh.clicked.connect(self._on_refresh_clicked)
         header_row.addWidget(self.btn_refresh)
         main_layout.addLayout(header_row)
 
@@ -100,16 +269,16 @@ class DashboardPage(QWidget):
         cards_layout.setVerticalSpacing(16)
 
         self.card_members = self._create_stat_card(
-            "👥  Total Members", "0", self.CARD_COLOURS['members']
+            'members', "👥  Total Members", "0"
         )
         self.card_savings = self._create_stat_card(
-            "💰  Total Savings", "₦0.00", self.CARD_COLOURS['savings']
+            'savings', "💰  Total Savings", "₦0.00"
         )
         self.card_loans = self._create_stat_card(
-            "🏦  Loans Disbursed", "₦0.00", self.CARD_COLOURS['loans']
+            'loans', "🏦  Loans Disbursed", "₦0.00"
         )
         self.card_interest = self._create_stat_card(
-            "📈  Projected Interest", "₦0.00", self.CARD_COLOURS['interest']
+            'interest', "📈  Projected Interest", "₦0.00"
         )
 
         cards_layout.addWidget(self.card_members[0], 0, 0)
@@ -121,7 +290,7 @@ class DashboardPage(QWidget):
 
         # ── Dividend section ────────────────────────────────────────
         dividend_group = QGroupBox("Dividend Breakdown")
-        dividend_group.setFont(QFont("Arial", 12))
+        dividend_group.setFont(cached_font(12))
         dividend_group.setStyleSheet(
             "QGroupBox { border: 1px solid #34495e; border-radius: 8px; "
             "margin-top: 14px; padding: 18px 14px 14px 14px; color: #ecf0f1; } "
@@ -132,10 +301,10 @@ class DashboardPage(QWidget):
         div_layout.setSpacing(20)
 
         self.member_div_card = self._create_dividend_card(
-            "Members' Share (60%)", "₦0.00", "#27ae60"
+            'members_share', "Members' Share (60%)", "₦0.00"
         )
         self.society_div_card = self._create_dividend_card(
-            "Society Reserve (40%)", "₦0.00", "#e74c3c"
+            'society_share', "Society Reserve (40%)", "₦0.00"
         )
 
         div_layout.addWidget(self.member_div_card[0])
@@ -145,7 +314,7 @@ class DashboardPage(QWidget):
 
         # ── Interactive Monthly Trend Chart ──────────────────────────
         trend_group = QGroupBox("Monthly Trends")
-        trend_group.setFont(QFont("Arial", 12))
+        trend_group.setFont(cached_font(12))
         trend_layout = QVBoxLayout(trend_group)
         self.monthly_chart = InteractiveMonthlyChart(self.db_path)
         trend_layout.addWidget(self.monthly_chart)
@@ -156,16 +325,19 @@ class DashboardPage(QWidget):
         gauge_alerts_row.setSpacing(16)
 
         gauge_group = QGroupBox("Loan-to-Savings Ratio")
-        gauge_group.setFont(QFont("Arial", 12))
+        gauge_group.setFont(cached_font(12))
         gauge_layout = QVBoxLayout(gauge_group)
         self.lts_gauge = LTSRiskGauge(self.db_path)
         gauge_layout.addWidget(self.lts_gauge)
         gauge_alerts_row.addWidget(gauge_group)
 
         alerts_group = QGroupBox("Loan Alerts")
-        alerts_group.setFont(QFont("Arial", 12))
+        alerts_group.setFont(cached_font(12))
         alerts_layout = QVBoxLayout(alerts_group)
-        self.list_overdue = QListWidget()
+        self._overdue_model = QStringListModel(self)
+        self.list_overdue = QListView()
+        self.list_overdue.setModel(self._overdue_model)
+        self.list_overdue.setEditTriggers(QAbstractItemView.EditTrigger.NoEditTriggers)
         self.list_overdue.setMinimumHeight(120)
         alerts_layout.addWidget(self.list_overdue)
         gauge_alerts_row.addWidget(alerts_group)
@@ -177,7 +349,7 @@ class DashboardPage(QWidget):
         status_health_row.setSpacing(16)
 
         liquidity_group = QGroupBox("Liquidity Status")
-        liquidity_group.setFont(QFont("Arial", 12))
+        liquidity_group.setFont(cached_font(12))
         liquidity_layout = QVBoxLayout(liquidity_group)
         self.lbl_available_cash = QLabel("Available Cash: ₦0.00")
         self.lbl_available_cash.setStyleSheet("color: #27ae60; font-weight: bold;")
@@ -189,7 +361,7 @@ class DashboardPage(QWidget):
         status_health_row.addWidget(liquidity_group)
 
         health_group = QGroupBox("Financial Health")
-        health_group.setFont(QFont("Arial", 12))
+        health_group.setFont(cached_font(12))
         self.chart_container = QWidget()
         self.chart_layout = QVBoxLayout(self.chart_container)
         self.chart_layout.setContentsMargins(0, 0, 0, 0)
@@ -204,7 +376,7 @@ class DashboardPage(QWidget):
 
         # ── Quick Start Guide ───────────────────────────────────────
         help_group = QGroupBox("Quick Start Guide")
-        help_group.setFont(QFont("Arial", 12))
+        help_group.setFont(cached_font(12))
         help_layout = QVBoxLayout(help_group)
         help_layout.setSpacing(6)
         help_items = [
@@ -215,11 +387,14 @@ class DashboardPage(QWidget):
             "5. Export branded PDFs from the Reports page.",
             "6. All actions are tracked — review them on the Audit Logs page.",
         ]
-        for item in help_items:
-            lbl = QLabel(item)
-            lbl.setWordWrap(True)
-            lbl.setStyleSheet("font-size: 11px; padding: 2px 0;")
-            help_layout.addWidget(lbl)
+        # One rich-text label rather than a label (and stylesheet) per step
+        lbl_help = QLabel(
+            "".join(f"<p style='margin: 2px 0;'>{item}</p>" for item in help_items)
+        )
+        lbl_help.setTextFormat(Qt.TextFormat.RichText)
+        lbl_help.setWordWrap(True)
+        lbl_help.setStyleSheet("font-size: 11px;")
+        help_layout.addWidget(lbl_help)
         main_layout.addWidget(help_group)
 
         # ── Status bar ──────────────────────────────────────────────
@@ -236,27 +411,22 @@ class DashboardPage(QWidget):
     # ── Widget factories ────────────────────────────────────────────
 
     def _create_stat_card(
-        self, title_text: str, value_text: str, accent: str
+        self, key: str, title_text: str, value_text: str
     ) -> tuple:
-        """Return (QFrame card, QLabel title, QLabel value)."""
+        """Return (QFrame card, QLabel title, QLabel value); styled by CARD_QSS."""
         card = QFrame()
+        card.setObjectName(f"statCard_{key}")
         card.setMinimumHeight(110)
-        card.setStyleSheet(
-            f"QFrame {{ background-color: #2b2b2b; border-left: 4px solid {accent}; "
-            f"border-radius: 8px; padding: 14px; }}"
-        )
 
         layout = QVBoxLayout(card)
         layout.setContentsMargins(14, 10, 14, 10)
         layout.setSpacing(8)
 
         lbl_title = QLabel(title_text)
-        lbl_title.setStyleSheet("color: #bdc3c7; font-size: 12px; border: none;")
+        lbl_title.setObjectName("statTitle")
 
         lbl_value = QLabel(value_text)
-        lbl_value.setStyleSheet(
-            f"color: {accent}; font-size: 22px; font-weight: bold; border: none;"
-        )
+        lbl_value.setObjectName(f"statValue_{key}")
 
         layout.addWidget(lbl_title)
         layout.addWidget(lbl_value)
@@ -265,15 +435,12 @@ class DashboardPage(QWidget):
         return card, lbl_title, lbl_value
 
     def _create_dividend_card(
-        self, title_text: str, value_text: str, accent: str
+        self, key: str, title_text: str, value_text: str
     ) -> tuple:
-        """Return (QFrame card, QLabel value)."""
+        """Return (QFrame card, QLabel value); styled by CARD_QSS."""
         card = QFrame()
+        card.setObjectName(f"dividendCard_{key}")
         card.setMinimumHeight(100)
-        card.setStyleSheet(
-            f"QFrame {{ background-color: #2b2b2b; border: 1px solid {accent}; "
-            f"border-radius: 10px; padding: 16px; }}"
-        )
 
         layout = QVBoxLayout(card)
         layout.setContentsMargins(14, 10, 14, 10)
@@ -281,13 +448,11 @@ class DashboardPage(QWidget):
 
         lbl_title = QLabel(title_text)
         lbl_title.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        lbl_title.setStyleSheet("color: #bdc3c7; font-size: 13px; border: none;")
+        lbl_title.setObjectName("dividendTitle")
 
         lbl_value = QLabel(value_text)
         lbl_value.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        lbl_value.setStyleSheet(
-            f"color: {accent}; font-size: 26px; font-weight: bold; border: none;"
-        )
+        lbl_value.setObjectName(f"dividendValue_{key}")
 
         layout.addWidget(lbl_title)
         layout.addWidget(lbl_value)
@@ -296,50 +461,88 @@ class DashboardPage(QWidget):
 
     # ── Refresh logic ───────────────────────────────────────────────
 
-    def refresh_dashboard(self) -> None:
-        """Fetch society stats from the database and update every label."""
-        success, stats = get_society_stats(self.db_path)
-        if not success:
-            self.lbl_status.setText("⚠  Failed to load statistics")
+    # Seconds a dashboard query result may be reused when nothing has changed
+    CACHE_TTL = 15.0
+
+    def _on_refresh_clicked(self) -> None:
+        # An explicit Refresh always goes to the database
+        self.refresh_dashboard(force=True)
+
+    def refresh_dashboard(self, force: bool = False) -> None:
+        """Fetch society stats on a worker thread; _apply_stats updates the labels."""
+        if not self.isVisible():
+            # Nothing to repaint; showEvent picks this up
+            self._dirty = True
             return
+        if self._refresh_worker is not None:
+            return  # a refresh is already in flight
+
+        self._dirty = False
+        self.btn_refresh.setEnabled(False)
+        self._refresh_worker = run_in_background(
+            _load_dashboard_data, self.db_path, self.CACHE_TTL, force,
+            on_finished=self._apply_stats,
+            on_failed=self._on_refresh_failed,
+        )
 
-        settings_ok, settings = get_system_settings(self.db_path)
-        show_charts = bool(settings.get('show_charts', 0)) if settings_ok and settings else False
-        show_alerts = bool(settings.get('show_alerts', 1)) if settings_ok and settings else True
+    def showEvent(self, event) -> None:
+        super().showEvent(event)
+        if self._dirty:
+            self.refresh_dashboard()
 
-        # Stat cards
-        self.card_members[2].setText(str(stats.get('total_members', 0)))
-        self.card_savings[2].setText(f"₦{stats.get('total_savings', 0):,.2f}")
-        self.card_loans[2].setText(f"₦{stats.get('total_loans_disbursed', 0):,.2f}")
-        self.card_interest[2].setText(f"₦{stats.get('total_projected_interest', 0):,.2f}")
+    def _on_refresh_failed(self, error: str) -> None:
+        self._refresh_worker = None
+        self.btn_refresh.setEnabled(True)
+        self.lbl_status.setText("⚠  Failed to load statistics")
 
-        # Dividend cards
-        self.member_div_card[1].setText(
-            f"₦{stats.get('members_dividend_share', 0):,.2f}"
-        )
-        self.society_div_card[1].setText(
-            f"₦{stats.get('society_dividend_share', 0):,.2f}"
-        )
+    def _apply_stats(self, payload: Dict) -> None:
+        """Update every dashboard widget from a _load_dashboard_data payload."""
+        self._refresh_worker = None
+        self.btn_refresh.setEnabled(True)
+
+        if not payload.get('ok'):
+            self.lbl_status.setText("⚠  Failed to load statistics")
+            return
 
-        # LTS Ratio
-        lts_ok, lts_ratio = calculate_lts_ratio(self.db_path)
-        if lts_ok:
-            self.lts_gauge.refresh_gauge(lts_ratio)
+        stats = payload['stats']
+        show_charts = payload['show_charts']
+        show_alerts = payload['show_alerts']
 
-        # Liquidity Status
-        liq_ok, liquidity = get_liquidity_status(self.db_path)
-        if liq_ok:
-            self.lbl_available_cash.setText(
-                f"Available Cash: ₦{liquidity.get('available_cash', 0):,.2f}"
-            )
-            self.lbl_outstanding_loans.setText(
-                f"Outstanding Loans: ₦{liquidity.get('outstanding_loans', 0):,.2f}"
-            )
+        # Hold repaints until every label is set so the page paints once
+        self.setUpdatesEnabled(False)
+        try:
+            # Stat cards
+            self.card_members[2].setText(str(stats.get('total_members', 0)))
+            self.card_savings[2].setText(_MONEY(stats.get('total_savings', 0)))
+            self.card_loans[2].setText(_MONEY(stats.get('total_loans_disbursed', 0)))
+            self.card_interest[2].setText(_MONEY(stats.get('total_projected_interest', 0)))
+
+            # Dividend cards
+            self.member_div_card[1].setText(_MONEY(stats.get('members_dividend_share', 0)))
+            self.society_div_card[1].setText(_MONEY(stats.get('society_dividend_share', 0)))
+
+            # LTS Ratio
+            lts_ok, lts_ratio = payload['lts']
+            if lts_ok:
+                self.lts_gauge.refresh_gauge(lts_ratio)
+
+            # Liquidity Status
+            liq_ok, liquidity = payload['liquidity']
+            if liq_ok:
+                self.lbl_available_cash.setText(
+                    "Available Cash: " + _MONEY(liquidity.get('available_cash', 0))
+                )
+                self.lbl_outstanding_loans.setText(
+                    "Outstanding Loans: " + _MONEY(liquidity.get('outstanding_loans', 0))
+                )
+        finally:
+            self.setUpdatesEnabled(True)
+            self.update()
 
         # Monthly trends chart
         self.monthly_chart._refresh_chart()
 
-        self._update_overdue_alerts(show_alerts)
+        self._update_overdue_alerts(show_alerts, payload['overdue'])
         self._update_financial_health_chart(stats, show_charts)
 
         # Timestamp
@@ -348,34 +551,30 @@ class DashboardPage(QWidget):
             f"Last refreshed: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}"
         )
 
-    def _update_overdue_alerts(self, show_alerts: bool = True) -> None:
-        self.list_overdue.clear()
+    def _update_overdue_alerts(self, show_alerts: bool, overdue_result: tuple) -> None:
         if not show_alerts:
-            self.list_overdue.addItem("Alerts disabled (enable in Settings)")
+            self._overdue_model.setStringList(["Alerts disabled (enable in Settings)"])
             return
-        ok, overdue = check_overdue_loans(self.db_path)
+        ok, overdue = overdue_result
         if not ok:
-            self.list_overdue.addItem("Failed to load alerts")
+            self._overdue_model.setStringList(["Failed to load alerts"])
             return
         if not overdue:
-            self.list_overdue.addItem("No late payments")
+            self._overdue_model.setStringList(["No late payments"])
             return
-        for item in overdue:
-            label = (
-                f"⚠ Loan #{item['loan_id']} - {item['full_name']} "
-                f"({item['staff_number']}) due {item['due_date']}"
-            )
-            self.list_overdue.addItem(label)
+        self._overdue_model.setStringList([
+            f"⚠ Loan #{item['loan_id']} - {item['full_name']} "
+            f"({item['staff_number']}) due {item['due_date']}"
+            for item in overdue
+        ])
 
     def _update_financial_health_chart(self, stats: dict, show_charts: bool) -> None:
         if not show_charts:
             self._set_chart_placeholder("Charts disabled")
             return
 
-        try:
-            from matplotlib.figure import Figure
-            from matplotlib.backends.backend_qtagg import FigureCanvasQTAgg as FigureCanvas
-        except Exception:
+        mpl = _load_mpl()
+        if mpl is None:
             self._set_chart_placeholder("Install matplotlib to view charts")
             return
 
@@ -383,9 +582,23 @@ class DashboardPage(QWidget):
         total_loans = float(stats.get('total_loans_disbursed', 0.0))
         available_cash = max(total_savings - total_loans, 0.0)
 
-        self._clear_chart_layout()
-        fig = Figure(figsize=(4, 3))
-        ax = fig.add_subplot(111)
+        if self._health_canvas is None:
+            Figure, FigureCanvas = mpl
+            fig = Figure(figsize=(4, 3))
+            self._health_ax = fig.add_subplot(111)
+            self._health_canvas = FigureCanvas(fig)
+        if self.chart_layout.indexOf(self._health_canvas) < 0:
+            self._clear_chart_layout()
+            self.chart_layout.addWidget(self._health_canvas)
+            self._health_canvas.show()
+
+        key = (round(available_cash, 2), round(total_loans, 2))
+        if key == self._health_key:
+            return
+        self._health_key = key
+
+        ax = self._health_ax
+        ax.clear()
         ax.pie(
             [available_cash, total_loans],
             labels=["Available Cash", "Outstanding Loans"],
@@ -393,14 +606,14 @@ class DashboardPage(QWidget):
             startangle=90
         )
         ax.axis('equal')
-        canvas = FigureCanvas(fig)
-        self.chart_layout.addWidget(canvas)
+        self._health_canvas.draw_idle()
 
     def _set_chart_placeholder(self, text: str) -> None:
-        self._clear_chart_layout()
-        self.chart_placeholder = QLabel(text)
-        self.chart_placeholder.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        self.chart_layout.addWidget(self.chart_placeholder)
+        if self.chart_layout.indexOf(self.chart_placeholder) < 0:
+            self._clear_chart_layout()
+            self.chart_layout.addWidget(self.chart_placeholder)
+            self.chart_placeholder.show()
+        self.chart_placeholder.setText(text)
 
     def _clear_chart_layout(self) -> None:
         while self.chart_layout.count():
@@ -415,12 +628,15 @@ class DashboardPage(QWidget):
 class MemberProfileDialog(QDialog):
     """Dialog showing a 360-degree member profile overview."""
 
+    SCORE_TITLE_QSS = "color: #7f8c8d; font-size: 10px; letter-spacing: 0.5px;"
+
     def __init__(self, db_path: str, member_data: dict, parent: Optional[QWidget] = None):
         super().__init__(parent)
         self.db_path = db_path
         self.member_data = member_data
         self._is_editing = False
         self._build_ui()
+        self.refresh_values()
 
     def _build_ui(self) -> None:
         self.setWindowTitle("Member 360 Profile")
@@ -435,11 +651,6 @@ class MemberProfileDialog(QDialog):
         avatar = QLabel()
         avatar.setFixedSize(72, 72)
         avatar.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        avatar_path = self.member_data.get('avatar_path') or str(Path(__file__).parent.parent.joinpath('assets', 'default_avatar.svg').as_posix())
-        avatar.setStyleSheet(
-            f"QLabel {{ border-radius: 36px; background-image: url('{avatar_path}'); "
-            "background-position: center; background-repeat: no-repeat; }}"
-        )
         self._avatar_label = avatar
         upload_btn = QPushButton("Upload Photo")
         upload_btn.setCursor(Qt.CursorShape.PointingHandCursor)
@@ -447,16 +658,15 @@ class MemberProfileDialog(QDialog):
         header.addWidget(avatar)
 
         header_text = QVBoxLayout()
-        name_label = QLabel(self.member_data.get("full_name", ""))
-        name_font = QFont("Arial", 16)
-        name_font.setBold(True)
-        name_label.setFont(name_font)
+        self.label_name = QLabel()
+        name_font = cached_font(16, bold=True)
+        self.label_name.setFont(name_font)
 
-        staff_label = QLabel(f"Staff ID: {self.member_data.get('staff_number', '')}")
-        staff_label.setStyleSheet("color: #7f8c8d; font-size: 12px;")
+        self.label_staff = QLabel()
+        self.label_staff.setStyleSheet("color: #7f8c8d; font-size: 12px;")
 
-        header_text.addWidget(name_label)
-        header_text.addWidget(staff_label)
+        header_text.addWidget(self.label_name)
+        header_text.addWidget(self.label_staff)
         header_text.addStretch()
         header.addLayout(header_text)
         header.addWidget(upload_btn)
@@ -474,14 +684,13 @@ class MemberProfileDialog(QDialog):
         identity_layout = QFormLayout(identity_frame)
         identity_layout.setLabelAlignment(Qt.AlignmentFlag.AlignLeft)
 
-        self.input_phone = QLineEdit(self.member_data.get("phone", ""))
+        self.input_phone = QLineEdit()
         self.input_phone.setReadOnly(True)
 
-        self.input_department = QLineEdit(self.member_data.get("department", ""))
+        self.input_department = QLineEdit()
         self.input_department.setReadOnly(True)
 
-        seniority = self._calculate_seniority(self.member_data.get("date_joined", ""))
-        self.label_seniority = QLabel(seniority)
+        self.label_seniority = QLabel()
         self.label_seniority.setStyleSheet(
             "QLabel { background-color: #ecf0f1; color: #2c3e50; padding: 4px 8px; "
             "border-radius: 10px; font-weight: bold; }"
@@ -498,10 +707,10 @@ class MemberProfileDialog(QDialog):
         bank_layout = QFormLayout(bank_frame)
         bank_layout.setLabelAlignment(Qt.AlignmentFlag.AlignLeft)
 
-        self.input_bank_name = QLineEdit(self.member_data.get("bank_name", ""))
+        self.input_bank_name = QLineEdit()
         self.input_bank_name.setReadOnly(True)
 
-        self.input_account_no = QLineEdit(self.member_data.get("account_no", ""))
+        self.input_account_no = QLineEdit()
         self.input_account_no.setReadOnly(True)
 
         bank_layout.addRow("Bank Name:", self.input_bank_name)
@@ -520,13 +729,12 @@ class MemberProfileDialog(QDialog):
         score_layout = QHBoxLayout(scoreboard)
         score_layout.setSpacing(18)
 
-        savings = float(self.member_data.get("current_savings", 0.0) or 0.0)
-        loans = float(self.member_data.get("total_loans", 0.0) or 0.0)
-        net = savings - loans
-
-        score_layout.addLayout(self._make_score_block("Total Savings", f"₦{savings:,.2f}", "#27ae60"))
-        score_layout.addLayout(self._make_score_block("Total Loans", f"₦{loans:,.2f}", "#e74c3c"))
-        score_layout.addLayout(self._make_score_block("Net Position", f"₦{net:,.2f}", "#34495e"))
+        block, self.label_savings = self._make_score_block("Total Savings", "#27ae60")
+        score_layout.addLayout(block)
+        block, self.label_loans = self._make_score_block("Total Loans", "#e74c3c")
+        score_layout.addLayout(block)
+        block, self.label_net = self._make_score_block("Net Position", "#34495e")
+        score_layout.addLayout(block)
 
         outer.addWidget(scoreboard)
 
@@ -555,30 +763,53 @@ class MemberProfileDialog(QDialog):
         action_row.addWidget(self.btn_export)
         outer.addLayout(action_row)
 
+    def refresh_values(self) -> None:
+        """Fill every field from member_data, leaving the widgets in place for reuse."""
+        data = self.member_data
+        self._set_avatar(data.get('avatar_path') or _DEFAULT_AVATAR)
+        self.label_name.setText(data.get("full_name", ""))
+        self.label_staff.setText(f"Staff ID: {data.get('staff_number', '')}")
+        self.input_phone.setText(data.get("phone", ""))
+        self.input_department.setText(data.get("department", ""))
+        self.label_seniority.setText(self._calculate_seniority(data.get("date_joined", "")))
+        self.input_bank_name.setText(data.get("bank_name", ""))
+        self.input_account_no.setText(data.get("account_no", ""))
+
+        savings = float(data.get("current_savings", 0.0) or 0.0)
+        loans = float(data.get("total_loans", 0.0) or 0.0)
+        self.label_savings.setText(_MONEY(savings))
+        self.label_loans.setText(_MONEY(loans))
+        self.label_net.setText(_MONEY(savings - loans))
+
+        self._is_editing = False
+        self.btn_edit.setText("Edit")
         self._set_editable(False)
 
-    def _make_score_block(self, title: str, value: str, color: str) -> QVBoxLayout:
+    def _set_avatar(self, path: str) -> None:
+        self._avatar_label.setPixmap(_avatar_pixmap(path, self._avatar_label.width()))
+
+    def _make_score_block(self, title: str, color: str) -> tuple:
+        """Return (QVBoxLayout block, QLabel value)."""
         block = QVBoxLayout()
         label_title = QLabel(title)
-        label_title.setStyleSheet("color: #7f8c8d; font-size: 10px; letter-spacing: 0.5px;")
+        label_title.setStyleSheet(self.SCORE_TITLE_QSS)
 
-        label_value = QLabel(value)
-        value_font = QFont("Arial", 14)
-        value_font.setBold(True)
+        label_value = QLabel()
+        value_font = cached_font(14, bold=True)
         label_value.setFont(value_font)
         label_value.setStyleSheet(f"color: {color};")
 
         block.addWidget(label_title)
         block.addWidget(label_value)
-        return block
+        return block, label_value
 
     def _calculate_seniority(self, date_joined: str) -> str:
-        try:
-            joined = date.fromisoformat(date_joined)
-        except Exception:
+        joined_ord = _join_date_ordinal(date_joined)
+        if joined_ord is None:
             return "Unknown"
 
-        years = (date.today() - joined).days / 365.25
+        # Whole years at 365.25 days each, in integer arithmetic
+        years = (date.today().toordinal() - joined_ord) * 4 // 1461
         if years < 1:
             return "0-1y"
         if years < 3:
@@ -672,17 +903,332 @@ class MemberProfileDialog(QDialog):
 
         # Update UI avatar
         self.member_data['avatar_path'] = rel_path
-        self._avatar_label.setStyleSheet(
-            f"QLabel {{ border-radius: 36px; background-image: url('{rel_path}'); background-position: center; background-repeat: no-repeat; }}"
+        # A new upload may overwrite the same file name, so drop any cached copy
+        QPixmapCache.remove(f"avatar:{self._avatar_label.width()}:{rel_path}")
+        self._set_avatar(rel_path)
+
+
+class MembersTableModel(QAbstractTableModel):
+    """Read-only model over the member dicts returned by get_members_summary."""
+
+    # (header, member key, formatter); text columns are shown as stored
+    COLUMNS = (
+        ("Staff Number", 'staff_number', None),
+        ("Full Name", 'full_name', None),
+        ("Phone", 'phone', None),
+        ("Current Savings", 'current_savings', lambda value: _MONEY(float(value or 0.0))),
+        ("Total Loans", 'total_loans', lambda value: _MONEY(float(value or 0.0))),
+    )
+    HEADERS = [header for header, _key, _fmt in COLUMNS]
+
+    SAVINGS_COLOUR = QColor("#2ecc71")
+    LOANS_COLOUR = QColor("#ff6f61")
+    AT_RISK_COLOUR = QColor("#f8d7da")
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._rows: List[Dict] = []
+        # One list of display strings per column, plus per-row flags, all
+        # formatted once in set_rows so data() is a pair of list indexes
+        self._columns: List[List[str]] = [[] for _ in self.COLUMNS]
+        self._loans_red: List[bool] = []
+        self._at_risk: List[bool] = []
+
+    def set_rows(self, members: List[Dict]) -> None:
+        if members == self._rows:
+            # Same rows as shown (e.g. a reload with no write in between):
+            # skip the reset so the selection and scroll position survive
+            return
+        self.beginResetModel()
+        rows = self._rows = list(members)
+        self._columns = [
+            [fmt(member.get(key)) for member in rows] if fmt
+            else [member.get(key, 'N/A') for member in rows]
+            for _header, key, fmt in self.COLUMNS
+        ]
+        flags = [self._row_flags(member) for member in rows]
+        self._loans_red = [loans_red for loans_red, _at_risk in flags]
+        self._at_risk = [at_risk for _loans_red, at_risk in flags]
+        self.endResetModel()
+
+    def prepend_row(self, member: Dict) -> None:
+        """Insert one member above the current rows (the listing is newest first)."""
+        self.beginInsertRows(QModelIndex(), 0, 0)
+        self._rows.insert(0, member)
+        for column, (_header, key, fmt) in zip(self._columns, self.COLUMNS):
+            column.insert(0, fmt(member.get(key)) if fmt else member.get(key, 'N/A'))
+        loans_red, at_risk = self._row_flags(member)
+        self._loans_red.insert(0, loans_red)
+        self._at_risk.insert(0, at_risk)
+        self.endInsertRows()
+
+    @staticmethod
+    def _row_flags(member: Dict) -> tuple:
+        """Return (highlight loans, row at risk) for one member."""
+        savings = float(member.get('current_savings', 0.0) or 0.0)
+        loans = float(member.get('total_loans', 0.0) or 0.0)
+        return (
+            member.get('active_loan_count', 0) > 0 and loans > 0,
+            loans > savings or member.get('default_loan_count', 0) > 0,
         )
 
+    def member_at(self, row: int) -> Optional[Dict]:
+        if 0 <= row < len(self._rows):
+            return self._rows[row]
+        return None
+
+    def rowCount(self, parent=QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self._rows)
+
+    def columnCount(self, parent=QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self.HEADERS)
+
+    def headerData(self, section, orientation, role=Qt.ItemDataRole.DisplayRole):
+        if role == Qt.ItemDataRole.DisplayRole and orientation == Qt.Orientation.Horizontal:
+            return self.HEADERS[section]
+        return None
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid():
+            return None
+        row = index.row()
+        col = index.column()
+
+        if role == Qt.ItemDataRole.DisplayRole:
+            return self._columns[col][row]
+
+        if role == Qt.ItemDataRole.TextAlignmentRole and col in (3, 4):
+            return Qt.AlignmentFlag.AlignRight
+
+        if role == Qt.ItemDataRole.ForegroundRole:
+            if col == 3:
+                return self.SAVINGS_COLOUR
+            if col == 4 and self._loans_red[row]:
+                return self.LOANS_COLOUR
+            return None
+
+        if role == Qt.ItemDataRole.BackgroundRole:
+            return self.AT_RISK_COLOUR if self._at_risk[row] else None
+
+        return None
+
+
+class SavingsTableModel(QAbstractTableModel):
+    """Read-only model over the transaction dicts returned by get_member_savings."""
+
+    HEADERS = ["Date", "Type", "Mode", "Amount", "Running Balance", "ID"]
+
+    TYPE_LABELS = {
+        "Lodgment": "Deposit (+)",
+        "Deduction": "Withdrawal (-)",
+    }
+    TYPE_COLOURS = {
+        "Lodgment": QColor("#2ecc71"),
+        "Deduction": QColor("#e74c3c"),
+    }
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        # Display strings per transaction, formatted once when the rows arrive,
+        # and the trans_type each row is coloured by
+        self._rows: List[tuple] = []
+        self._types: List[Optional[str]] = []
+        self._bold_font = QFont()
+        self._bold_font.setBold(True)
+
+    @classmethod
+    def _format(cls, item: Dict) -> tuple:
+        trans_type = str(item.get('trans_type', ''))
+        return (
+            str(item.get('trans_date', '')),
+            cls.TYPE_LABELS.get(trans_type, trans_type),
+            str(item.get('payment_mode', 'Salary Deduction')),
+            _MONEY(float(item.get('amount', 0.0))),
+            _MONEY(float(item.get('running_balance', 0.0))),
+            str(item.get('id', '')),
+        )
+
+    def set_rows(self, history: List[Dict]) -> None:
+        self.beginResetModel()
+        self._rows = [self._format(item) for item in history]
+        self._types = [item.get('trans_type') for item in history]
+        self.endResetModel()
+
+    def rowCount(self, parent=QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self._rows)
+
+    def columnCount(self, parent=QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self.HEADERS)
+
+    def headerData(self, section, orientation, role=Qt.ItemDataRole.DisplayRole):
+        if role == Qt.ItemDataRole.DisplayRole and orientation == Qt.Orientation.Horizontal:
+            return self.HEADERS[section]
+        return None
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid():
+            return None
+        row = index.row()
+        col = index.column()
+
+        if role == Qt.ItemDataRole.DisplayRole:
+            return self._rows[row][col]
+
+        if role == Qt.ItemDataRole.TextAlignmentRole and col in (3, 4):
+            return Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignVCenter
+
+        # Deposits and withdrawals are highlighted in the Type and Amount columns
+        if col in (1, 3):
+            colour = self.TYPE_COLOURS.get(self._types[row])
+            if colour is not None:
+                if role == Qt.ItemDataRole.ForegroundRole:
+                    return colour
+                if role == Qt.ItemDataRole.FontRole:
+                    return self._bold_font
+
+        return None
+
+
+class LoansTableModel(QAbstractTableModel):
+    """Read-only model over the loan dicts returned by get_member_loans."""
+
+    HEADERS = ["Loan ID", "Principal", "Interest Rate", "Status", "Date Issued"]
+
+    STATUS_COLOURS = {
+        'Active': QColor(Qt.GlobalColor.green),
+        'Closed': QColor(Qt.GlobalColor.blue),
+        'Default': QColor(Qt.GlobalColor.red),
+    }
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        # Display strings per loan, formatted once when the rows arrive
+        self._rows: List[tuple] = []
+
+    @staticmethod
+    def _format(loan: Dict) -> tuple:
+        return (
+            str(loan['loan_id']),
+            _MONEY(loan['principal']),
+            _RATE(loan['interest_rate']),
+            loan['status'],
+            str(loan['date_issued']),
+        )
+
+    def set_rows(self, loans: List[Dict]) -> None:
+        self.beginResetModel()
+        self._rows = [self._format(loan) for loan in loans]
+        self.endResetModel()
+
+    def append_rows(self, loans: List[Dict]) -> None:
+        """Add a further page of loans below the existing rows."""
+        if not loans:
+            return
+        first = len(self._rows)
+        self.beginInsertRows(QModelIndex(), first, first + len(loans) - 1)
+        self._rows.extend(self._format(loan) for loan in loans)
+        self.endInsertRows()
+
+    def rowCount(self, parent=QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self._rows)
+
+    def columnCount(self, parent=QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self.HEADERS)
+
+    def headerData(self, section, orientation, role=Qt.ItemDataRole.DisplayRole):
+        if role == Qt.ItemDataRole.DisplayRole and orientation == Qt.Orientation.Horizontal:
+            return self.HEADERS[section]
+        return None
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid():
+            return None
+        row = self._rows[index.row()]
+        col = index.column()
+
+        if role == Qt.ItemDataRole.DisplayRole:
+            return row[col]
+
+        if role == Qt.ItemDataRole.TextAlignmentRole:
+            if col == 1:
+                return Qt.AlignmentFlag.AlignRight
+            if col == 2:
+                return Qt.AlignmentFlag.AlignCenter
+            return None
+
+        if role == Qt.ItemDataRole.ForegroundRole and col == 3:
+            return self.STATUS_COLOURS.get(row[3])
+
+        return None
+
+
+class ScheduleTableModel(QAbstractTableModel):
+    """Read-only model over the preformatted rows from _cached_schedule."""
+
+    HEADERS = ["Month", "Principal", "Interest", "Total", "Remaining"]
+
+    def __init__(self, rows: tuple, parent=None):
+        super().__init__(parent)
+        self._rows = rows
+
+    def rowCount(self, parent=QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self._rows)
+
+    def columnCount(self, parent=QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self.HEADERS)
+
+    def headerData(self, section, orientation, role=Qt.ItemDataRole.DisplayRole):
+        if role == Qt.ItemDataRole.DisplayRole and orientation == Qt.Orientation.Horizontal:
+            return self.HEADERS[section]
+        return None
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid():
+            return None
+        if role == Qt.ItemDataRole.DisplayRole:
+            return self._rows[index.row()][index.column()]
+        if role == Qt.ItemDataRole.TextAlignmentRole and index.column() > 0:
+            return Qt.AlignmentFlag.AlignRight
+        return None
+
 
 class MembersPage(QWidget):
     """Page for Members management with registration form and member table."""
+
+    # Maximum rows returned by a members search
+    SEARCH_LIMIT = 200
+    # Members shown per page of the unfiltered listing
+    PAGE_SIZE = 100
+    # Seconds a fetched member profile may be reused when nothing has changed
+    PROFILE_CACHE_TTL = 30.0
+    # Seconds a fetched listing page may be reused when nothing has changed
+    LIST_CACHE_TTL = 60.0
+
+    # Registration form fields, styled by one sheet on their group box
+    FORM_QSS = "QLineEdit#lightInput { background-color: #ffffff; color: #2c3e50; }"
     
     def __init__(self, db_path: str = "swiftledger.db"):
         super().__init__()
         self.db_path = db_path
+        # Current page of the listing, shown again whenever the search box is cleared
+        self._all_members = []
+        self._page = 0
+        self._has_next_page = False
+        # One profile dialog, built on first use and refilled for each member
+        self._profile_dialog: Optional[MemberProfileDialog] = None
+        # Last search and its results, narrowed in memory while the term grows;
+        # _search_complete is True only when they hold every substring match
+        self._search_term = ""
+        self._search_results: Optional[List[Dict]] = None
+        self._search_keys: List[str] = []
+        self._search_complete = False
+        # Background fetch of the listing; a reload asked for meanwhile is queued
+        self._load_worker = None
+        self._reload_pending = False
+        # Background insert for the registration form
+        self._register_worker = None
+        # Delete confirmation, built on first use and reused afterwards
+        self._confirm_box: Optional[QMessageBox] = None
         
         # Create main layout
         main_layout = QVBoxLayout(self)
@@ -691,16 +1237,16 @@ class MembersPage(QWidget):
         
         # Title
         title = QLabel("Members Management")
-        title_font = QFont("Arial", 18)
-        title_font.setBold(True)
+        title_font = cached_font(18, bold=True)
         title.setFont(title_font)
         main_layout.addWidget(title)
         
         # Registration Form Group
         form_group = QGroupBox("Register New Member")
-        form_font = QFont("Arial", 10)
-        form_font.setBold(True)
+        form_font = cached_font(10, bold=True)
         form_group.setFont(form_font)
+        # One sheet styles every "lightInput" field below
+        form_group.setStyleSheet(self.FORM_QSS)
         form_layout = QFormLayout()
         
         # Staff Number input
@@ -717,34 +1263,34 @@ class MembersPage(QWidget):
         self.input_phone = QLineEdit()
         self.input_phone.setPlaceholderText("e.g., +2348012345678")
         self.input_phone.setText("+234")
-        self.input_phone.setStyleSheet("QLineEdit { background-color: #ffffff; color: #2c3e50; }")
+        self.input_phone.setObjectName("lightInput")
         form_layout.addRow("Phone Number:", self.input_phone)
 
         # Bank Name input
         self.input_bank_name = QLineEdit()
         self.input_bank_name.setPlaceholderText("e.g., UBA")
         self.input_bank_name.setText("UBA")
-        self.input_bank_name.setStyleSheet("QLineEdit { background-color: #ffffff; color: #2c3e50; }")
+        self.input_bank_name.setObjectName("lightInput")
         form_layout.addRow("Bank Name:", self.input_bank_name)
 
         # Account Number input
         self.input_account_no = QLineEdit()
         self.input_account_no.setPlaceholderText("e.g., 0123456789")
-        self.input_account_no.setStyleSheet("QLineEdit { background-color: #ffffff; color: #2c3e50; }")
+        self.input_account_no.setObjectName("lightInput")
         form_layout.addRow("Account Number:", self.input_account_no)
 
         # Department input
         self.input_department = QLineEdit()
         self.input_department.setPlaceholderText("e.g., SLT")
         self.input_department.setText("SLT")
-        self.input_department.setStyleSheet("QLineEdit { background-color: #ffffff; color: #2c3e50; }")
+        self.input_department.setObjectName("lightInput")
         form_layout.addRow("Department:", self.input_department)
 
         # Date Joined input
         self.input_date_joined = QLineEdit()
         self.input_date_joined.setPlaceholderText("YYYY-MM-DD")
         self.input_date_joined.setText(date.today().isoformat())
-        self.input_date_joined.setStyleSheet("QLineEdit { background-color: #ffffff; color: #2c3e50; }")
+        self.input_date_joined.setObjectName("lightInput")
         form_layout.addRow("Date Joined:", self.input_date_joined)
 
         form_group.setLayout(form_layout)
@@ -752,8 +1298,7 @@ class MembersPage(QWidget):
         
         # Register button
         button_layout = QHBoxLayout()
-        btn_font = QFont("Arial", 10)
-        btn_font.setBold(True)
+        btn_font = cached_font(10, bold=True)
 
         self.btn_download_template = QPushButton("Download Template")
         self.btn_download_template.setMinimumHeight(40)
@@ -782,59 +1327,66 @@ class MembersPage(QWidget):
         self.btn_register = QPushButton("Register Member")
         self.btn_register.setMinimumHeight(40)
         self.btn_register.setFont(btn_font)
-        self.btn_register.setStyleSheet("""
-            QPushButton {
-                background-color: #27ae60;
-                color: white;
-                border: none;
-                border-radius: 5px;
-                padding: 10px;
-            }
-            QPushButton:hover {
-                background-color: #2ecc71;
-            }
-            QPushButton:pressed {
-                background-color: #229954;
-            }
-        """)
+        # Styled by the application-wide QPushButton#successBtn rule
+        self.btn_register.setObjectName("successBtn")
         self.btn_register.clicked.connect(self.register_member)
         button_layout.addWidget(self.btn_register, 0, Qt.AlignmentFlag.AlignRight)
         main_layout.addLayout(button_layout)
         
         # Members Table
         table_title = QLabel("All Members")
-        table_font = QFont("Arial", 12)
-        table_font.setBold(True)
+        table_font = cached_font(12, bold=True)
         table_title.setFont(table_font)
         main_layout.addWidget(table_title)
 
         search_row = QHBoxLayout()
         self.input_member_search = QLineEdit()
         self.input_member_search.setPlaceholderText("Search by name, staff ID, or phone")
-        self.input_member_search.textChanged.connect(self._filter_members_table)
+        # Filter once typing pauses rather than on every keystroke
+        self._filter_timer = QTimer(self)
+        self._filter_timer.setSingleShot(True)
+        self._filter_timer.setInterval(120)
+        self._filter_timer.timeout.connect(self._apply_member_search)
+        self.input_member_search.textChanged.connect(lambda _text: self._filter_timer.start())
+        self.input_member_search.returnPressed.connect(self._search_now)
         search_row.addWidget(self.input_member_search)
         main_layout.addLayout(search_row)
         
-        self.table_members = QTableWidget()
-        self.table_members.setColumnCount(6)
-        self.table_members.setHorizontalHeaderLabels([
-            "Staff Number", "Full Name", "Phone", "Current Savings", "Total Loans", "ID"
-        ])
+        # Model/view table: cells are formatted on demand for visible rows only
+        self.members_model = MembersTableModel(self)
+
+        self.table_members = QTableView()
+        self.table_members.setModel(self.members_model)
         self.table_members.setSelectionBehavior(QAbstractItemView.SelectionBehavior.SelectRows)
+        self.table_members.setSelectionMode(QAbstractItemView.SelectionMode.SingleSelection)
         self.table_members.setEditTriggers(QAbstractItemView.EditTrigger.NoEditTriggers)
         self.table_members.horizontalHeader().setStretchLastSection(True)
         # Ensure headers fit and columns size proportionally
         self.table_members.horizontalHeader().setSectionResizeMode(QHeaderView.ResizeMode.Stretch)
-        self.table_members.setColumnHidden(5, True)  # Hide member_id column
-        self.table_members.cellDoubleClicked.connect(self._open_member_profile)
+        # Fixed row heights keep painting limited to the visible rows
+        self.table_members.verticalHeader().setSectionResizeMode(QHeaderView.ResizeMode.Fixed)
+        self.table_members.verticalHeader().setDefaultSectionSize(24)
+        self.table_members.setWordWrap(False)
+        self.table_members.doubleClicked.connect(self._open_member_profile)
         main_layout.addWidget(self.table_members)
 
-        # Delete button
+        # Page navigation and delete button
         del_row = QHBoxLayout()
+        self.btn_prev_page = QPushButton("◀  Prev")
+        self.btn_prev_page.setMinimumHeight(32)
+        self.btn_prev_page.clicked.connect(lambda: self._go_to_page(self._page - 1))
+        self.lbl_page = QLabel("Page 1")
+        self.lbl_page.setFont(cached_font(10))
+        self.btn_next_page = QPushButton("Next  ▶")
+        self.btn_next_page.setMinimumHeight(32)
+        self.btn_next_page.clicked.connect(lambda: self._go_to_page(self._page + 1))
+        del_row.addWidget(self.btn_prev_page)
+        del_row.addWidget(self.lbl_page)
+        del_row.addWidget(self.btn_next_page)
         del_row.addStretch()
         self.btn_delete = QPushButton("Delete Selected Member")
         self.btn_delete.setMinimumHeight(36)
-        self.btn_delete.setFont(QFont("Arial", 10))
+        self.btn_delete.setFont(cached_font(10))
         self.btn_delete.setStyleSheet(
             "QPushButton { background-color: #c0392b; color: white; "
             "border-radius: 5px; padding: 8px 16px; font-weight: bold; } "
@@ -859,6 +1411,14 @@ class MembersPage(QWidget):
         if not staff_number or not full_name:
             QMessageBox.warning(self, "Invalid Input", "Please fill in all required fields.")
             return
+
+        if not BulkDataManager.STAFF_ID_RE.match(staff_number):
+            QMessageBox.warning(
+                self, "Invalid Input",
+                "Staff Number may only contain letters and digits, optionally "
+                "separated by '/' or '-' (e.g. EMP001).",
+            )
+            return
         
         # Prepare member data
         member_data = {
@@ -871,17 +1431,45 @@ class MembersPage(QWidget):
             'date_joined': self.input_date_joined.text().strip(),
         }
         
-        # Add member to database
-        success, message = add_member(self.db_path, member_data)
-        
-        if success:
-            QMessageBox.information(self, "Success", message)
+        # Add member to database on a worker; the button stays disabled until
+        # it finishes so a double click cannot submit the form twice
+        self.btn_register.setEnabled(False)
+        self._register_worker = run_in_background(
+            _register_member_data, self.db_path, member_data,
+            on_finished=self._on_register_done,
+            on_failed=self._on_register_failed,
+        )
+
+    def _on_register_done(self, result: Dict) -> None:
+        self._register_worker = None
+        self.btn_register.setEnabled(True)
+        if result['ok']:
+            self._show_new_member(result['member'])
+            QMessageBox.information(self, "Success", result['message'])
             # Clear inputs
             self._reset_registration_form()
-            # Refresh table
-            self.load_data()
         else:
-            QMessageBox.critical(self, "Error", message)
+            QMessageBox.critical(self, "Error", result['message'])
+
+    def _show_new_member(self, member: Optional[Dict]) -> None:
+        """Add a just-registered member to the top of the listing, reloading only if needed."""
+        if (
+            member is None
+            or self._page != 0
+            or self._load_worker is not None
+            or self.input_member_search.text().strip()
+            or len(self._all_members) >= self.PAGE_SIZE
+        ):
+            # Off the first page, filtered, or the page would overflow
+            self.load_data()
+            return
+        self._all_members.insert(0, member)
+        self.members_model.prepend_row(member)
+
+    def _on_register_failed(self, error: str) -> None:
+        self._register_worker = None
+        self.btn_register.setEnabled(True)
+        QMessageBox.critical(self, "Error", f"Failed to register member: {error}")
 
     def _download_import_template(self) -> None:
         path, _ = QFileDialog.getSaveFileName(
@@ -940,84 +1528,82 @@ class MembersPage(QWidget):
         dialog.exec()
     
     def load_data(self) -> None:
-        """Load and display all members in the table."""
-        
-        try:
-            success, members = get_all_members(self.db_path)
-            
-            if not success or not members:
-                self.table_members.setRowCount(0)
-                return
-            
-            # Clear existing rows
-            self.table_members.setRowCount(0)
-            
-            # Populate table
-            for row_idx, member in enumerate(members):
-                self.table_members.insertRow(row_idx)
-                
-                # Staff Number
-                staff_num_item = QTableWidgetItem(member.get('staff_number', 'N/A'))
-                self.table_members.setItem(row_idx, 0, staff_num_item)
-                
-                # Full Name
-                name_item = QTableWidgetItem(member.get('full_name', 'N/A'))
-                self.table_members.setItem(row_idx, 1, name_item)
-                
-                # Phone
-                phone_item = QTableWidgetItem(member.get('phone', 'N/A'))
-                self.table_members.setItem(row_idx, 2, phone_item)
-
-                # Current Savings
-                savings = float(member.get('current_savings', 0.0) or 0.0)
-                savings_item = QTableWidgetItem(f"₦{savings:,.2f}")
-                savings_item.setTextAlignment(Qt.AlignmentFlag.AlignRight)
-                savings_item.setForeground(QBrush(QColor("#2ecc71")))
-                self.table_members.setItem(row_idx, 3, savings_item)
-
-                # Total Loans
-                loans = float(member.get('total_loans', 0.0) or 0.0)
-                loans_item = QTableWidgetItem(f"₦{loans:,.2f}")
-                loans_item.setTextAlignment(Qt.AlignmentFlag.AlignRight)
-                if member.get('active_loan_count', 0) > 0 and loans > 0:
-                    loans_item.setForeground(QBrush(QColor("#ff6f61")))
-                self.table_members.setItem(row_idx, 4, loans_item)
-
-                # Hidden member_id
-                id_item = QTableWidgetItem(str(member.get('member_id', '')))
-                self.table_members.setItem(row_idx, 5, id_item)
-
-                if loans > savings or member.get('default_loan_count', 0) > 0:
-                    self._tint_member_row(row_idx, QColor("#f8d7da"))
-
-            self._filter_members_table(self.input_member_search.text())
-        
-        except Exception as e:
-            QMessageBox.critical(self, "Error", f"Failed to load members: {str(e)}")
+        """Fetch the current page of members on a worker thread."""
+        if self._load_worker is not None:
+            self._reload_pending = True
+            return
+
+        self.lbl_page.setText("Loading…")
+        # One extra row tells us whether a next page exists. Revisiting a page
+        # reuses the cached rows until a write to the database invalidates them.
+        self._load_worker = run_in_background(
+            cached_call, get_members_summary, self.db_path,
+            self.PAGE_SIZE + 1, self._page * self.PAGE_SIZE,
+            ttl=self.LIST_CACHE_TTL,
+            on_finished=self._on_members_loaded,
+            on_failed=self._on_members_load_failed,
+        )
+
+    def _on_members_loaded(self, result: tuple) -> None:
+        self._load_worker = None
+        if self._reload_pending:
+            self._reload_pending = False
+            self.load_data()
+            return
+
+        success, members = result
+        members = members if success and members else []
+        if not members and self._page > 0:
+            # The page emptied out (e.g. after a deletion); step back
+            self._page -= 1
+            self.load_data()
+            return
+        self._has_next_page = len(members) > self.PAGE_SIZE
+        self._all_members = members[:self.PAGE_SIZE]
+        self._search_results = None
+        self._apply_member_search()
+
+    def _on_members_load_failed(self, error: str) -> None:
+        self._load_worker = None
+        self._reload_pending = False
+        self._update_pager(bool(self.input_member_search.text().strip()))
+        QMessageBox.critical(self, "Error", f"Failed to load members: {error}")
+
+    def _go_to_page(self, page: int) -> None:
+        if page < 0 or (page > self._page and not self._has_next_page):
+            return
+        self._page = page
+        self.load_data()
+
+    def _update_pager(self, searching: bool) -> None:
+        """Enable page navigation only while the unfiltered listing is shown."""
+        self.btn_prev_page.setEnabled(not searching and self._page > 0)
+        self.btn_next_page.setEnabled(not searching and self._has_next_page)
+        self.lbl_page.setText("Search results" if searching else f"Page {self._page + 1}")
+
+    def _selected_member(self) -> Optional[Dict]:
+        index = self.table_members.currentIndex()
+        if not index.isValid():
+            return None
+        return self.members_model.member_at(index.row())
 
     def _delete_selected_member(self) -> None:
         """Delete the currently selected member after confirmation."""
-        row = self.table_members.currentRow()
-        if row < 0:
+        member = self._selected_member()
+        if member is None:
             QMessageBox.warning(self, "No Selection", "Select a member row first.")
             return
 
-        id_item = self.table_members.item(row, 5)
-        name_item = self.table_members.item(row, 1)
-        if not id_item:
-            return
-
-        member_id = int(id_item.text())
-        member_name = name_item.text() if name_item else "Unknown"
+        member_id = int(member['member_id'])
+        member_name = member.get('full_name') or "Unknown"
 
-        reply = QMessageBox.question(
-            self, "Confirm Deletion",
+        box = self._confirm_delete_box()
+        box.setText(
             f"Delete member '{member_name}' and ALL related transactions/loans?\n\n"
-            "This action cannot be undone.",
-            QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No,
-            QMessageBox.StandardButton.No,
+            "This action cannot be undone."
         )
-        if reply != QMessageBox.StandardButton.Yes:
+        box.exec()
+        if box.standardButton(box.clickedButton()) != QMessageBox.StandardButton.Yes:
             return
 
         ok, msg = delete_member(self.db_path, member_id)
@@ -1027,6 +1613,16 @@ class MembersPage(QWidget):
         else:
             QMessageBox.critical(self, "Error", msg)
 
+    def _confirm_delete_box(self) -> QMessageBox:
+        if self._confirm_box is None:
+            box = QMessageBox(self)
+            box.setIcon(QMessageBox.Icon.Question)
+            box.setWindowTitle("Confirm Deletion")
+            box.setStandardButtons(QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No)
+            box.setDefaultButton(QMessageBox.StandardButton.No)
+            self._confirm_box = box
+        return self._confirm_box
+
     def _reset_registration_form(self) -> None:
         self.input_staff_number.clear()
         self.input_full_name.clear()
@@ -1036,42 +1632,74 @@ class MembersPage(QWidget):
         self.input_department.setText("SLT")
         self.input_date_joined.setText(date.today().isoformat())
 
-    def _tint_member_row(self, row_idx: int, color: QColor) -> None:
-        for col in range(self.table_members.columnCount()):
-            item = self.table_members.item(row_idx, col)
-            if item:
-                item.setBackground(QBrush(color))
-
-    def _filter_members_table(self, text: str) -> None:
-        query = (text or "").lower()
-        for row in range(self.table_members.rowCount()):
-            staff_item = self.table_members.item(row, 0)
-            name_item = self.table_members.item(row, 1)
-            phone_item = self.table_members.item(row, 2)
-
-            staff_text = staff_item.text().lower() if staff_item else ""
-            name_text = name_item.text().lower() if name_item else ""
-            phone_text = phone_item.text().lower() if phone_item else ""
+    def _search_now(self) -> None:
+        """Run a pending search immediately when Enter is pressed."""
+        self._filter_timer.stop()
+        self._apply_member_search()
 
-            match = query in staff_text or query in name_text or query in phone_text
-            self.table_members.setRowHidden(row, not match)
+    def _apply_member_search(self) -> None:
+        self._filter_members_table(self.input_member_search.text())
 
-    def _open_member_profile(self, row: int, column: int) -> None:
-        id_item = self.table_members.item(row, 5)
-        if not id_item:
+    def _filter_members_table(self, text: str) -> None:
+        """Show the cached full list, or an indexed SQLite search for *text*."""
+        term = text.strip()
+        self._update_pager(bool(term))
+        if not term:
+            self._search_results = None
+            self.members_model.set_rows(self._all_members)
             return
 
-        try:
-            member_id = int(id_item.text())
-        except ValueError:
+        needle = term.lower()
+        if (
+            self._search_results is not None
+            and self._search_complete
+            and needle.startswith(self._search_term)
+        ):
+            # The previous results were complete and every new match is among them
+            kept = [
+                (member, key)
+                for member, key in zip(self._search_results, self._search_keys)
+                if needle in key
+            ]
+            members = [member for member, _ in kept]
+            keys = [key for _, key in kept]
+            complete = True
+        else:
+            success, members = search_members(self.db_path, term, self.SEARCH_LIMIT)
+            members = members if success else []
+            # Under the limit, the query returned every substring match
+            complete = success and len(members) < self.SEARCH_LIMIT
+            keys = [
+                "\x1f".join(
+                    str(member.get(field) or "") for field in ('staff_number', 'full_name', 'phone')
+                ).lower()
+                for member in members
+            ]
+
+        self._search_term = needle
+        self._search_results = members
+        self._search_keys = keys
+        self._search_complete = complete
+        self.members_model.set_rows(members)
+
+    def _open_member_profile(self, index: QModelIndex) -> None:
+        row_member = self.members_model.member_at(index.row())
+        if row_member is None:
             return
 
-        ok, member = get_member_by_id(self.db_path, member_id)
+        member_id = int(row_member['member_id'])
+        # Reopening a profile reuses the fetched row until anything is written
+        ok, member = cached_call(get_member_by_id, self.db_path, member_id, ttl=self.PROFILE_CACHE_TTL)
         if not ok or not member:
             QMessageBox.warning(self, "Not Found", "Unable to load member profile.")
             return
 
-        dialog = MemberProfileDialog(self.db_path, member, self)
+        dialog = self._profile_dialog
+        if dialog is None:
+            dialog = self._profile_dialog = MemberProfileDialog(self.db_path, member, self)
+        else:
+            dialog.member_data = member
+            dialog.refresh_values()
         dialog.exec()
 
 
@@ -1083,7 +1711,7 @@ class ImportErrorDialog(QDialog):
 
         main = QVBoxLayout(self)
         summary = QLabel(f"Imported {success_count} members. Skipped {len(errors)} rows.")
-        summary.setFont(QFont("Arial", 11))
+        summary.setFont(cached_font(11))
         main.addWidget(summary)
 
         self.text_area = QTextEdit()
@@ -1135,12 +1763,21 @@ class ImportErrorDialog(QDialog):
 
 class SavingsPage(QWidget):
     """Page for Savings management with search, transaction form, and history."""
+
+    # Seconds a staff-number lookup may be reused when nothing has changed
+    MEMBER_CACHE_TTL = 60.0
     
     def __init__(self, db_path: str = "swiftledger.db"):
         super().__init__()
         self.db_path = db_path
         self.current_member_id = None
         self.current_member_name = None
+        # Background savings fetch; a reload asked for meanwhile is queued
+        self._savings_worker = None
+        self._savings_reload_pending = False
+        # In-flight member lookup and posting; their buttons stay disabled meanwhile
+        self._search_worker = None
+        self._post_worker = None
         
         # Create main layout
         main_layout = QVBoxLayout(self)
@@ -1149,15 +1786,13 @@ class SavingsPage(QWidget):
         
         # Title
         title = QLabel("Savings Management")
-        title_font = QFont("Arial", 18)
-        title_font.setBold(True)
+        title_font = cached_font(18, bold=True)
         title.setFont(title_font)
         main_layout.addWidget(title)
         
         # Search Section
         search_group = QGroupBox("Find Member")
-        search_font = QFont("Arial", 10)
-        search_font.setBold(True)
+        search_font = cached_font(10, bold=True)
         search_group.setFont(search_font)
         search_layout = QHBoxLayout()
         
@@ -1177,18 +1812,16 @@ class SavingsPage(QWidget):
         
         # Member Info Section
         info_group = QGroupBox("Member Information")
-        info_font = QFont("Arial", 10)
-        info_font.setBold(True)
+        info_font = cached_font(10, bold=True)
         info_group.setFont(info_font)
         info_layout = QHBoxLayout()
         
         self.label_member_name = QLabel("Name: Not Selected")
-        self.label_member_name.setFont(QFont("Arial", 11))
+        self.label_member_name.setFont(cached_font(11))
         
         self.label_total_savings = QLabel("Total Savings: ₦0.00")
-        self.label_total_savings.setFont(QFont("Arial", 11))
-        savings_font = QFont("Arial", 11)
-        savings_font.setBold(True)
+        self.label_total_savings.setFont(cached_font(11))
+        savings_font = cached_font(11, bold=True)
         self.label_total_savings.setFont(savings_font)
         
         info_layout.addWidget(self.label_member_name)
@@ -1199,8 +1832,7 @@ class SavingsPage(QWidget):
         
         # Transaction Form Section
         form_group = QGroupBox("Post New Transaction")
-        form_font = QFont("Arial", 10)
-        form_font.setBold(True)
+        form_font = cached_font(10, bold=True)
         form_group.setFont(form_font)
         form_layout = QFormLayout()
         
@@ -1238,27 +1870,9 @@ class SavingsPage(QWidget):
         button_layout = QHBoxLayout()
         self.btn_post = QPushButton("Post Saving")
         self.btn_post.setMinimumHeight(40)
-        btn_font = QFont("Arial", 10)
-        btn_font.setBold(True)
+        btn_font = cached_font(10, bold=True)
         self.btn_post.setFont(btn_font)
-        self.btn_post.setStyleSheet("""
-            QPushButton {
-                background-color: #27ae60;
-                color: white;
-                border: none;
-                border-radius: 5px;
-                padding: 10px;
-            }
-            QPushButton:hover {
-                background-color: #2ecc71;
-            }
-            QPushButton:pressed {
-                background-color: #229954;
-            }
-            QPushButton:disabled {
-                background-color: #888888;
-            }
-        """)
+        self.btn_post.setObjectName("successBtn")
         self.btn_post.clicked.connect(self.post_saving)
         self.btn_post.setEnabled(False)
         button_layout.addStretch()
@@ -1267,20 +1881,21 @@ class SavingsPage(QWidget):
         
         # Savings History Table
         history_title = QLabel("Transaction History (Last 10)")
-        history_font = QFont("Arial", 12)
-        history_font.setBold(True)
+        history_font = cached_font(12, bold=True)
         history_title.setFont(history_font)
         main_layout.addWidget(history_title)
         
-        self.table_savings = QTableWidget()
-        self.table_savings.setColumnCount(6)
-        self.table_savings.setHorizontalHeaderLabels([
-            "Date", "Type", "Mode", "Amount", "Running Balance", "ID"
-        ])
+        self.savings_model = SavingsTableModel(self)
+        self.table_savings = QTableView()
+        self.table_savings.setModel(self.savings_model)
         self.table_savings.setSelectionBehavior(QAbstractItemView.SelectionBehavior.SelectRows)
         self.table_savings.setEditTriggers(QAbstractItemView.EditTrigger.NoEditTriggers)
         self.table_savings.horizontalHeader().setStretchLastSection(True)
         self.table_savings.setColumnHidden(5, True)  # Hide ID column
+        # Fixed row heights keep painting limited to the visible rows
+        self.table_savings.verticalHeader().setSectionResizeMode(QHeaderView.ResizeMode.Fixed)
+        self.table_savings.verticalHeader().setDefaultSectionSize(24)
+        self.table_savings.setWordWrap(False)
         main_layout.addWidget(self.table_savings)
         
         self.setLayout(main_layout)
@@ -1294,8 +1909,20 @@ class SavingsPage(QWidget):
             QMessageBox.warning(self, "Invalid Input", "Please enter a staff number.")
             return
         
-        # Search for member
-        success, member = get_member_by_staff_number(self.db_path, staff_number)
+        # Search for member on a worker; re-searching the same staff number
+        # reuses the cached row until the database changes
+        self.btn_search.setEnabled(False)
+        self._search_worker = run_in_background(
+            cached_call, get_member_by_staff_number, self.db_path, staff_number,
+            ttl=self.MEMBER_CACHE_TTL,
+            on_finished=lambda result: self._on_member_found(staff_number, result),
+            on_failed=self._on_member_search_failed,
+        )
+
+    def _on_member_found(self, staff_number: str, result: tuple) -> None:
+        self._search_worker = None
+        self.btn_search.setEnabled(True)
+        success, member = result
         
         if not success or not member:
             QMessageBox.warning(self, "Not Found", f"No member found with staff number '{staff_number}'.")
@@ -1303,7 +1930,7 @@ class SavingsPage(QWidget):
             self.current_member_name = None
             self.label_member_name.setText("Name: Not Selected")
             self.label_total_savings.setText("Total Savings: ₦0.00")
-            self.table_savings.setRowCount(0)
+            self.savings_model.set_rows([])
             self.btn_post.setEnabled(False)
             return
         
@@ -1321,66 +1948,55 @@ class SavingsPage(QWidget):
         self.btn_post.setEnabled(True)
         
         QMessageBox.information(self, "Success", f"Member found: {member['full_name']}")
+
+    def _on_member_search_failed(self, error: str) -> None:
+        self._search_worker = None
+        self.btn_search.setEnabled(True)
+        QMessageBox.critical(self, "Error", f"Member search failed: {error}")
     
     def load_savings_data(self) -> None:
-        """Load and display current savings balance for the member."""
+        """Fetch the member's savings balance and history on a worker thread."""
 
         if not self.current_member_id:
             return
+        if self._savings_worker is not None:
+            self._savings_reload_pending = True
+            return
 
-        try:
-            success, total_savings = get_total_savings(self.db_path, self.current_member_id)
-            if not success:
-                QMessageBox.critical(self, "Error", "Failed to load savings data.")
-                return
-
-            history_ok, history = get_member_savings(self.db_path, self.current_member_id)
-            if not history_ok:
-                QMessageBox.critical(self, "Error", "Failed to load savings history.")
-                return
-
-            self.table_savings.setRowCount(0)
-            for row_idx, item in enumerate(history):
-                self.table_savings.insertRow(row_idx)
-
-                date_item = QTableWidgetItem(str(item.get('trans_date', '')))
-                type_label = self._format_savings_type(str(item.get('trans_type', '')))
-                mode_item = QTableWidgetItem(str(item.get('payment_mode', 'Salary Deduction')))
-                type_item = QTableWidgetItem(type_label)
-                amount_item = QTableWidgetItem(f"₦{float(item.get('amount', 0.0)):,.2f}")
-                balance_item = QTableWidgetItem(f"₦{float(item.get('running_balance', 0.0)):,.2f}")
-                id_item = QTableWidgetItem(str(item.get('id', '')))
-
-                trans_type = str(item.get('trans_type', ''))
-                if trans_type == "Lodgment":
-                    color = QColor("#2ecc71")
-                elif trans_type == "Deduction":
-                    color = QColor("#e74c3c")
-                else:
-                    color = None
-
-                if color:
-                    bold_font = type_item.font()
-                    bold_font.setBold(True)
-                    type_item.setFont(bold_font)
-                    amount_item.setFont(bold_font)
-                    type_item.setForeground(QBrush(color))
-                    amount_item.setForeground(QBrush(color))
-
-                amount_item.setTextAlignment(Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignVCenter)
-                balance_item.setTextAlignment(Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignVCenter)
-
-                self.table_savings.setItem(row_idx, 0, date_item)
-                self.table_savings.setItem(row_idx, 1, type_item)
-                self.table_savings.setItem(row_idx, 2, mode_item)
-                self.table_savings.setItem(row_idx, 3, amount_item)
-                self.table_savings.setItem(row_idx, 4, balance_item)
-                self.table_savings.setItem(row_idx, 5, id_item)
-
-            self.label_total_savings.setText(f"Total Savings: ₦{total_savings:,.2f}")
+        self._savings_worker = run_in_background(
+            _load_savings_data, self.db_path, self.current_member_id,
+            on_finished=self._on_savings_loaded,
+            on_failed=self._on_savings_load_failed,
+        )
 
-        except Exception as e:
-            QMessageBox.critical(self, "Error", f"Failed to load savings: {str(e)}")
+    def _on_savings_loaded(self, payload: Dict) -> None:
+        self._savings_worker = None
+        if self._savings_reload_pending:
+            # Superseded by a later request (a new post or another member)
+            self._savings_reload_pending = False
+            self.load_savings_data()
+            return
+        if payload['member_id'] != self.current_member_id:
+            # The selection changed while this was loading
+            return
+
+        success, total_savings = payload['total']
+        if not success:
+            QMessageBox.critical(self, "Error", "Failed to load savings data.")
+            return
+
+        history_ok, history = payload['history']
+        if not history_ok:
+            QMessageBox.critical(self, "Error", "Failed to load savings history.")
+            return
+
+        self.savings_model.set_rows(history)
+        self.label_total_savings.setText("Total Savings: " + _MONEY(total_savings))
+
+    def _on_savings_load_failed(self, error: str) -> None:
+        self._savings_worker = None
+        self._savings_reload_pending = False
+        QMessageBox.critical(self, "Error", f"Failed to load savings: {error}")
     
     def post_saving(self) -> None:
         """Post a new savings transaction."""
@@ -1397,14 +2013,23 @@ class SavingsPage(QWidget):
             QMessageBox.warning(self, "Invalid Input", "Amount must be greater than 0.")
             return
         
-        # Add saving to database
-        success, message = add_saving(
+        # Add saving to database on a worker
+        self.btn_post.setEnabled(False)
+        self._post_worker = run_in_background(
+            add_saving,
             self.db_path,
             self.current_member_id,
             amount,
             trans_type,
             payment_mode,
+            on_finished=self._on_saving_posted,
+            on_failed=self._on_saving_post_failed,
         )
+
+    def _on_saving_posted(self, result: tuple) -> None:
+        self._post_worker = None
+        self.btn_post.setEnabled(self.current_member_id is not None)
+        success, message = result
         
         if success:
             QMessageBox.information(self, "Success", message)
@@ -1415,6 +2040,11 @@ class SavingsPage(QWidget):
         else:
             QMessageBox.critical(self, "Error", message)
 
+    def _on_saving_post_failed(self, error: str) -> None:
+        self._post_worker = None
+        self.btn_post.setEnabled(self.current_member_id is not None)
+        QMessageBox.critical(self, "Error", f"Failed to post saving: {error}")
+
     def clear_selection(self) -> None:
         """Clear the active member context and reset UI widgets."""
         self.current_member_id = None
@@ -1425,16 +2055,9 @@ class SavingsPage(QWidget):
         self.combo_type.setEnabled(True)
         self.label_member_name.setText("Name: Not Selected")
         self.label_total_savings.setText("Total Savings: ₦0.00")
-        self.table_savings.setRowCount(0)
+        self.savings_model.set_rows([])
         self.btn_post.setEnabled(False)
 
-    def _format_savings_type(self, trans_type: str) -> str:
-        labels = {
-            "Lodgment": "Deposit (+)",
-            "Deduction": "Withdrawal (-)",
-        }
-        return labels.get(trans_type, trans_type)
-
     def _handle_payment_mode_change(self, mode: str) -> None:
         if mode == "Salary Deduction":
             deposit_index = self.combo_type.findData("Lodgment")
@@ -1448,16 +2071,31 @@ class SavingsPage(QWidget):
 class LoansPage(QWidget):
     """Page for Loans management with eligibility checking, application, and schedule preview."""
     
+    # Loans fetched per page; more are pulled in as the table scrolls
+    LOANS_PAGE_SIZE = 50
+    
+    # Fixed validation messages; the over-limit one is rebuilt per member
+    MSG_PRINCIPAL_OK = "✓ Principal is within eligibility limit"
+    MSG_PRINCIPAL_ZERO = "❌ Principal must be greater than 0"
+    
     def __init__(self, db_path: str = "swiftledger.db"):
         super().__init__()
         self.db_path = db_path
         self.current_member_id = None
         self.current_member_name = None
         self.max_eligible_amount = 0.0
+        self._msg_exceed = ""
         self.total_savings = 0.0
         self.loan_multiplier = 2.0
         self.default_interest_rate = 12.0
         self.default_duration = 24
+        self._submit_worker = None
+        self._loans_worker = None
+        self._loans_loaded = 0
+        self._loans_has_more = False
+        # Bumped whenever the loans list is reset, so pages fetched for an
+        # earlier list are dropped instead of appended
+        self._loans_generation = 0
         
         # Create main layout
         main_layout = QVBoxLayout(self)
@@ -1466,15 +2104,13 @@ class LoansPage(QWidget):
         
         # Title
         title = QLabel("Loan Management")
-        title_font = QFont("Arial", 18)
-        title_font.setBold(True)
+        title_font = cached_font(18, bold=True)
         title.setFont(title_font)
         main_layout.addWidget(title)
         
         # Search Section
         search_group = QGroupBox("Find Member")
-        search_font = QFont("Arial", 10)
-        search_font.setBold(True)
+        search_font = cached_font(10, bold=True)
         search_group.setFont(search_font)
         search_layout = QHBoxLayout()
         
@@ -1494,20 +2130,18 @@ class LoansPage(QWidget):
         
         # Eligibility Section
         eligibility_group = QGroupBox("Eligibility Information")
-        eligibility_font = QFont("Arial", 10)
-        eligibility_font.setBold(True)
+        eligibility_font = cached_font(10, bold=True)
         eligibility_group.setFont(eligibility_font)
         eligibility_layout = QHBoxLayout()
         
         self.label_member_name = QLabel("Member: Not Selected")
-        self.label_member_name.setFont(QFont("Arial", 11))
+        self.label_member_name.setFont(cached_font(11))
         
         self.label_total_savings = QLabel("Total Savings: ₦0.00")
-        self.label_total_savings.setFont(QFont("Arial", 11))
+        self.label_total_savings.setFont(cached_font(11))
         
         self.label_max_eligible = QLabel("Max Eligible Loan: ₦0.00")
-        max_eligible_font = QFont("Arial", 11)
-        max_eligible_font.setBold(True)
+        max_eligible_font = cached_font(11, bold=True)
         self.label_max_eligible.setFont(max_eligible_font)
         
         eligibility_layout.addWidget(self.label_member_name)
@@ -1520,8 +2154,7 @@ class LoansPage(QWidget):
         
         # Loan Application Form
         form_group = QGroupBox("Loan Application")
-        form_font = QFont("Arial", 10)
-        form_font.setBold(True)
+        form_font = cached_font(10, bold=True)
         form_group.setFont(form_font)
         form_layout = QFormLayout()
         
@@ -1559,8 +2192,7 @@ class LoansPage(QWidget):
         
         self.btn_validate = QPushButton("Validate Loan")
         self.btn_validate.setMinimumHeight(40)
-        btn_font = QFont("Arial", 10)
-        btn_font.setBold(True)
+        btn_font = cached_font(10, bold=True)
         self.btn_validate.setFont(btn_font)
         self.btn_validate.clicked.connect(self.validate_loan)
         self.btn_validate.setEnabled(False)
@@ -1578,25 +2210,7 @@ class LoansPage(QWidget):
         self.btn_submit = QPushButton("Submit Loan")
         self.btn_submit.setMinimumHeight(40)
         self.btn_submit.setFont(btn_font)
-        self.btn_submit.setStyleSheet("""
-            QPushButton {
-                background-color: #27ae60;
-                color: white;
-                border: none;
-                border-radius: 5px;
-                padding: 10px;
-            }
-            QPushButton:hover:!disabled {
-                background-color: #2ecc71;
-            }
-            QPushButton:pressed:!disabled {
-                background-color: #229954;
-            }
-            QPushButton:disabled {
-                background-color: #888888;
-                color: #cccccc;
-            }
-        """)
+        self.btn_submit.setObjectName("successBtn")
         self.btn_submit.clicked.connect(self.submit_loan)
         self.btn_submit.setEnabled(False)
         button_layout.addWidget(self.btn_submit)
@@ -1605,24 +2219,27 @@ class LoansPage(QWidget):
         
         # Validation Status Label
         self.label_validation_status = QLabel("")
-        self.label_validation_status.setFont(QFont("Arial", 9))
+        self.label_validation_status.setFont(cached_font(9))
         main_layout.addWidget(self.label_validation_status)
         
         # Active Loans Table
         loans_title = QLabel("Active Loans")
-        loans_font = QFont("Arial", 12)
-        loans_font.setBold(True)
+        loans_font = cached_font(12, bold=True)
         loans_title.setFont(loans_font)
         main_layout.addWidget(loans_title)
         
-        self.table_loans = QTableWidget()
-        self.table_loans.setColumnCount(5)
-        self.table_loans.setHorizontalHeaderLabels([
-            "Loan ID", "Principal", "Interest Rate", "Status", "Date Issued"
-        ])
+        self.loans_model = LoansTableModel(self)
+        self.table_loans = QTableView()
+        self.table_loans.setModel(self.loans_model)
         self.table_loans.setSelectionBehavior(QAbstractItemView.SelectionBehavior.SelectRows)
         self.table_loans.setEditTriggers(QAbstractItemView.EditTrigger.NoEditTriggers)
         self.table_loans.horizontalHeader().setStretchLastSection(True)
+        # Fixed row heights keep painting limited to the visible rows
+        self.table_loans.verticalHeader().setSectionResizeMode(QHeaderView.ResizeMode.Fixed)
+        self.table_loans.verticalHeader().setDefaultSectionSize(24)
+        self.table_loans.setVerticalScrollMode(QAbstractItemView.ScrollMode.ScrollPerPixel)
+        self.table_loans.setHorizontalScrollMode(QAbstractItemView.ScrollMode.ScrollPerPixel)
+        self.table_loans.verticalScrollBar().valueChanged.connect(self._on_loans_scrolled)
         main_layout.addWidget(self.table_loans)
         
         self.setLayout(main_layout)
@@ -1632,7 +2249,7 @@ class LoansPage(QWidget):
     
     def load_system_settings(self) -> None:
         """Load system settings for loan defaults."""
-        ok, settings = get_system_settings(self.db_path)
+        ok, settings = cached_call(get_system_settings, self.db_path, ttl=_SETTINGS_TTL)
         if ok and settings:
             self.loan_multiplier = float(settings.get('loan_multiplier', 2.0))
             self.default_interest_rate = float(settings.get('default_interest_rate', 12.0))
@@ -1648,39 +2265,38 @@ class LoansPage(QWidget):
             QMessageBox.warning(self, "Invalid Input", "Please enter a staff number.")
             return
 
-        success, member = get_member_by_staff_number(self.db_path, staff_number)
+        # Member, savings balance and loans come back from one connection
+        success, lookup = get_member_dashboard(
+            self.db_path, staff_number, loan_limit=self.LOANS_PAGE_SIZE
+        )
 
-        if not success or not member:
+        if not success or not lookup:
             QMessageBox.warning(self, "Not Found", f"No member found with staff number '{staff_number}'.")
             self.current_member_id = None
             self.current_member_name = None
             self.label_member_name.setText("Member: Not Selected")
             self.label_total_savings.setText("Total Savings: ₦0.00")
             self.label_max_eligible.setText("Max Eligible Loan: ₦0.00")
-            self.table_loans.setRowCount(0)
+            self._populate_loans_table([])
             self.btn_validate.setEnabled(False)
             self.btn_preview.setEnabled(False)
             self.btn_submit.setEnabled(False)
             return
         
+        member = lookup['member']
         self.current_member_id = member['member_id']
         self.current_member_name = member['full_name']
-        
-        # Get total savings
-        ok, total_savings = get_total_savings(self.db_path, self.current_member_id)
-        if ok:
-            self.total_savings = total_savings
-        else:
-            self.total_savings = 0.0
+        self.total_savings = lookup['total_savings']
         
         # Update display
         self.max_eligible_amount = self.loan_multiplier * self.total_savings
+        self._msg_exceed = f"❌ Principal exceeds limit (Max: {_MONEY(self.max_eligible_amount)})"
         self.label_member_name.setText(f"Member: {self.current_member_name}")
-        self.label_total_savings.setText(f"Total Savings: ₦{self.total_savings:,.2f}")
-        self.label_max_eligible.setText(f"Max Eligible Loan: ₦{self.max_eligible_amount:,.2f}")
+        self.label_total_savings.setText("Total Savings: " + _MONEY(self.total_savings))
+        self.label_max_eligible.setText("Max Eligible Loan: " + _MONEY(self.max_eligible_amount))
         
-        # Load active loans
-        self.load_active_loans()
+        # Show active loans from the same lookup
+        self._populate_loans_table(lookup['loans'])
         
         # Enable validation and preview buttons
         self.btn_validate.setEnabled(True)
@@ -1698,15 +2314,13 @@ class LoansPage(QWidget):
         
         if principal > self.max_eligible_amount:
             self.btn_submit.setEnabled(False)
-            self.label_validation_status.setText(
-                f"❌ Principal exceeds limit (Max: ₦{self.max_eligible_amount:,.2f})"
-            )
+            self.label_validation_status.setText(self._msg_exceed)
         elif principal <= 0:
             self.btn_submit.setEnabled(False)
-            self.label_validation_status.setText("❌ Principal must be greater than 0")
+            self.label_validation_status.setText(self.MSG_PRINCIPAL_ZERO)
         else:
             self.btn_submit.setEnabled(True)
-            self.label_validation_status.setText(f"✓ Principal is within eligibility limit")
+            self.label_validation_status.setText(self.MSG_PRINCIPAL_OK)
     
     def validate_loan(self) -> None:
         """Explicitly validate the loan application."""
@@ -1724,7 +2338,7 @@ class LoansPage(QWidget):
             QMessageBox.warning(
                 self,
                 "Exceeds Limit",
-                f"Requested principal (₦{principal:,.2f}) exceeds maximum eligibility (₦{self.max_eligible_amount:,.2f})."
+                f"Requested principal ({_MONEY(principal)}) exceeds maximum eligibility ({_MONEY(self.max_eligible_amount)})."
             )
             return
         
@@ -1745,7 +2359,9 @@ class LoansPage(QWidget):
             return
         
         # Calculate schedule
-        schedule = calculate_repayment_schedule(principal, interest_rate, duration)
+        schedule = _cached_schedule(
+            int(round(principal * 100)), int(round(interest_rate * 100)), duration
+        )
         
         # Create preview dialog
         preview_dialog = QDialog(self)
@@ -1755,41 +2371,21 @@ class LoansPage(QWidget):
         layout = QVBoxLayout(preview_dialog)
         
         # Info label
-        info_text = f"Loan: ₦{principal:,.2f} @ {interest_rate}% for {duration} months"
+        info_text = f"Loan: {_MONEY(principal)} @ {interest_rate}% for {duration} months"
         info_label = QLabel(info_text)
-        info_font = QFont("Arial", 11)
-        info_font.setBold(True)
+        info_font = cached_font(11, bold=True)
         info_label.setFont(info_font)
         layout.addWidget(info_label)
         
         # Schedule table
-        table = QTableWidget()
-        table.setColumnCount(5)
-        table.setHorizontalHeaderLabels(["Month", "Principal", "Interest", "Total", "Remaining"])
+        table = QTableView()
+        table.setModel(ScheduleTableModel(schedule, table))
         table.setSelectionBehavior(QAbstractItemView.SelectionBehavior.SelectRows)
         table.setEditTriggers(QAbstractItemView.EditTrigger.NoEditTriggers)
-        
-        for row_idx, month_data in enumerate(schedule):
-            table.insertRow(row_idx)
-            
-            month_item = QTableWidgetItem(str(month_data['month_number']))
-            table.setItem(row_idx, 0, month_item)
-            
-            principal_item = QTableWidgetItem(f"₦{month_data['principal_payment']:,.2f}")
-            principal_item.setTextAlignment(Qt.AlignmentFlag.AlignRight)
-            table.setItem(row_idx, 1, principal_item)
-            
-            interest_item = QTableWidgetItem(f"₦{month_data['interest_payment']:,.2f}")
-            interest_item.setTextAlignment(Qt.AlignmentFlag.AlignRight)
-            table.setItem(row_idx, 2, interest_item)
-            
-            total_item = QTableWidgetItem(f"₦{month_data['total_payment']:,.2f}")
-            total_item.setTextAlignment(Qt.AlignmentFlag.AlignRight)
-            table.setItem(row_idx, 3, total_item)
-            
-            remaining_item = QTableWidgetItem(f"₦{month_data['remaining_balance']:,.2f}")
-            remaining_item.setTextAlignment(Qt.AlignmentFlag.AlignRight)
-            table.setItem(row_idx, 4, remaining_item)
+        table.verticalHeader().setSectionResizeMode(QHeaderView.ResizeMode.Fixed)
+        table.verticalHeader().setDefaultSectionSize(24)
+        table.setVerticalScrollMode(QAbstractItemView.ScrollMode.ScrollPerPixel)
+        table.setHorizontalScrollMode(QAbstractItemView.ScrollMode.ScrollPerPixel)
         
         layout.addWidget(table)
         
@@ -1814,8 +2410,20 @@ class LoansPage(QWidget):
             QMessageBox.warning(self, "Invalid Principal", "Principal must be greater than 0.")
             return
         
-        # Apply for loan
-        success, message = apply_for_loan(self.db_path, self.current_member_id, principal, interest_rate, duration)
+        # Apply for loan on a pool thread; the result comes back via _on_loan_submitted
+        self.btn_submit.setEnabled(False)
+        self.label_validation_status.setText("Submitting loan…")
+        self._submit_worker = run_in_background(
+            apply_for_loan,
+            self.db_path, self.current_member_id, principal, interest_rate, duration,
+            on_finished=self._on_loan_submitted,
+            on_failed=self._on_loan_submit_failed,
+        )
+
+    def _on_loan_submitted(self, result) -> None:
+        """Handle the (success, message) result of a background loan submission."""
+        self._submit_worker = None
+        success, message = result
         
         if success:
             QMessageBox.information(self, "Success", message)
@@ -1828,59 +2436,102 @@ class LoansPage(QWidget):
             # Reset validation status
             self.label_validation_status.setText("")
         else:
+            self.label_validation_status.setText("")
+            self.validate_principal()
             QMessageBox.critical(self, "Error", message)
+
+    def _on_loan_submit_failed(self, error: str) -> None:
+        self._submit_worker = None
+        self.label_validation_status.setText("")
+        self.validate_principal()
+        QMessageBox.critical(self, "Error", f"Failed to submit loan: {error}")
     
     def load_active_loans(self) -> None:
         """Load and display active loans for the current member."""
         if self.current_member_id is None:
-            self.table_loans.setRowCount(0)
+            self._populate_loans_table([])
             return
-        
-        try:
-            success, loans = get_member_loans(self.db_path, self.current_member_id)
-            
-            if not success:
+        self._fetch_loans(append=False)
+
+    def _on_loans_scrolled(self, _value: int) -> None:
+        self._fetch_more_loans_if_at_bottom()
+
+    def _fetch_more_loans_if_at_bottom(self) -> None:
+        """Fetch the next page of loans when the table is scrolled to the bottom.
+
+        A page that does not fill the viewport leaves no scrollbar (maximum 0),
+        which counts as being at the bottom, so short lists keep topping up.
+        """
+        if not self._loans_has_more or self.current_member_id is None:
+            return
+        scroll_bar = self.table_loans.verticalScrollBar()
+        if scroll_bar.value() < scroll_bar.maximum():
+            return
+        if self._loans_worker is not None:
+            # A page is already on its way
+            return
+        self._fetch_loans(append=True)
+
+    def _fetch_loans(self, append: bool) -> None:
+        """Query a page of the current member's loans on a worker thread."""
+        member_id = self.current_member_id
+        if not append:
+            self._loans_generation += 1
+        generation = self._loans_generation
+        offset = self._loans_loaded if append else 0
+        worker = run_in_background(
+            get_member_loans, self.db_path, member_id, self.LOANS_PAGE_SIZE, offset,
+            on_finished=lambda result: self._on_loans_loaded(
+                worker, generation, member_id, append, offset, result
+            ),
+            on_failed=lambda error: self._on_loans_load_failed(worker, generation, error),
+        )
+        self._loans_worker = worker
+
+    def _on_loans_loaded(
+        self, worker, generation: int, member_id: int, append: bool, offset: int, result: tuple
+    ) -> None:
+        if worker is self._loans_worker:
+            self._loans_worker = None
+        if (
+            generation != self._loans_generation
+            or member_id != self.current_member_id
+            or (append and offset != self._loans_loaded)
+        ):
+            # The list was reset (or the member changed) while this page was loading
+            return
+        success, loans = result
+        if not success:
+            if append:
+                self._loans_has_more = False
+            else:
                 QMessageBox.critical(self, "Error", "Failed to load loans.")
-                return
-            
-            # Clear table
-            self.table_loans.setRowCount(0)
-            
-            # Populate table
-            for row_idx, loan in enumerate(loans):
-                self.table_loans.insertRow(row_idx)
-                
-                # Loan ID
-                loan_id_item = QTableWidgetItem(str(loan['loan_id']))
-                self.table_loans.setItem(row_idx, 0, loan_id_item)
-                
-                # Principal
-                principal_item = QTableWidgetItem(f"₦{loan['principal']:,.2f}")
-                principal_item.setTextAlignment(Qt.AlignmentFlag.AlignRight)
-                self.table_loans.setItem(row_idx, 1, principal_item)
-                
-                # Interest Rate
-                rate_item = QTableWidgetItem(f"{loan['interest_rate']:.2f}%")
-                rate_item.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
-                self.table_loans.setItem(row_idx, 2, rate_item)
-                
-                # Status
-                status = loan['status']
-                status_item = QTableWidgetItem(status)
-                if status == 'Active':
-                    status_item.setForeground(Qt.GlobalColor.green)
-                elif status == 'Closed':
-                    status_item.setForeground(Qt.GlobalColor.blue)
-                elif status == 'Default':
-                    status_item.setForeground(Qt.GlobalColor.red)
-                self.table_loans.setItem(row_idx, 3, status_item)
-                
-                # Date Issued
-                date_item = QTableWidgetItem(str(loan['date_issued']))
-                self.table_loans.setItem(row_idx, 4, date_item)
-        
-        except Exception as e:
-            QMessageBox.critical(self, "Error", f"Failed to load loans: {str(e)}")
+            return
+        self._populate_loans_table(loans, append=append)
+
+    def _on_loans_load_failed(self, worker, generation: int, error: str) -> None:
+        if worker is self._loans_worker:
+            self._loans_worker = None
+        if generation != self._loans_generation:
+            return
+        self._loans_has_more = False
+        QMessageBox.critical(self, "Error", f"Failed to load loans: {error}")
+
+    def _populate_loans_table(self, loans: List[Dict], append: bool = False) -> None:
+        """Fill the active loans table from already-fetched loan rows."""
+        if append:
+            self.loans_model.append_rows(loans)
+        else:
+            self.loans_model.set_rows(loans)
+            self._loans_loaded = 0
+            self._loans_generation += 1
+            # Any page still in flight belongs to the old list
+            self._loans_worker = None
+        self._loans_loaded += len(loans)
+        self._loans_has_more = len(loans) >= self.LOANS_PAGE_SIZE
+        if self._loans_has_more:
+            # Check once the view has laid out the new rows and sized its scrollbar
+            QTimer.singleShot(0, self._fetch_more_loans_if_at_bottom)
 
     def clear_selection(self) -> None:
         """Clear the active member context and reset UI widgets."""
@@ -1888,6 +2539,7 @@ class LoansPage(QWidget):
         self.current_member_name = None
         self.total_savings = 0.0
         self.max_eligible_amount = 0.0
+        self._msg_exceed = ""
         self.input_search.clear()
         self.input_principal.setValue(0)
         self.input_interest_rate.setValue(self.default_interest_rate)
@@ -1896,7 +2548,7 @@ class LoansPage(QWidget):
         self.label_total_savings.setText("Total Savings: ₦0.00")
         self.label_max_eligible.setText("Max Eligible Loan: ₦0.00")
         self.label_validation_status.setText("")
-        self.table_loans.setRowCount(0)
+        self._populate_loans_table([])
         self.btn_validate.setEnabled(False)
         self.btn_preview.setEnabled(False)
         self.btn_submit.setEnabled(False)
@@ -1904,12 +2556,207 @@ class LoansPage(QWidget):
 
 class MainWindow(QMainWindow):
     """Main application window for SwiftLedger."""
+
+    # Theme sheets, filled in with the scaled base font size as {fs}
+    _LIGHT_QSS = """
+            QMainWindow, QStackedWidget, QWidget {{
+                background-color: #f5f6fa;
+                color: #2c3e50;
+                font-size: {fs}px;
+            }}
+            QFrame#sidebar {{
+                background-color: #dfe6e9;
+                border-right: 1px solid #b2bec3;
+            }}
+            QLabel {{
+                color: #2c3e50;
+                font-size: {fs}px;
+            }}
+            QLineEdit, QComboBox, QDateEdit, QSpinBox, QDoubleSpinBox {{
+                background-color: #ffffff;
+                color: #2c3e50;
+                border: 1px solid #b2bec3;
+                padding: 5px;
+                border-radius: 3px;
+            }}
+            QTableView {{
+                background-color: #ffffff;
+                color: #2c3e50;
+                gridline-color: #dfe6e9;
+            }}
+            QTableView QHeaderView::section {{
+                background-color: #dfe6e9;
+                color: #2c3e50;
+                padding: 6px;
+                border: 1px solid #b2bec3;
+                font-weight: bold;
+            }}
+            QGroupBox {{
+                border: 1px solid #b2bec3;
+                border-radius: 6px;
+                margin-top: 12px;
+                padding: 14px 10px 10px 10px;
+                color: #2c3e50;
+            }}
+            QGroupBox::title {{
+                subcontrol-origin: margin;
+                left: 12px;
+                padding: 0 4px;
+                color: #636e72;
+            }}
+            QPushButton {{
+                background-color: #dfe6e9;
+                color: #2c3e50;
+                border: 1px solid #b2bec3;
+                border-radius: 4px;
+                padding: 6px 14px;
+            }}
+            QPushButton:hover {{
+                background-color: #b2bec3;
+            }}
+            QPushButton[active="true"] {{
+                background-color: #b2bec3;
+                font-weight: bold;
+            }}
+            QListView {{
+                background-color: #ffffff;
+                color: #2c3e50;
+                border: 1px solid #b2bec3;
+            }}
+            QScrollArea {{
+                background-color: #f5f6fa;
+                border: none;
+            }}
+            QCheckBox, QSlider {{
+                color: #2c3e50;
+            }}
+        """
+
+    # Green call-to-action buttons (Register, Post, Submit Loan) in either theme
+    _SUCCESS_BTN_QSS = """
+            QPushButton#successBtn {
+                background-color: #27ae60;
+                color: white;
+                border: none;
+                border-radius: 5px;
+                padding: 10px;
+            }
+            QPushButton#successBtn:hover:!disabled {
+                background-color: #2ecc71;
+            }
+            QPushButton#successBtn:pressed:!disabled {
+                background-color: #229954;
+            }
+            QPushButton#successBtn:disabled {
+                background-color: #888888;
+                color: #cccccc;
+            }
+        """
+
+    _DARK_QSS = """
+            QMainWindow, QStackedWidget, QWidget {{
+                background-color: #1e1e1e;
+                color: #ecf0f1;
+                font-size: {fs}px;
+            }}
+            QFrame#sidebar {{
+                background-color: #2c3e50;
+                border-right: 1px solid #34495e;
+            }}
+            QLabel {{
+                color: #ffffff;
+                font-size: {fs}px;
+            }}
+            QLineEdit, QComboBox, QDateEdit, QSpinBox, QDoubleSpinBox {{
+                background-color: #333333;
+                color: #ffffff;
+                border: 1px solid #555555;
+                padding: 5px;
+                border-radius: 3px;
+            }}
+            QTableView {{
+                background-color: #252525;
+                color: #ecf0f1;
+                gridline-color: #333333;
+            }}
+            QTableView QHeaderView::section {{
+                background-color: #34495e;
+                color: #ecf0f1;
+                padding: 6px;
+                border: 1px solid #2c3e50;
+                font-weight: bold;
+            }}
+            QGroupBox {{
+                border: 1px solid #34495e;
+                border-radius: 6px;
+                margin-top: 12px;
+                padding: 14px 10px 10px 10px;
+                color: #ecf0f1;
+            }}
+            QGroupBox::title {{
+                subcontrol-origin: margin;
+                left: 12px;
+                padding: 0 4px;
+                color: #bdc3c7;
+            }}
+            QPushButton {{
+                background-color: #34495e;
+                color: #ecf0f1;
+                border: 1px solid #2c3e50;
+                border-radius: 4px;
+                padding: 6px 14px;
+            }}
+            QPushButton:hover {{
+                background-color: #3d566e;
+            }}
+            QPushButton[active="true"] {{
+                background-color: #34495e;
+                border-left: 3px solid #3498db;
+                font-weight: bold;
+            }}
+            QListView {{
+                background-color: #252525;
+                color: #ecf0f1;
+                border: 1px solid #333333;
+            }}
+            QScrollArea {{
+                background-color: #1e1e1e;
+                border: none;
+            }}
+            QCheckBox, QSlider {{
+                color: #ecf0f1;
+            }}
+        """
     
+    # Sidebar entries in stacked-widget order: (label, attribute name)
+    NAV_ITEMS = (
+        ("Dashboard", "btn_dashboard"),
+        ("Members", "btn_members"),
+        ("Savings", "btn_savings"),
+        ("Loans", "btn_loans"),
+        ("Reports", "btn_reports"),
+        ("Audit Logs", "btn_audit"),
+        ("Settings", "btn_settings"),
+        ("About", "btn_about"),
+    )
+    
+    # Seconds between watchdog re-arms while the user keeps typing/clicking
+    LOCK_RESET_INTERVAL = 1.0
+    # Event types that count as user activity for the idle lock
+    _ACTIVITY_EVENTS = frozenset((QEvent.Type.KeyPress, QEvent.Type.MouseButtonPress))
+
     def __init__(self, db_path: str = "swiftledger.db"):
         super().__init__()
         self.db_path = db_path
-        self.last_interaction_time = time.time()
         self.is_locked = False
+        self._lock_timeout_ms = 600_000
+        self._last_lock_reset = 0.0  # time.monotonic() of the last watchdog re-arm
+        self._lock_dialog: Optional[QDialog] = None
+        self._lock_login: Optional[LoginScreen] = None
+        self._base_stylesheet: Optional[str] = None
+        # Theme sheet last installed by apply_stylesheet, and its (theme, scale)
+        self._applied_stylesheet: Optional[str] = None
+        self._visual_settings: Optional[tuple] = None
         self.setWindowTitle("SwiftLedger - Thrift Society Management")
         self.setGeometry(100, 100, 1200, 700)
         
@@ -1940,24 +2787,47 @@ class MainWindow(QMainWindow):
         self._start_watchdog_timer()
 
     def eventFilter(self, obj, event):
-        if event.type() in (QEvent.Type.KeyPress, QEvent.Type.MouseButtonPress):
-            self.last_interaction_time = time.time()
-        return super().eventFilter(obj, event)
+        # Installed application-wide (input reaches the focused child widget or
+        # a dialog, never this window), so keep the common path to one lookup
+        # and never call back into C++ for events it only observes.
+        if event.type() in self._ACTIVITY_EVENTS:
+            # Any real input pushes the lock deadline back; re-arming at most
+            # once per LOCK_RESET_INTERVAL is plenty for a minutes-long timeout
+            if time.monotonic() - self._last_lock_reset >= self.LOCK_RESET_INTERVAL:
+                self._reset_lock_timer()
+        return False
 
     def _start_watchdog_timer(self) -> None:
+        """Arm a single-shot timer that locks the session after the idle timeout."""
         self.watchdog_timer = QTimer(self)
-        self.watchdog_timer.setInterval(5_000)
+        self.watchdog_timer.setSingleShot(True)
         self.watchdog_timer.timeout.connect(self._check_inactivity)
-        self.watchdog_timer.start()
+        self._load_lock_timeout()
+
+    def _load_lock_timeout(self) -> None:
+        # Read timeout from settings (default 10 min)
+        ok, settings = cached_call(get_system_settings, self.db_path, ttl=_SETTINGS_TTL)
+        self._set_lock_timeout(int(settings.get('timeout_minutes', 10)) if ok and settings else 10)
+
+    def _set_lock_timeout(self, minutes: int) -> None:
+        self._lock_timeout_ms = minutes * 60 * 1000
+        self._reset_lock_timer()
+
+    def _on_settings_changed(self, settings: dict) -> None:
+        """Apply saved preferences, re-theming only if the theme or text scale changed."""
+        if (settings.get('theme'), settings.get('text_scale')) != self._visual_settings:
+            self.apply_stylesheet()
+        self._set_lock_timeout(int(settings.get('timeout_minutes', 10)))
+
+    def _reset_lock_timer(self) -> None:
+        if not self.is_locked:
+            self.watchdog_timer.start(self._lock_timeout_ms)
+            self._last_lock_reset = time.monotonic()
 
     def _check_inactivity(self) -> None:
         if self.is_locked:
             return
-        # Read timeout from settings (default 10 min)
-        ok, settings = get_system_settings(self.db_path)
-        timeout = int(settings.get('timeout_minutes', 10)) * 60 if ok and settings else 600
-        if time.time() - self.last_interaction_time > timeout:
-            self.lock_screen()
+        self.lock_screen()
 
     def _clear_sensitive_state(self) -> None:
         if hasattr(self, "savings_page"):
@@ -1969,20 +2839,24 @@ class MainWindow(QMainWindow):
         self.is_locked = True
         self._clear_sensitive_state()
 
-        dialog = QDialog(self)
-        dialog.setWindowTitle("Session Locked")
-        dialog.setModal(True)
-        dialog.setWindowFlag(Qt.WindowType.WindowCloseButtonHint, False)
-        dialog.setFixedSize(420, 360)
-
-        layout = QVBoxLayout(dialog)
-        login = LoginScreen(self.db_path)
-        login.login_successful.connect(dialog.accept)
-        layout.addWidget(login)
+        # Build the lock dialog once and reuse it on later locks
+        if self._lock_dialog is None:
+            self._lock_dialog = QDialog(self)
+            self._lock_dialog.setWindowTitle("Session Locked")
+            self._lock_dialog.setModal(True)
+            self._lock_dialog.setWindowFlag(Qt.WindowType.WindowCloseButtonHint, False)
+            self._lock_dialog.setFixedSize(420, 360)
+
+            layout = QVBoxLayout(self._lock_dialog)
+            self._lock_login = LoginScreen(self.db_path)
+            self._lock_login.login_successful.connect(self._lock_dialog.accept)
+            layout.addWidget(self._lock_login)
+        else:
+            self._lock_login.clear_fields()
 
-        dialog.exec()
-        self.last_interaction_time = time.time()
+        self._lock_dialog.exec()
         self.is_locked = False
+        self._reset_lock_timer()
     
     def create_sidebar(self) -> QFrame:
         """Create the left sidebar with navigation buttons."""
@@ -1997,8 +2871,7 @@ class MainWindow(QMainWindow):
         
         # Title
         title = QLabel("SwiftLedger")
-        title_font = QFont("Arial", 14)
-        title_font.setBold(True)
+        title_font = cached_font(14, bold=True)
         title.setFont(title_font)
         title.setAlignment(Qt.AlignmentFlag.AlignCenter)
         layout.addWidget(title)
@@ -2009,71 +2882,77 @@ class MainWindow(QMainWindow):
         layout.addWidget(separator)
         
         # Navigation buttons
-        self.btn_dashboard = QPushButton("Dashboard")
-        self.btn_members = QPushButton("Members")
-        self.btn_savings = QPushButton("Savings")
-        self.btn_loans = QPushButton("Loans")
-        self.btn_reports = QPushButton("Reports")
-        self.btn_audit = QPushButton("Audit Logs")
-        self.btn_settings = QPushButton("Settings")
-        self.btn_about = QPushButton("About")
-        
-        buttons = [
-            self.btn_dashboard,
-            self.btn_members,
-            self.btn_savings,
-            self.btn_loans,
-            self.btn_reports,
-            self.btn_audit,
-            self.btn_settings,
-            self.btn_about,
-        ]
-        
-        for i, button in enumerate(buttons):
+        # One button group routes every click to navigate_to_page by id
+        self._nav_group = QButtonGroup(self)
+        self._nav_group.idClicked.connect(self.navigate_to_page)
+        self._nav_buttons: List[QPushButton] = []
+        self._active_nav_index: Optional[int] = None
+        for i, (label, attr) in enumerate(self.NAV_ITEMS):
+            button = QPushButton(label)
             button.setMinimumHeight(45)
-            button.setFont(QFont("Arial", 10))
+            button.setFont(cached_font(10))
             button.setCursor(Qt.CursorShape.PointingHandCursor)
-            button.clicked.connect(lambda checked, idx=i: self.navigate_to_page(idx))
+            self._nav_group.addButton(button, i)
             layout.addWidget(button)
+            setattr(self, attr, button)
+            self._nav_buttons.append(button)
         
         # Add stretch to push buttons to the top
         layout.addStretch()
         
         return sidebar
     
+    # Pages other than the dashboard are built the first time they are shown:
+    # stacked-widget index -> (attribute name, page class)
+    _LAZY_PAGES = {
+        1: ("members_page", MembersPage),
+        2: ("savings_page", SavingsPage),
+        3: ("loans_page", LoansPage),
+        4: ("reports_page", ReportsPage),
+        5: ("audit_page", AuditLogPage),
+        6: ("settings_page", SettingsPage),
+        7: ("about_page", AboutPage),
+    }
+
     def create_pages(self) -> None:
-        """Create all pages and add them to the stacked widget."""
+        """Create the dashboard and reserve a placeholder slot for every other page."""
         
         self.dashboard_page = DashboardPage(self.db_path)
-        self.members_page = MembersPage(self.db_path)
-        self.savings_page = SavingsPage(self.db_path)
-        self.loans_page = LoansPage(self.db_path)
-        self.reports_page = ReportsPage(self.db_path)
-        # Link chart widget to reports page for PDF embedding
-        self.reports_page.set_monthly_chart(self.dashboard_page.monthly_chart)
-
-        self.audit_page = AuditLogPage(self.db_path)
-        self.settings_page = SettingsPage(self.db_path)
-        self.about_page = AboutPage(self.db_path)
-
-        # Connect settings signal for live theme/scale updates
-        self.settings_page.settings_changed.connect(self.apply_stylesheet)
-        
         self.stacked_widget.addWidget(self.dashboard_page)   # 0
-        self.stacked_widget.addWidget(self.members_page)     # 1
-        self.stacked_widget.addWidget(self.savings_page)     # 2
-        self.stacked_widget.addWidget(self.loans_page)       # 3
-        self.stacked_widget.addWidget(self.reports_page)     # 4
-        self.stacked_widget.addWidget(self.audit_page)       # 5
-        self.stacked_widget.addWidget(self.settings_page)    # 6
-        self.stacked_widget.addWidget(self.about_page)       # 7
+        for _ in self._LAZY_PAGES:
+            self.stacked_widget.addWidget(QWidget())         # 1..7, see _ensure_page
         
         # Set default page
         self.stacked_widget.setCurrentIndex(0)
         self.dashboard_page.refresh_dashboard()
+
+    def _ensure_page(self, page_index: int) -> None:
+        """Swap the placeholder at *page_index* for the real page on first visit."""
+        entry = self._LAZY_PAGES.get(page_index)
+        if entry is None or hasattr(self, entry[0]):
+            return
+        attr, page_cls = entry
+        page = page_cls(self.db_path)
+        setattr(self, attr, page)
+
+        if attr == "reports_page":
+            # Link chart widget to reports page for PDF embedding
+            page.set_monthly_chart(self.dashboard_page.monthly_chart)
+        elif attr == "settings_page":
+            # Connect settings signal for live theme/scale and lock timeout updates
+            page.settings_changed.connect(self._on_settings_changed)
+
+        placeholder = self.stacked_widget.widget(page_index)
+        self.stacked_widget.removeWidget(placeholder)
+        placeholder.deleteLater()
+        self.stacked_widget.insertWidget(page_index, page)
     
     def navigate_to_page(self, page_index: int) -> None:
         """Navigate to a specific page in the stacked widget."""
+        if page_index == self.stacked_widget.currentIndex():
+            # Re-clicking the open page would only repeat its refresh queries
+            return
+        self._ensure_page(page_index)
         self.stacked_widget.setCurrentIndex(page_index)
         self.update_button_styles(page_index)
         # Auto-refresh certain pages on navigation
@@ -2085,179 +2964,51 @@ class MainWindow(QMainWindow):
     def update_button_styles(self, active_index: int) -> None:
         """Update button styles to highlight the active button."""
         
-        buttons = [
-            self.btn_dashboard,
-            self.btn_members,
-            self.btn_savings,
-            self.btn_loans,
-            self.btn_reports,
-            self.btn_audit,
-            self.btn_settings,
-            self.btn_about,
-        ]
-        
-        for i, button in enumerate(buttons):
-            if i == active_index:
-                button.setProperty("active", True)
-            else:
-                button.setProperty("active", False)
-            
-            # Re-apply stylesheet to update the button
+        previous = self._active_nav_index
+        if active_index == previous:
+            return
+        self._active_nav_index = active_index
+
+        # Only the old and new active buttons change, so only they are re-polished
+        changed = [(active_index, True)]
+        if previous is not None:
+            changed.append((previous, False))
+        for i, active in changed:
+            button = self._nav_buttons[i]
+            button.setProperty("active", active)
+            # Re-evaluate the [active="true"] rule for this button only
             button.style().unpolish(button)
             button.style().polish(button)
     
     def apply_stylesheet(self) -> None:
         """Apply the theme (dark or light) and text scaling from settings."""
-        ok, settings = get_system_settings(self.db_path)
+        ok, settings = cached_call(get_system_settings, self.db_path, ttl=_SETTINGS_TTL)
         theme = "dark"
         text_scale = 1.0
         if ok and settings:
             theme = str(settings.get("theme", "dark")).lower()
             text_scale = float(settings.get("text_scale", 1.0))
 
+        self._visual_settings = (theme, text_scale)
         base_font_size = max(10, int(14 * text_scale))
 
-        if theme == "light":
-            stylesheet = f"""
-                QMainWindow, QStackedWidget, QWidget {{
-                    background-color: #f5f6fa;
-                    color: #2c3e50;
-                    font-size: {base_font_size}px;
-                }}
-                QFrame#sidebar {{
-                    background-color: #dfe6e9;
-                    border-right: 1px solid #b2bec3;
-                }}
-                QLabel {{
-                    color: #2c3e50;
-                    font-size: {base_font_size}px;
-                }}
-                QLineEdit, QComboBox, QDateEdit, QSpinBox, QDoubleSpinBox {{
-                    background-color: #ffffff;
-                    color: #2c3e50;
-                    border: 1px solid #b2bec3;
-                    padding: 5px;
-                    border-radius: 3px;
-                }}
-                QTableWidget {{
-                    background-color: #ffffff;
-                    color: #2c3e50;
-                    gridline-color: #dfe6e9;
-                }}
-                QTableWidget QHeaderView::section {{
-                    background-color: #dfe6e9;
-                    color: #2c3e50;
-                    padding: 6px;
-                    border: 1px solid #b2bec3;
-                    font-weight: bold;
-                }}
-                QGroupBox {{
-                    border: 1px solid #b2bec3;
-                    border-radius: 6px;
-                    margin-top: 12px;
-                    padding: 14px 10px 10px 10px;
-                    color: #2c3e50;
-                }}
-                QGroupBox::title {{
-                    subcontrol-origin: margin;
-                    left: 12px;
-                    padding: 0 4px;
-                    color: #636e72;
-                }}
-                QPushButton {{
-                    background-color: #dfe6e9;
-                    color: #2c3e50;
-                    border: 1px solid #b2bec3;
-                    border-radius: 4px;
-                    padding: 6px 14px;
-                }}
-                QPushButton:hover {{
-                    background-color: #b2bec3;
-                }}
-                QListWidget {{
-                    background-color: #ffffff;
-                    color: #2c3e50;
-                    border: 1px solid #b2bec3;
-                }}
-                QScrollArea {{
-                    background-color: #f5f6fa;
-                    border: none;
-                }}
-                QCheckBox, QSlider {{
-                    color: #2c3e50;
-                }}
-            """
-        else:
-            stylesheet = f"""
-                QMainWindow, QStackedWidget, QWidget {{
-                    background-color: #1e1e1e;
-                    color: #ecf0f1;
-                    font-size: {base_font_size}px;
-                }}
-                QFrame#sidebar {{
-                    background-color: #2c3e50;
-                    border-right: 1px solid #34495e;
-                }}
-                QLabel {{
-                    color: #ffffff;
-                    font-size: {base_font_size}px;
-                }}
-                QLineEdit, QComboBox, QDateEdit, QSpinBox, QDoubleSpinBox {{
-                    background-color: #333333;
-                    color: #ffffff;
-                    border: 1px solid #555555;
-                    padding: 5px;
-                    border-radius: 3px;
-                }}
-                QTableWidget {{
-                    background-color: #252525;
-                    color: #ecf0f1;
-                    gridline-color: #333333;
-                }}
-                QTableWidget QHeaderView::section {{
-                    background-color: #34495e;
-                    color: #ecf0f1;
-                    padding: 6px;
-                    border: 1px solid #2c3e50;
-                    font-weight: bold;
-                }}
-                QGroupBox {{
-                    border: 1px solid #34495e;
-                    border-radius: 6px;
-                    margin-top: 12px;
-                    padding: 14px 10px 10px 10px;
-                    color: #ecf0f1;
-                }}
-                QGroupBox::title {{
-                    subcontrol-origin: margin;
-                    left: 12px;
-                    padding: 0 4px;
-                    color: #bdc3c7;
-                }}
-                QPushButton {{
-                    background-color: #34495e;
-                    color: #ecf0f1;
-                    border: 1px solid #2c3e50;
-                    border-radius: 4px;
-                    padding: 6px 14px;
-                }}
-                QPushButton:hover {{
-                    background-color: #3d566e;
-                }}
-                QListWidget {{
-                    background-color: #252525;
-                    color: #ecf0f1;
-                    border: 1px solid #333333;
-                }}
-                QScrollArea {{
-                    background-color: #1e1e1e;
-                    border: none;
-                }}
-                QCheckBox, QSlider {{
-                    color: #ecf0f1;
-                }}
-            """
-        self.setStyleSheet(stylesheet)
+        template = self._LIGHT_QSS if theme == "light" else self._DARK_QSS
+        stylesheet = template.format(fs=base_font_size) + self._SUCCESS_BTN_QSS
+        if stylesheet == self._applied_stylesheet:
+            # settings_changed often fires with the theme untouched; skip the re-parse
+            return
+        self._applied_stylesheet = stylesheet
+
+        # Install on the application rather than the window so a theme change
+        # is a single style recomputation; the base QSS loaded in main.py is
+        # kept in front so its rules still apply.
+        app = QApplication.instance()
+        if app is None:
+            self.setStyleSheet(stylesheet)
+            return
+        if self._base_stylesheet is None:
+            self._base_stylesheet = app.styleSheet()
+        app.setStyleSheet(self._base_stylesheet + stylesheet)
 
 
 if __name__ == "__main__":
@@ -25,15 +25,17 @@ from PySide6.QtWidgets import (
     QFileDialog,
 )
 from PySide6.QtCore import Qt
-from PySide6.QtGui import QFont
 
-sys.path.insert(0, str(Path(__file__).parent.parent))
+_PROJECT_ROOT = str(Path(__file__).parent.parent)
+if _PROJECT_ROOT not in sys.path:
+    sys.path.insert(0, _PROJECT_ROOT)
 from database.queries import (
     get_system_settings, get_member_by_staff_number,
     get_member_savings, get_member_loans, get_society_stats,
     get_all_members,
 )
 from database.db_init import log_event
+from ui.fonts import cached_font
 
 
 class ReportsPage(QWidget):
@@ -58,14 +60,12 @@ class ReportsPage(QWidget):
 
         # Title
         title = QLabel("Reports")
-        tf = QFont("Arial", 18)
-        tf.setBold(True)
-        title.setFont(tf)
+        title.setFont(cached_font(18, bold=True))
         main.addWidget(title)
 
         # ── Member Ledger ────────────────────────────────────────────
         ledger_group = QGroupBox("Member Statement")
-        ledger_group.setFont(QFont("Arial", 12))
+        ledger_group.setFont(cached_font(12))
         ledger_form = QFormLayout(ledger_group)
         ledger_form.setContentsMargins(14, 20, 14, 14)
         ledger_form.setSpacing(12)
@@ -103,7 +103,7 @@ class ReportsPage(QWidget):
 
         # ── Society Summary ──────────────────────────────────────────
         summary_group = QGroupBox("Society Financial Summary")
-        summary_group.setFont(QFont("Arial", 12))
+        summary_group.setFont(cached_font(12))
         summary_layout = QVBoxLayout(summary_group)
         summary_layout.setContentsMargins(14, 20, 14, 14)
 
@@ -4,6 +4,7 @@ Lets the user toggle charts, alerts, theme, text scale, auto-lock timeout.
 """
 
 import sys
+from contextlib import contextmanager
 from pathlib import Path
 
 from PySide6.QtWidgets import (
@@ -12,30 +13,71 @@ from PySide6.QtWidgets import (
     QSpinBox, QComboBox, QScrollArea, QFrame, QLineEdit,
 )
 from PySide6.QtCore import Qt, Signal
-from PySide6.QtGui import QFont
 
-sys.path.insert(0, str(Path(__file__).parent.parent))
+_PROJECT_ROOT = str(Path(__file__).parent.parent)
+if _PROJECT_ROOT not in sys.path:
+    sys.path.insert(0, _PROJECT_ROOT)
 from database.db_init import save_settings, log_event
-from database.queries import get_system_settings
-from security import hash_credential
+from database.queries import cached_call, get_system_settings
+from security import hash_credential, verify_credential
+from ui.fonts import cached_font
+
+# Credential field hints per security mode: (new, confirm, fields enabled)
+_SECURITY_PLACEHOLDERS = {
+    "pin": ("4-6 digit PIN", "Re-enter PIN", True),
+    "password": ("New password (min 6 chars)", "Re-enter password", True),
+    "system_auth": ("Not required for System Auth", "Not required for System Auth", False),
+}
+
+_SAVED_LOG_FMT = (
+    "Preferences updated (theme={theme}, scale={text_scale}, "
+    "charts={show_charts}, alerts={show_alerts}, timeout={timeout_minutes}, "
+    "security_mode={security_mode})"
+)
+
+
+@contextmanager
+def _blocked(*widgets):
+    """Silence the widgets' signals for the duration of the block."""
+    for widget in widgets:
+        widget.blockSignals(True)
+    try:
+        yield
+    finally:
+        for widget in widgets:
+            widget.blockSignals(False)
 
 
 class SettingsPage(QWidget):
     """Preferences panel — theme, text scale, charts, alerts, timeout."""
 
-    # Emitted after the user clicks Apply so MainWindow can re-theme live
-    settings_changed = Signal()
+    # Emitted after the user clicks Apply so MainWindow can re-theme live;
+    # carries the saved preferences (never the credential hash)
+    settings_changed = Signal(dict)
+
+    # Saved settings are reused across page loads; any write to the
+    # database invalidates the cached copy straight away
+    SETTINGS_CACHE_TTL = 60.0
+
+    APPLY_QSS = (
+        "QPushButton#applyBtn { background-color: #2980b9; color: white; "
+        "border-radius: 6px; padding: 8px 20px; } "
+        "QPushButton#applyBtn:hover { background-color: #3498db; }"
+    )
 
     def __init__(self, db_path: str = "swiftledger.db"):
         super().__init__()
         self.db_path = db_path
         self.current_auth_hash = ""
+        # Last preferences written to (or read from) the database
+        self._saved_data = None
         self._build_ui()
         self._load_current_settings()
 
     # ── UI ───────────────────────────────────────────────────────────
 
     def _build_ui(self) -> None:
+        self.setStyleSheet(self.APPLY_QSS)
         outer = QVBoxLayout(self)
         outer.setContentsMargins(0, 0, 0, 0)
 
@@ -50,14 +92,12 @@ class SettingsPage(QWidget):
 
         # Title
         title = QLabel("Settings")
-        tf = QFont("Arial", 18)
-        tf.setBold(True)
-        title.setFont(tf)
+        title.setFont(cached_font(18, bold=True))
         main.addWidget(title)
 
         # ── Appearance group ────────────────────────────────────────
         appear_group = QGroupBox("Appearance")
-        appear_group.setFont(QFont("Arial", 12))
+        appear_group.setFont(cached_font(12))
         appear_form = QFormLayout(appear_group)
         appear_form.setContentsMargins(14, 20, 14, 14)
         appear_form.setSpacing(16)
@@ -65,7 +105,7 @@ class SettingsPage(QWidget):
         # Theme
         self.combo_theme = QComboBox()
         self.combo_theme.addItems(["Dark", "Light"])
-        self.combo_theme.setFont(QFont("Arial", 11))
+        self.combo_theme.setFont(cached_font(11))
         appear_form.addRow("Theme:", self.combo_theme)
 
         # Text scale
@@ -87,24 +127,24 @@ class SettingsPage(QWidget):
 
         # ── Feature Toggles group ───────────────────────────────────
         toggle_group = QGroupBox("Feature Toggles")
-        toggle_group.setFont(QFont("Arial", 12))
+        toggle_group.setFont(cached_font(12))
         toggle_form = QFormLayout(toggle_group)
         toggle_form.setContentsMargins(14, 20, 14, 14)
         toggle_form.setSpacing(16)
 
         self.chk_charts = QCheckBox("Show Financial Charts on Dashboard")
-        self.chk_charts.setFont(QFont("Arial", 11))
+        self.chk_charts.setFont(cached_font(11))
         toggle_form.addRow(self.chk_charts)
 
         self.chk_alerts = QCheckBox("Show Automated Loan Alerts on Dashboard")
-        self.chk_alerts.setFont(QFont("Arial", 11))
+        self.chk_alerts.setFont(cached_font(11))
         toggle_form.addRow(self.chk_alerts)
 
         main.addWidget(toggle_group)
 
         # ── Security group ──────────────────────────────────────────
         sec_group = QGroupBox("Security")
-        sec_group.setFont(QFont("Arial", 12))
+        sec_group.setFont(cached_font(12))
         sec_form = QFormLayout(sec_group)
         sec_form.setContentsMargins(14, 20, 14, 14)
         sec_form.setSpacing(16)
@@ -112,7 +152,7 @@ class SettingsPage(QWidget):
         # Security mode
         self.combo_security_mode = QComboBox()
         self.combo_security_mode.addItems(["PIN", "Password", "System Auth"])
-        self.combo_security_mode.setFont(QFont("Arial", 11))
+        self.combo_security_mode.setFont(cached_font(11))
         self.combo_security_mode.currentTextChanged.connect(self._sync_security_placeholders)
         sec_form.addRow("Security Mode:", self.combo_security_mode)
 
@@ -133,13 +173,16 @@ class SettingsPage(QWidget):
         self.slider_timeout.setValue(10)
         self.slider_timeout.setTickInterval(5)
         self.slider_timeout.setTickPosition(QSlider.TickPosition.TicksBelow)
-        self.slider_timeout.valueChanged.connect(self._sync_timeout_display)
 
         self.spin_timeout = QSpinBox()
         self.spin_timeout.setRange(1, 60)
         self.spin_timeout.setValue(10)
         self.spin_timeout.setSuffix(" min")
-        self.spin_timeout.valueChanged.connect(self._sync_timeout_slider)
+
+        # Keep the two in step with direct widget-to-widget connections;
+        # setValue does not re-emit when the value is unchanged
+        self.slider_timeout.valueChanged.connect(self.spin_timeout.setValue)
+        self.spin_timeout.valueChanged.connect(self.slider_timeout.setValue)
 
         timeout_row.addWidget(self.slider_timeout)
         timeout_row.addWidget(self.spin_timeout)
@@ -152,16 +195,10 @@ class SettingsPage(QWidget):
         btn_row.addStretch()
 
         self.btn_apply = QPushButton("Apply")
+        self.btn_apply.setObjectName("applyBtn")
         self.btn_apply.setMinimumHeight(40)
         self.btn_apply.setMinimumWidth(140)
-        bf = QFont("Arial", 11)
-        bf.setBold(True)
-        self.btn_apply.setFont(bf)
-        self.btn_apply.setStyleSheet(
-            "QPushButton { background-color: #2980b9; color: white; "
-            "border-radius: 6px; padding: 8px 20px; } "
-            "QPushButton:hover { background-color: #3498db; }"
-        )
+        self.btn_apply.setFont(cached_font(11, bold=True))
         self.btn_apply.clicked.connect(self._apply_settings)
         btn_row.addWidget(self.btn_apply)
 
@@ -175,118 +212,123 @@ class SettingsPage(QWidget):
     def _sync_scale_display(self, value: int) -> None:
         self.lbl_scale.setText(f"{value} %")
 
-    def _sync_timeout_display(self, value: int) -> None:
-        self.spin_timeout.blockSignals(True)
-        self.spin_timeout.setValue(value)
-        self.spin_timeout.blockSignals(False)
-
-    def _sync_timeout_slider(self, value: int) -> None:
-        self.slider_timeout.blockSignals(True)
-        self.slider_timeout.setValue(value)
-        self.slider_timeout.blockSignals(False)
-
     def _sync_security_placeholders(self) -> None:
         mode = self.combo_security_mode.currentText().lower().replace(" ", "_")
-        if mode == "pin":
-            self.input_new_credential.setPlaceholderText("4-6 digit PIN")
-            self.input_confirm_credential.setPlaceholderText("Re-enter PIN")
-            self.input_new_credential.setEnabled(True)
-            self.input_confirm_credential.setEnabled(True)
-        elif mode == "password":
-            self.input_new_credential.setPlaceholderText("New password (min 6 chars)")
-            self.input_confirm_credential.setPlaceholderText("Re-enter password")
-            self.input_new_credential.setEnabled(True)
-            self.input_confirm_credential.setEnabled(True)
-        else:
-            self.input_new_credential.setPlaceholderText("Not required for System Auth")
-            self.input_confirm_credential.setPlaceholderText("Not required for System Auth")
-            self.input_new_credential.setEnabled(False)
-            self.input_confirm_credential.setEnabled(False)
+        new_hint, confirm_hint, enabled = _SECURITY_PLACEHOLDERS.get(
+            mode, _SECURITY_PLACEHOLDERS["system_auth"]
+        )
+        self.input_new_credential.setPlaceholderText(new_hint)
+        self.input_confirm_credential.setPlaceholderText(confirm_hint)
+        self.input_new_credential.setEnabled(enabled)
+        self.input_confirm_credential.setEnabled(enabled)
 
     # ── Load / Save ──────────────────────────────────────────────────
 
     def _load_current_settings(self) -> None:
-        ok, settings = get_system_settings(self.db_path)
+        ok, settings = cached_call(
+            get_system_settings, self.db_path, ttl=self.SETTINGS_CACHE_TTL
+        )
         if not ok or not settings:
             return
 
-        self.chk_charts.setChecked(bool(settings.get('show_charts', 0)))
-        self.chk_alerts.setChecked(bool(settings.get('show_alerts', 1)))
-
-        theme = str(settings.get('theme', 'dark')).capitalize()
-        idx = self.combo_theme.findText(theme)
-        if idx >= 0:
-            self.combo_theme.setCurrentIndex(idx)
-
-        scale_pct = int(float(settings.get('text_scale', 1.0)) * 100)
-        self.slider_scale.setValue(max(80, min(150, scale_pct)))
-        self.lbl_scale.setText(f"{self.slider_scale.value()} %")
-
-        timeout = int(settings.get('timeout_minutes', 10))
-        self.slider_timeout.setValue(timeout)
-        self.spin_timeout.setValue(timeout)
-
-        self.current_auth_hash = str(settings.get("auth_hash") or "")
-        mode = str(settings.get("security_mode") or "pin").lower().replace(" ", "_")
-        mode_label = "System Auth" if mode == "system_auth" else mode.capitalize()
-        idx = self.combo_security_mode.findText(mode_label)
-        if idx >= 0:
-            self.combo_security_mode.setCurrentIndex(idx)
+        # Populate quietly, then run the display syncs once at the end
+        with _blocked(
+            self.chk_charts, self.chk_alerts, self.combo_theme,
+            self.slider_scale, self.slider_timeout, self.spin_timeout,
+            self.combo_security_mode,
+        ):
+            self.chk_charts.setChecked(bool(settings.get('show_charts', 0)))
+            self.chk_alerts.setChecked(bool(settings.get('show_alerts', 1)))
+
+            theme = str(settings.get('theme', 'dark')).capitalize()
+            idx = self.combo_theme.findText(theme)
+            if idx >= 0:
+                self.combo_theme.setCurrentIndex(idx)
+
+            scale_pct = int(float(settings.get('text_scale', 1.0)) * 100)
+            self.slider_scale.setValue(max(80, min(150, scale_pct)))
+
+            timeout = int(settings.get('timeout_minutes', 10))
+            self.slider_timeout.setValue(timeout)
+            self.spin_timeout.setValue(timeout)
+
+            self.current_auth_hash = str(settings.get("auth_hash") or "")
+            mode = str(settings.get("security_mode") or "pin").lower().replace(" ", "_")
+            mode_label = "System Auth" if mode == "system_auth" else mode.capitalize()
+            idx = self.combo_security_mode.findText(mode_label)
+            if idx >= 0:
+                self.combo_security_mode.setCurrentIndex(idx)
+
+        self._sync_scale_display(self.slider_scale.value())
         self._sync_security_placeholders()
+        self._saved_data = self._collect_settings()
+
+    def _collect_settings(self) -> dict:
+        """Read the preferences currently shown in the form."""
+        return {
+            'show_charts': 1 if self.chk_charts.isChecked() else 0,
+            'show_alerts': 1 if self.chk_alerts.isChecked() else 0,
+            'theme': self.combo_theme.currentText().lower(),
+            'text_scale': round(self.slider_scale.value() / 100.0, 2),
+            'timeout_minutes': self.spin_timeout.value(),
+            'security_mode': self.combo_security_mode.currentText().lower().replace(" ", "_"),
+        }
 
     def _apply_settings(self) -> None:
         mode = self.combo_security_mode.currentText().lower().replace(" ", "_")
         new_cred = self.input_new_credential.text().strip()
         confirm = self.input_confirm_credential.text().strip()
+        warn = QMessageBox.warning
 
         # Validate credential change if provided or required
         if mode in ("pin", "password"):
             if not self.current_auth_hash and not new_cred:
-                QMessageBox.warning(
+                warn(
                     self, "Credential Required",
                     "Please set a credential for the selected security mode."
                 )
                 return
             if new_cred or confirm:
                 if new_cred != confirm:
-                    QMessageBox.warning(self, "Mismatch", "Credential confirmation does not match.")
+                    warn(self, "Mismatch", "Credential confirmation does not match.")
                     return
                 if mode == "pin":
                     if not new_cred.isdigit() or not (4 <= len(new_cred) <= 6):
-                        QMessageBox.warning(self, "Invalid PIN", "PIN must be 4-6 digits.")
+                        warn(self, "Invalid PIN", "PIN must be 4-6 digits.")
                         return
                 if mode == "password":
                     if len(new_cred) < 6:
-                        QMessageBox.warning(self, "Weak Password", "Password must be at least 6 characters.")
+                        warn(self, "Weak Password", "Password must be at least 6 characters.")
                         return
 
-        data = {
-            'show_charts': 1 if self.chk_charts.isChecked() else 0,
-            'show_alerts': 1 if self.chk_alerts.isChecked() else 0,
-            'theme': self.combo_theme.currentText().lower(),
-            'text_scale': round(self.slider_scale.value() / 100.0, 2),
-            'timeout_minutes': self.spin_timeout.value(),
-            'security_mode': mode,
-        }
+        data = self._collect_settings()
+        if not new_cred and data == self._saved_data:
+            # Nothing changed since the last save: skip the write and audit entry
+            QMessageBox.information(self, "Saved", "Settings are already up to date.")
+            return
 
         if new_cred and mode in ("pin", "password"):
-            data['auth_hash'] = hash_credential(new_cred)
+            if self.current_auth_hash and verify_credential(new_cred, self.current_auth_hash):
+                # Re-entered the saved credential: keep the stored hash as is
+                data['auth_hash'] = self.current_auth_hash
+            else:
+                data['auth_hash'] = hash_credential(new_cred)
 
         try:
             save_settings(data, self.db_path)
+            if 'auth_hash' in data:
+                self.current_auth_hash = data['auth_hash']
+            self._saved_data = {
+                key: value for key, value in data.items() if key != 'auth_hash'
+            }
             log_event(
                 user="Admin",
                 category="Settings",
-                description=(
-                    f"Preferences updated (theme={data['theme']}, "
-                    f"scale={data['text_scale']}, charts={data['show_charts']}, "
-                    f"alerts={data['show_alerts']}, timeout={data['timeout_minutes']}, "
-                    f"security_mode={data['security_mode']})"
-                ),
+                description=_SAVED_LOG_FMT.format_map(data),
                 status="Success",
                 db_path=self.db_path,
             )
-            self.settings_changed.emit()
+            self.settings_changed.emit(dict(self._saved_data))
             QMessageBox.information(self, "Saved", "Settings applied successfully.")
         except Exception as e:
             log_event(
@@ -10,18 +10,22 @@ from pathlib import Path
 from typing import cast, Any
 
 from PySide6.QtWidgets import (
-    QWizard, QWizardPage, QVBoxLayout, QHBoxLayout, QLabel, QLineEdit,
-    QComboBox, QMessageBox, QDialog, QStyle
+    QWizard, QWizardPage, QWidget, QVBoxLayout, QLabel, QLineEdit,
+    QComboBox, QMessageBox, QStyle
 )
-from PySide6.QtCore import Qt
-from PySide6.QtGui import QFont
+from PySide6.QtCore import Qt, Signal, QRegularExpression
+from PySide6.QtGui import QRegularExpressionValidator
 
 # Add parent directory to path for imports
-sys.path.insert(0, str(Path(__file__).parent.parent))
+_PROJECT_ROOT = str(Path(__file__).parent.parent)
+if _PROJECT_ROOT not in sys.path:
+    sys.path.insert(0, _PROJECT_ROOT)
 
 from database.db_init import init_db, save_settings, log_event
 from security import hash_credential
 from ui.reports_page import generate_and_open_user_guide
+from ui.fonts import cached_system_font
+from ui.workers import run_in_background
 
 
 # ──────────────────────────────────────────────────────────────────────────────
@@ -43,10 +47,7 @@ class WelcomePage(QWizardPage):
 
         # Main welcome message
         welcome_label = QLabel("Welcome to SwiftLedger")
-        welcome_font = QFont()
-        welcome_font.setPointSize(24)
-        welcome_font.setBold(True)
-        welcome_label.setFont(welcome_font)
+        welcome_label.setFont(cached_system_font(24, bold=True))
         welcome_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
         layout.addWidget(welcome_label)
 
@@ -64,10 +65,7 @@ class WelcomePage(QWizardPage):
 
         # Footer with developer credit
         footer = QLabel("Designed and Developed by Zabdiel")
-        footer_font = QFont()
-        footer_font.setPointSize(10)
-        footer_font.setItalic(True)
-        footer.setFont(footer_font)
+        footer.setFont(cached_system_font(10, italic=True))
         footer.setAlignment(Qt.AlignmentFlag.AlignCenter)
         layout.addWidget(footer)
 
@@ -86,75 +84,47 @@ class IdentityPage(QWizardPage):
         self.setSubTitle("Enter your organization's details")
         self._build_ui()
 
+    # (settings key, input attribute, label, placeholder), in display order
+    FIELDS = (
+        ("society_name", "society_input", "Society Name:", "e.g., Main Street Savings Society"),
+        ("street", "street_input", "Street:", "e.g., 123 Main Street"),
+        ("city_state", "city_input", "City/State:", "e.g., New York, NY"),
+        ("phone", "phone_input", "Phone:", "e.g., +1 (555) 123-4567"),
+        ("email", "email_input", "Email:", "e.g., contact@society.com"),
+        ("reg_no", "reg_input", "Registration Number:", "e.g., REG-2024-001"),
+    )
+
+    # (input attribute, name shown in the warning) for fields that must be filled
+    REQUIRED = (
+        ("society_input", "Society Name"),
+        ("phone_input", "Phone"),
+        ("email_input", "Email"),
+    )
+
     def _build_ui(self) -> None:
         layout = QVBoxLayout(self)
 
-        # Society Name
-        society_label = QLabel("Society Name:")
-        self.society_input = QLineEdit()
-        self.society_input.setPlaceholderText("e.g., Main Street Savings Society")
-        layout.addWidget(society_label)
-        layout.addWidget(self.society_input)
-
-        # Street
-        street_label = QLabel("Street:")
-        self.street_input = QLineEdit()
-        self.street_input.setPlaceholderText("e.g., 123 Main Street")
-        layout.addWidget(street_label)
-        layout.addWidget(self.street_input)
-
-        # City/State
-        city_label = QLabel("City/State:")
-        self.city_input = QLineEdit()
-        self.city_input.setPlaceholderText("e.g., New York, NY")
-        layout.addWidget(city_label)
-        layout.addWidget(self.city_input)
-
-        # Phone
-        phone_label = QLabel("Phone:")
-        self.phone_input = QLineEdit()
-        self.phone_input.setPlaceholderText("e.g., +1 (555) 123-4567")
-        layout.addWidget(phone_label)
-        layout.addWidget(self.phone_input)
-
-        # Email
-        email_label = QLabel("Email:")
-        self.email_input = QLineEdit()
-        self.email_input.setPlaceholderText("e.g., contact@society.com")
-        layout.addWidget(email_label)
-        layout.addWidget(self.email_input)
-
-        # Registration Number
-        reg_label = QLabel("Registration Number:")
-        self.reg_input = QLineEdit()
-        self.reg_input.setPlaceholderText("e.g., REG-2024-001")
-        layout.addWidget(reg_label)
-        layout.addWidget(self.reg_input)
+        for _key, attr, label, placeholder in self.FIELDS:
+            line_edit = QLineEdit()
+            line_edit.setPlaceholderText(placeholder)
+            setattr(self, attr, line_edit)
+            layout.addWidget(QLabel(label))
+            layout.addWidget(line_edit)
 
         layout.addStretch()
 
     def get_data(self) -> dict:
         """Return form data as a dictionary."""
-        return {
-            "society_name": self.society_input.text(),
-            "street": self.street_input.text(),
-            "city_state": self.city_input.text(),
-            "phone": self.phone_input.text(),
-            "email": self.email_input.text(),
-            "reg_no": self.reg_input.text(),
-        }
+        return {key: getattr(self, attr).text() for key, attr, _label, _ph in self.FIELDS}
 
     def validatePage(self) -> bool:
         """Validate that required fields are filled."""
-        data = self.get_data()
-        required_fields = ["society_name", "phone", "email"]
-        
-        for field in required_fields:
-            if not data[field].strip():
+        for attr, name in self.REQUIRED:
+            if not getattr(self, attr).text().strip():
                 QMessageBox.warning(
                     self,
                     "Missing Information",
-                    f"Please enter a valid {field.replace('_', ' ').title()}."
+                    f"Please enter a valid {name}."
                 )
                 return False
         return True
@@ -179,8 +149,7 @@ class SecurityPage(QWizardPage):
 
         # Security mode selection
         mode_label = QLabel("Security Mode:")
-        mode_font = QFont()
-        mode_font.setBold(True)
+        mode_font = cached_system_font(bold=True)
         mode_label.setFont(mode_font)
         layout.addWidget(mode_label)
 
@@ -195,24 +164,30 @@ class SecurityPage(QWizardPage):
 
         layout.addSpacing(20)
 
-        # Credential input (hidden for System Auth)
+        # Credential inputs share one container so they hide/show together
+        self._cred_box = QWidget()
+        cred_layout = QVBoxLayout(self._cred_box)
+        cred_layout.setContentsMargins(0, 0, 0, 0)
+
         self.credential_label = QLabel("Enter your PIN/Password:")
         self.credential_label.setFont(mode_font)
-        layout.addWidget(self.credential_label)
+        cred_layout.addWidget(self.credential_label)
 
         self.credential_input = QLineEdit()
         self.credential_input.setEchoMode(QLineEdit.EchoMode.Password)
         self.credential_input.setPlaceholderText("Leave empty for System Authentication")
-        layout.addWidget(self.credential_input)
+        cred_layout.addWidget(self.credential_input)
 
         # Confirm credential
         self.confirm_label = QLabel("Confirm PIN/Password:")
         self.confirm_label.setFont(mode_font)
-        layout.addWidget(self.confirm_label)
+        cred_layout.addWidget(self.confirm_label)
 
         self.confirm_input = QLineEdit()
         self.confirm_input.setEchoMode(QLineEdit.EchoMode.Password)
-        layout.addWidget(self.confirm_input)
+        cred_layout.addWidget(self.confirm_input)
+        layout.addWidget(self._cred_box)
+        self._pin_validator = QRegularExpressionValidator(QRegularExpression(r"\d{0,6}"), self)
 
         # Info message
         info_label = QLabel(
@@ -230,12 +205,14 @@ class SecurityPage(QWizardPage):
 
     def _on_mode_changed(self) -> None:
         """Update visibility of credential fields based on selected mode."""
-        is_system_auth = "System Authentication" in self.mode_combo.currentText()
-        
-        self.credential_label.setVisible(not is_system_auth)
-        self.credential_input.setVisible(not is_system_auth)
-        self.confirm_label.setVisible(not is_system_auth)
-        self.confirm_input.setVisible(not is_system_auth)
+        mode_text = self.mode_combo.currentText()
+        is_system_auth = "System Authentication" in mode_text
+        self._cred_box.setVisible(not is_system_auth)
+
+        # PIN mode: the inputs only accept up to six digits as they are typed
+        validator = self._pin_validator if "PIN" in mode_text else None
+        for line_edit in (self.credential_input, self.confirm_input):
+            line_edit.setValidator(validator)
 
     def get_security_mode(self) -> str:
         """Return the selected security mode."""
@@ -283,6 +260,7 @@ class SecurityPage(QWizardPage):
             return False
 
         if mode == "PIN":
+            # Text typed before switching to PIN bypassed the validator
             if not credential.isdigit() or not (4 <= len(credential) <= 6):
                 QMessageBox.warning(
                     self,
@@ -302,6 +280,19 @@ class SecurityPage(QWizardPage):
 class FinalizePage(QWizardPage):
     """Final confirmation and system initialization."""
 
+    SUMMARY_TMPL = (
+        "<b>Organization Information:</b><br>"
+        "Society Name: {society_name}<br>"
+        "Street: {street}<br>"
+        "City/State: {city_state}<br>"
+        "Phone: {phone}<br>"
+        "Email: {email}<br>"
+        "Registration No: {reg_no}<br>"
+        "<br>"
+        "<b>Security:</b><br>"
+        "Mode: {security_mode}"
+    )
+
     def __init__(self):
         super().__init__()
         self.setTitle("Initialization Complete")
@@ -313,10 +304,7 @@ class FinalizePage(QWizardPage):
         layout = QVBoxLayout(self)
 
         summary_label = QLabel("Summary of Settings")
-        summary_font = QFont()
-        summary_font.setPointSize(12)
-        summary_font.setBold(True)
-        summary_label.setFont(summary_font)
+        summary_label.setFont(cached_system_font(12, bold=True))
         layout.addWidget(summary_label)
 
         # Summary text area
@@ -341,19 +329,9 @@ class FinalizePage(QWizardPage):
         identity_data = wizard.identity_page.get_data()
         security_mode = wizard.security_page.get_security_mode()
 
-        summary = f"""
-        <b>Organization Information:</b><br>
-        Society Name: {identity_data['society_name']}<br>
-        Street: {identity_data['street']}<br>
-        City/State: {identity_data['city_state']}<br>
-        Phone: {identity_data['phone']}<br>
-        Email: {identity_data['email']}<br>
-        Registration No: {identity_data['reg_no']}<br>
-        <br>
-        <b>Security:</b><br>
-        Mode: {security_mode}
-        """
-        self.summary_text.setText(summary)
+        self.summary_text.setText(
+            self.SUMMARY_TMPL.format_map(dict(identity_data, security_mode=security_mode))
+        )
 
 
 # ──────────────────────────────────────────────────────────────────────────────
@@ -361,9 +339,37 @@ class FinalizePage(QWizardPage):
 # ──────────────────────────────────────────────────────────────────────────────
 
 
+def _finalize_setup(db_path: str, settings_data: dict, credential: str) -> dict:
+    """Initialise the database and store the wizard's settings (worker thread)."""
+    # Hash credential if provided
+    if credential:
+        settings_data = dict(settings_data, auth_hash=hash_credential(credential))
+
+    # Schema, settings row and audit entry share one connection and one commit
+    db_conn = init_db(db_path)
+    try:
+        save_settings(settings_data, db_path, conn=db_conn)
+        log_event(
+            user="Admin",
+            category="Security",
+            description="Initial system setup completed",
+            status="Success",
+            db_path=db_path,
+            conn=db_conn,
+        )
+        db_conn.commit()
+    finally:
+        db_conn.close()
+    return settings_data
+
+
+
 class FirstRunWizard(QWizard):
     """Multi-step wizard for SwiftLedger initial setup."""
 
+    # Emitted once the settings have been written and it is safe to log in
+    setup_completed = Signal()
+
     def __init__(self, parent=None, db_path: str = "swiftledger.db"):
         super().__init__(parent)
         self.db_path = db_path
@@ -385,77 +391,90 @@ class FirstRunWizard(QWizard):
         self.addPage(self.security_page)
         self.addPage(self.finalize_page)
 
-        # Connect finish signal
-        self.finished.connect(self._on_wizard_finished)
+        # Set while the settings are being saved in the background
+        self._finalize_worker = None
 
-    def _on_wizard_finished(self) -> None:
-        """Handle wizard completion: save settings, log event, and launch dashboard."""
-        if self.result() != QDialog.DialogCode.Accepted:
+    def accept(self) -> None:
+        """Handle Finish: save settings in the background, then close and launch."""
+        if self._finalize_worker is not None:
             return
 
-        try:
-            # Initialize database
-            db_conn = init_db(self.db_path)
-            db_conn.close()
-
-            # Collect form data
-            identity_data = self.identity_page.get_data()
-            security_mode = self.security_page.get_security_mode()
-            credential = self.security_page.get_credential()
-
-            # Prepare settings dictionary
-            settings_data = {
-                "society_name": identity_data["society_name"],
-                "street": identity_data["street"],
-                "city_state": identity_data["city_state"],
-                "phone": identity_data["phone"],
-                "email": identity_data["email"],
-                "reg_no": identity_data["reg_no"],
-                "security_mode": security_mode,
-            }
-
-            # Hash credential if provided
-            if credential:
-                settings_data["auth_hash"] = hash_credential(credential)
-
-            # Save settings to database
-            save_settings(settings_data, self.db_path)
-
-            # Log the initialization event
-            log_event(
-                user="Admin",
-                category="Security",
-                description="Initial system setup completed",
-                status="Success",
-                db_path=self.db_path
-            )
+        # Collect form data on the GUI thread
+        identity_data = self.identity_page.get_data()
+        settings_data = {
+            "society_name": identity_data["society_name"],
+            "street": identity_data["street"],
+            "city_state": identity_data["city_state"],
+            "phone": identity_data["phone"],
+            "email": identity_data["email"],
+            "reg_no": identity_data["reg_no"],
+            "security_mode": self.security_page.get_security_mode(),
+        }
+        credential = self.security_page.get_credential()
+
+        # Keep the wizard on screen but busy until the worker reports back
+        self._set_busy(True)
+        self._finalize_worker = run_in_background(
+            _finalize_setup, self.db_path, settings_data, credential,
+            on_finished=self._on_setup_saved,
+            on_failed=self._on_setup_failed,
+        )
 
-            # Generate and auto-open the Quick Start Manual
-            try:
-                generate_and_open_user_guide(settings_data)
-            except Exception:
-                pass  # Non-critical; don't block setup completion
+    def reject(self) -> None:
+        # Closing mid-save would leave the worker reporting to a hidden dialog
+        if self._finalize_worker is not None:
+            return
+        super().reject()
+
+    def _set_busy(self, busy: bool) -> None:
+        for which in (
+            QWizard.WizardButton.BackButton,
+            QWizard.WizardButton.FinishButton,
+            QWizard.WizardButton.CancelButton,
+        ):
+            self.button(which).setEnabled(not busy)
+        if busy:
+            self.setCursor(Qt.CursorShape.WaitCursor)
+        else:
+            self.unsetCursor()
 
-            # Show success message
-            QMessageBox.information(
-                self,
-                "Setup Complete",
-                "SwiftLedger has been initialized successfully!\n"
-                "Your Quick Start Manual has been opened.\n"
-                "You can now launch the main application."
-            )
+    def _on_setup_saved(self, settings_data: dict) -> None:
+        self._finalize_worker = None
+        self._set_busy(False)
 
-            # Emit signal to parent to launch dashboard
-            parent = self.parent()
-            if parent is not None and hasattr(parent, 'launch_dashboard'):
-                cast(Any, parent).launch_dashboard()
+        # Generate and auto-open the Quick Start Manual; opening the viewer
+        # must happen on the GUI thread
+        try:
+            generate_and_open_user_guide(settings_data)
+        except Exception:
+            pass  # Non-critical; don't block setup completion
+
+        QMessageBox.information(
+            self,
+            "Setup Complete",
+            "SwiftLedger has been initialized successfully!\n"
+            "Your Quick Start Manual has been opened.\n"
+            "You can now launch the main application."
+        )
 
-        except Exception as e:
-            QMessageBox.critical(
-                self,
-                "Initialization Error",
-                f"An error occurred during setup:\n{str(e)}"
-            )
+        # Emit signal to parent to launch dashboard
+        parent = self.parent()
+        if parent is not None and hasattr(parent, 'launch_dashboard'):
+            cast(Any, parent).launch_dashboard()
+
+        # Let the host show its next window before this one closes, so the
+        # application never runs without a visible window
+        self.setup_completed.emit()
+        super().accept()
+
+    def _on_setup_failed(self, error: str) -> None:
+        self._finalize_worker = None
+        self._set_busy(False)
+        QMessageBox.critical(
+            self,
+            "Initialization Error",
+            f"An error occurred during setup:\n{error}"
+        )
 
 
 if __name__ == "__main__":
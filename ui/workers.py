@@ -0,0 +1,64 @@
+"""
+Background workers for SwiftLedger.
+Runs blocking database helpers on the global QThreadPool and hands the
+result back to the GUI thread through Qt signals.
+"""
+
+from typing import Any, Callable, Optional
+
+from PySide6.QtCore import QObject, QRunnable, QThreadPool, Qt, Signal
+
+from database.db_init import close_thread_connection
+
+
+class WorkerSignals(QObject):
+    """Signals for a QueryWorker; slots on GUI objects receive them queued."""
+
+    finished = Signal(object)
+    failed = Signal(str)
+
+
+class QueryWorker(QRunnable):
+    """Run ``fn(*args, **kwargs)`` on a pool thread and emit its return value."""
+
+    def __init__(self, fn: Callable[..., Any], *args: Any, **kwargs: Any):
+        super().__init__()
+        self.fn = fn
+        self.args = args
+        self.kwargs = kwargs
+        self.signals = WorkerSignals()
+
+    def run(self) -> None:
+        try:
+            result = self.fn(*self.args, **self.kwargs)
+        except Exception as e:
+            self.signals.failed.emit(str(e))
+            return
+        finally:
+            # Pool threads come and go; don't leave their SQLite handles open
+            close_thread_connection()
+        self.signals.finished.emit(result)
+
+
+def run_in_background(
+    fn: Callable[..., Any],
+    *args: Any,
+    on_finished: Optional[Callable[[Any], None]] = None,
+    on_failed: Optional[Callable[[str], None]] = None,
+    **kwargs: Any,
+) -> QueryWorker:
+    """
+    Start *fn* on the global thread pool.
+
+    The callbacks are always queued to the GUI thread's event loop, even
+    when they are plain functions or lambdas with no thread affinity of their
+    own. The caller should keep the returned worker referenced until it
+    finishes so its signals object is not garbage-collected mid-flight.
+    """
+    worker = QueryWorker(fn, *args, **kwargs)
+    if on_finished is not None:
+        worker.signals.finished.connect(on_finished, Qt.ConnectionType.QueuedConnection)
+    if on_failed is not None:
+        worker.signals.failed.connect(on_failed, Qt.ConnectionType.QueuedConnection)
+    QThreadPool.globalInstance().start(worker)
+    return worker
@@ -19,8 +19,6 @@ import sys
 import shutil
 import subprocess
 import time
-import tkinter as tk
-from tkinter import messagebox
 from pathlib import Path
 
 # ---------------------------------------------------------------------------
@@ -34,14 +32,70 @@ else:
 APP_EXE = INSTALL_DIR / "SwiftLedger_v1.0.exe"
 ASSETS_DIR = INSTALL_DIR / "assets"
 DB_FILE = INSTALL_DIR / "swiftledger.db"
+# SQLite WAL sidecars; they can hold committed data not yet in DB_FILE
+DB_SIDECARS = (INSTALL_DIR / "swiftledger.db-wal", INSTALL_DIR / "swiftledger.db-shm")
 UNINSTALLER = Path(sys.executable) if getattr(sys, "frozen", False) else Path(__file__).resolve()
 
 
+# ---------------------------------------------------------------------------
+# Dialogs — native MessageBoxW on Windows, tkinter only as a fallback
+# ---------------------------------------------------------------------------
+_MB_ICONWARNING = 0x30
+_MB_ICONINFORMATION = 0x40
+_MB_YESNO_QUESTION = 0x04 | 0x20
+_IDYES = 6
+
+
+def _message_box(title: str, text: str, style: int) -> int:
+    if sys.platform == "win32":
+        import ctypes
+        return ctypes.windll.user32.MessageBoxW(None, text, title, style)  # type: ignore[attr-defined]
+
+    # Non-Windows (e.g. running the script from source): a hidden tk root
+    import tkinter as tk
+    from tkinter import messagebox
+
+    root = tk.Tk()
+    root.withdraw()
+    try:
+        if style == _MB_YESNO_QUESTION:
+            return _IDYES if messagebox.askyesno(title, text) else 0
+        if style == _MB_ICONWARNING:
+            messagebox.showwarning(title, text)
+        else:
+            messagebox.showinfo(title, text)
+        return 0
+    finally:
+        root.destroy()
+
+
+def _ask(title: str, text: str) -> bool:
+    return _message_box(title, text, _MB_YESNO_QUESTION) == _IDYES
+
+
+def _info(title: str, text: str) -> None:
+    _message_box(title, text, _MB_ICONINFORMATION)
+
+
+def _warn(title: str, text: str) -> None:
+    _message_box(title, text, _MB_ICONWARNING)
+
+
 # ---------------------------------------------------------------------------
 # 1. Process management — kill running SwiftLedger instances
 # ---------------------------------------------------------------------------
 def terminate_swiftledger() -> None:
     """Find and kill any running SwiftLedger_v1.0.exe processes."""
+    if sys.platform == "win32":
+        # taskkill matches the image name itself; 0 = killed, 128 = none running
+        result = subprocess.run(
+            ["taskkill", "/F", "/IM", "SwiftLedger_v1.0.exe"],
+            capture_output=True,
+            creationflags=subprocess.CREATE_NO_WINDOW,  # type: ignore[attr-defined]
+        )
+        if result.returncode in (0, 128):
+            return
+
     try:
         import psutil
     except ImportError:
@@ -49,7 +103,7 @@ def terminate_swiftledger() -> None:
         os.system('taskkill /F /IM "SwiftLedger_v1.0.exe" 2>nul')
         return
 
-    target = "SwiftLedger_v1.0.exe".lower()
+    target = "swiftledger_v1.0.exe"
     for proc in psutil.process_iter(["pid", "name"]):
         try:
             if (proc.info["name"] or "").lower() == target:
@@ -59,6 +113,43 @@ def terminate_swiftledger() -> None:
             pass
 
 
+def _wait_released(path: Path, timeout: float = 1.0) -> bool:
+    """Poll until *path* can be opened for writing (or is gone), up to *timeout* seconds."""
+    deadline = time.monotonic() + timeout
+    delay = 0.02
+    while True:
+        try:
+            with open(path, "r+b"):
+                return True
+        except FileNotFoundError:
+            return True
+        except PermissionError:
+            pass
+        if time.monotonic() >= deadline:
+            return False
+        time.sleep(delay)
+        delay = min(delay * 2, 0.1)
+
+
+def _unlink_when_released(path: Path, timeout: float = 1.0) -> None:
+    """Delete *path*, retrying with backoff while another process still holds it.
+
+    SQLite opens its files with read/write sharing, so an open() probe would
+    succeed even while the app is alive; only the delete itself tells.
+    """
+    deadline = time.monotonic() + timeout
+    delay = 0.02
+    while True:
+        try:
+            path.unlink(missing_ok=True)
+            return
+        except PermissionError:
+            if time.monotonic() >= deadline:
+                raise
+        time.sleep(delay)
+        delay = min(delay * 2, 0.1)
+
+
 # ---------------------------------------------------------------------------
 # 2. Self-deletion trick
 # ---------------------------------------------------------------------------
@@ -87,67 +178,61 @@ def schedule_self_delete() -> None:
 # Main uninstall flow
 # ---------------------------------------------------------------------------
 def main() -> None:
-    # Hide the default tkinter root window
-    root = tk.Tk()
-    root.withdraw()
-
     # ── Confirmation dialog ──────────────────────────────────────────
-    proceed = messagebox.askyesno(
+    proceed = _ask(
         "SwiftLedger Uninstaller",
         "Are you sure you want to remove SwiftLedger?",
     )
     if not proceed:
-        root.destroy()
         sys.exit(0)
 
     # ── Data-protection dialog ───────────────────────────────────────
-    delete_db = messagebox.askyesno(
+    delete_db = _ask(
         "SwiftLedger Uninstaller",
         "Do you want to PERMANENTLY delete your society records (swiftledger.db)?",
     )
 
     # ── Terminate running instances ──────────────────────────────────
     terminate_swiftledger()
-    time.sleep(1)  # brief pause to let file handles release
+    _wait_released(APP_EXE)  # let the killed process drop its file handles
 
     # ── Deletion logic ───────────────────────────────────────────────
     errors: list[str] = []
 
-    # Delete assets/ folder
-    if ASSETS_DIR.is_dir():
-        try:
-            shutil.rmtree(ASSETS_DIR)
-        except Exception as exc:
-            errors.append(f"assets/: {exc}")
+    # Delete assets/ folder (just try it; a missing folder is not an error)
+    try:
+        shutil.rmtree(ASSETS_DIR)
+    except FileNotFoundError:
+        pass
+    except Exception as exc:
+        errors.append(f"assets/: {exc}")
 
     # Delete the main executable
-    if APP_EXE.is_file():
-        try:
-            APP_EXE.unlink()
-        except Exception as exc:
-            errors.append(f"SwiftLedger_v1.0.exe: {exc}")
+    try:
+        APP_EXE.unlink(missing_ok=True)
+    except Exception as exc:
+        errors.append(f"SwiftLedger_v1.0.exe: {exc}")
 
     # Optionally delete the database
-    if delete_db and DB_FILE.is_file():
-        try:
-            DB_FILE.unlink()
-        except Exception as exc:
-            errors.append(f"swiftledger.db: {exc}")
+    if delete_db:
+        for db_path in (DB_FILE, *DB_SIDECARS):
+            try:
+                _unlink_when_released(db_path)
+            except Exception as exc:
+                errors.append(f"{db_path.name}: {exc}")
 
     # ── Final message ────────────────────────────────────────────────
     if errors:
-        messagebox.showwarning(
+        _warn(
             "SwiftLedger Uninstaller",
             "Uninstallation completed with warnings:\n\n" + "\n".join(errors),
         )
     else:
-        messagebox.showinfo(
+        _info(
             "SwiftLedger Uninstaller",
             "Uninstallation Successful!\n\nSwiftLedger has been removed from your system.",
         )
 
-    root.destroy()
-
     # ── Self-deletion ────────────────────────────────────────────────
     schedule_self_delete()
     sys.exit(0)
@@ -7,8 +7,17 @@ source and when the application is bundled into a PyInstaller executable.
 
 import os
 import sys
+from functools import lru_cache
 
+# PyInstaller stores the extraction folder in sys._MEIPASS; either way the
+# base directory is fixed for the life of the process
+if getattr(sys, "_MEIPASS", None):
+    _BASE_PATH = sys._MEIPASS  # type: ignore[attr-defined]
+else:
+    _BASE_PATH = os.path.dirname(os.path.abspath(__file__))
 
+
+@lru_cache(maxsize=256)
 def get_asset_path(relative_path: str) -> str:
     """Return the absolute path to a bundled asset.
 
@@ -24,10 +33,4 @@ def get_asset_path(relative_path: str) -> str:
     Returns:
         The absolute filesystem path to the requested resource.
     """
-    # PyInstaller stores the extraction folder in sys._MEIPASS
-    if getattr(sys, "_MEIPASS", None):
-        base_path = sys._MEIPASS  # type: ignore[attr-defined]
-    else:
-        base_path = os.path.dirname(os.path.abspath(__file__))
-
-    return os.path.join(base_path, relative_path)
+    return os.path.join(_BASE_PATH, relative_path)